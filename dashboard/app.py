@@ -8,13 +8,19 @@ Demonstrates Palantir Foundry-style control tower capabilities.
 import streamlit as st
 import pandas as pd
 import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import networkx as nx
+import plotly.io as pio
 import numpy as np
 import sys
 import os
+import functools
+import heapq
+import hashlib
+import pickle
+import threading
+import time
+from pathlib import Path
 from datetime import datetime
+from types import SimpleNamespace
 import logging
 
 # Add src to path for imports
@@ -24,7 +30,7 @@ from data_loader import Neo4jConnection
 from simulator import SupplyChainSimulator
 from analytics import SupplyChainAnalytics
 from graph_builder import SupplyChainGraphBuilder
-from utils import setup_logging, get_config
+from utils import setup_logging, get_config, Timer
 
 # Page configuration
 st.set_page_config(
@@ -37,6 +43,87 @@ st.set_page_config(
 # Setup logging
 logger = setup_logging()
 
+# Pages rendered from the shared overview bundle (metrics, insights, benchmark)
+METRIC_PAGES = {'overview', 'analytics', 'network_explorer'}
+
+# Bump to invalidate on-disk loader caches after a change to their data shape
+DISK_CACHE_VERSION = 2
+
+# Sidebar navigation labels and their page slugs
+PAGES = {
+    "🏠 Overview": 'overview',
+    "📊 Analytics": 'analytics',
+    "🎯 Simulation": 'simulation',
+    "📈 Risk Analysis": 'risk_analysis',
+    "🔍 Network Explorer": 'network_explorer'
+}
+
+# Simulation sidebar scenario labels and their scenario types
+SCENARIO_OPTIONS = {
+    "Supplier Delay": "supplier_delay",
+    "Supplier Outage": "supplier_outage",
+    "Regulatory Hold": "regulatory_hold",
+    "Cold Chain Hold": "cold_chain_hold",
+    "Lot Recall Trace": "lot_recall_trace"
+}
+
+# Network explorer node colors by node_type
+NODE_TYPE_COLORS = {
+    'supplier': '#87CEEB',
+    'sla_rule': '#FFD700',
+    'product': '#90EE90',
+    'lot': '#DA70D6',
+    'shipment': '#DDA0DD',
+    'cold_chain_reading': '#1E90FF',
+    'warehouse': '#FFA500',
+    'lane': '#20B2AA',
+    'customer': '#F08080',
+    'cost': '#FFC0CB',
+    'event': '#DC143C'
+}
+OTHER_NODE_COLOR = '#808080'
+IMPACTED_NODE_COLOR = '#DC143C'
+
+# streamlit-agraph draws with an SVG/canvas layout that slows down on large
+# graphs; above this many nodes the network explorer uses the Plotly WebGL figure
+AGRAPH_MAX_NODES = 500
+# Highest-degree nodes that get a visible label in the agraph view (impacted nodes
+# are always labelled); every node keeps its hover title
+AGRAPH_LABELED_NODES = 25
+
+# Risk category colors shared by the overview and risk analysis charts
+RISK_COLOR_MAP = {'Low': '#00c851', 'Medium': '#ffa500', 'High': '#ff4b4b'}
+
+# Risk factor columns plus the overall score, in correlation heatmap order
+RISK_CORR_COLS = ('reliability_risk', 'lead_time_risk', 'volume_risk', 'dependency_risk', 'overall_risk_score')
+
+# Scenario result table columns: source record fields and their display headers
+REGIONAL_COLS_SRC = ['region', 'baseline_sla', 'new_sla', 'delta_sla', 'late_orders',
+                     'late_orders_without_recovery', 'expedite_cost', 'shipments']
+REGIONAL_COLS_OUT = ('Region', 'Baseline SLA (%)', 'New SLA (%)', 'Δ SLA (pp)', 'Late Orders',
+                     'Late (No Recovery)', 'Expedite Cost ($)', '# Shipments')
+IMPACTED_COLS_SRC = ['shipment_id', 'supplier_id', 'product_id', 'product_name', 'warehouse_id',
+                     'warehouse_region', 'quantity', 'current_lead_time', 'delayed_lead_time',
+                     'promised_days', 'expedited', 'expedite_cost']
+IMPACTED_COLS_OUT = ('Shipment', 'Supplier', 'Product', 'Product Name', 'Warehouse',
+                     'Region', 'Quantity', 'Baseline Lead (days)', 'Delayed Lead (days)',
+                     'Promised SLA (days)', 'Expedited', 'Expedite Cost ($)')
+REGIONAL_DTYPES = {'late_orders': 'int32', 'late_orders_without_recovery': 'int32',
+                   'expedite_cost': 'float32', 'shipments': 'int32'}
+IMPACTED_DTYPES = {'quantity': 'int32', 'current_lead_time': 'float32', 'delayed_lead_time': 'float32',
+                   'promised_days': 'float32', 'expedite_cost': 'float32'}
+RISK_FLOAT_COLS = ['overall_risk_score', 'reliability_score', 'total_value', 'avg_lead_time_days',
+                   'reliability_risk', 'lead_time_risk', 'volume_risk', 'dependency_risk']
+RISK_INT_COLS = ['products_supplied', 'downstream_impact']
+BREACH_COLS_SRC = ['product_id', 'product_name', 'delayed_quantity', 'safety_stock', 'breach_units']
+BREACH_COLS_OUT = ('Product', 'Product Name', 'delayed_quantity', 'safety_stock', 'breach_units')
+COLD_CHAIN_COLS_SRC = ['shipment_id', 'max_temp', 'min_temp', 'reading_count', 'max_excursion_minutes']
+COLD_CHAIN_COLS_OUT = ('Shipment', 'Max Temp (°C)', 'Min Temp (°C)', '# Readings', 'Max Excursion (min)')
+LANE_COLS_SRC = ['supplier_id', 'warehouse_id', 'total_quantity',
+                 'late_orders_without_recovery', 'late_orders_after_mitigation']
+LANE_COLS_OUT = ('Supplier', 'Warehouse', 'Quantity (units)',
+                 'Late (No Recovery)', 'Late (Post-Mitigation)')
+
 # Custom CSS for better styling
 st.markdown("""
 <style>
@@ -49,9 +136,6 @@ st.markdown("""
     .risk-high { color: #ff4b4b; }
     .risk-medium { color: #ffa500; }
     .risk-low { color: #00c851; }
-    .alert-high { background-color: #ffebee; }
-    .alert-medium { background-color: #fff3e0; }
-    .alert-low { background-color: #e8f5e8; }
 </style>
 """, unsafe_allow_html=True)
 
@@ -68,6 +152,7 @@ def initialize_applications(_force_refresh=False):
         simulator = SupplyChainSimulator(neo4j_conn)
         analytics = SupplyChainAnalytics(neo4j_conn)
         logger.info(f"Applications initialized - Cold chain data: {len(simulator.cold_chain_df)} rows")
+        start_cache_warmup(analytics, simulator.graph_builder)
         return simulator, analytics, neo4j_conn
     except Exception as e:
         st.error(f"Failed to initialize applications: {str(e)}")
@@ -75,32 +160,741 @@ def initialize_applications(_force_refresh=False):
         return None, None, None
 
 
-@st.cache_data(ttl=300)  # Cache for 5 minutes
-def load_dashboard_metrics():
-    """Load dashboard metrics with caching."""
+@st.cache_resource
+def start_cache_warmup(_analytics, _graph_builder):
+    """Start the cache warm-up thread, once per process.
+
+    The app script re-executes on every rerun, so a module-level flag would not
+    persist; cache_resource runs this body a single time per server process, even
+    though initialize_applications itself re-runs every 60 seconds.
+    """
+    thread = threading.Thread(
+        target=warm_startup_caches, args=(_analytics, _graph_builder),
+        name='cache-warmup', daemon=True
+    )
+    thread.start()
+    return thread
+
+
+def analytics_cache_key(analytics):
+    """Disk cache key for analytics results, tied to the data they were computed from.
+
+    Digests the analytics graph including node and edge properties, so reloaded
+    data with new statuses or volumes gets a fresh entry rather than reusing one
+    that is merely younger than the disk TTL.
+    """
+    if analytics.graph is None:
+        return None
+    content = f"{DISK_CACHE_VERSION}:{graph_content_digest(analytics.graph, include_data=True)}"
+    return hashlib.blake2b(content.encode('utf-8'), digest_size=8).hexdigest()
+
+
+def overview_bundle_cache_path(analytics):
+    """Disk cache entry for the overview bundle."""
+    return disk_cache_path('overview_bundle', '.pkl', key=analytics_cache_key(analytics))
+
+
+def warm_startup_caches(analytics, graph_builder):
+    """Precompute the overview bundle and graph statistics off the script thread.
+
+    Fills the overview bundle and graph statistics disk entries that the page
+    loaders read, so the first visit to a metric page or the network explorer does
+    not stall on the computation; entries that are still fresh are left alone.
+    Runs without a script context, so it only touches plain caches, never st.*
+    calls.
+    """
     try:
-        _, analytics, _ = initialize_applications()
-        if analytics:
-            return analytics.get_performance_dashboard_metrics()
-        return {}
+        with Timer("Warming startup caches"):
+            bundle_path = overview_bundle_cache_path(analytics)
+            if disk_cache_load(bundle_path, max_age=get_config()['cache']['disk_ttl_seconds']) is None:
+                disk_cache_store(bundle_path, analytics.get_overview_bundle())
+            if graph_builder.graph is not None:
+                cache_path = disk_cache_path('graph_stats', '.pkl', key=graph_content_digest(graph_builder.graph))
+                if disk_cache_load(cache_path) is None:
+                    disk_cache_store(cache_path, graph_builder.get_graph_statistics())
+    except Exception as e:
+        logger.warning(f"Cache warm-up failed: {str(e)}")
+
+
+def disk_cache_path(name, suffix, key=None):
+    """Path of a disk cache entry, or None when caching is disabled.
+
+    Args:
+        name: Logical cache entry name
+        suffix: File suffix; '.parquet' entries hold DataFrames, anything else is pickled
+        key: Content key; defaults to a digest of name and DISK_CACHE_VERSION
+    """
+    config = get_config()
+    if not config['cache']['enabled']:
+        return None
+    key = key or hashlib.blake2b(f"{name}:{DISK_CACHE_VERSION}".encode('utf-8'), digest_size=8).hexdigest()
+    return Path(config['cache']['dir']) / f"{name}_{key}{suffix}"
+
+
+def disk_cache_load(path, max_age=None):
+    """Load a disk cache entry; None if missing, older than max_age seconds, or unreadable."""
+    if path is None or not path.exists():
+        return None
+    try:
+        if max_age is not None and time.time() - path.stat().st_mtime > max_age:
+            return None
+        if path.suffix == '.parquet':
+            return pd.read_parquet(path)
+        with path.open('rb') as f:
+            return pickle.load(f)
+    except Exception as e:
+        logger.warning(f"Could not read disk cache {path.name}: {str(e)}")
+        return None
+
+
+def disk_cache_store(path, value):
+    """Write a disk cache entry, logging rather than raising on failure."""
+    if path is None:
+        return
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.suffix == '.parquet':
+            value.to_parquet(path, compression='zstd')
+        else:
+            with path.open('wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception as e:
+        logger.warning(f"Could not write disk cache {path.name}: {str(e)}")
+
+
+@st.cache_data(show_spinner=False, ttl=600)  # Cache for 10 minutes
+def load_overview_bundle(_analytics):
+    """Load metrics, predictive insights and benchmark results in one cached call.
+
+    Args:
+        _analytics: Analytics engine (prefixed with _ to exclude from hash)
+    """
+    try:
+        if not _analytics:
+            return {}
+        cache_path = overview_bundle_cache_path(_analytics)
+        bundle = disk_cache_load(cache_path, max_age=get_config()['cache']['disk_ttl_seconds'])
+        if bundle is None:
+            bundle = _analytics.get_overview_bundle()
+            disk_cache_store(cache_path, bundle)
+        return bundle
     except Exception as e:
-        st.error(f"Error loading metrics: {str(e)}")
+        st.error(f"Error loading overview data: {str(e)}")
         return {}
 
 
-@st.cache_data(ttl=300)
-def load_supplier_risk_data():
-    """Load supplier risk analysis with caching."""
+@st.cache_data(show_spinner=False, ttl=600)
+def load_supplier_risk_data(_analytics):
+    """Load supplier risk analysis with caching.
+
+    Args:
+        _analytics: Analytics engine (prefixed with _ to exclude from hash)
+    """
     try:
-        _, analytics, _ = initialize_applications()
-        if analytics:
-            return analytics.get_supplier_risk_analysis()
-        return pd.DataFrame()
+        if not _analytics:
+            return pd.DataFrame()
+        cache_path = disk_cache_path('supplier_risk', '.parquet', key=analytics_cache_key(_analytics))
+        risk_df = disk_cache_load(cache_path, max_age=get_config()['cache']['disk_ttl_seconds'])
+        if risk_df is None:
+            risk_df = _analytics.get_supplier_risk_analysis()
+            if not risk_df.empty:
+                disk_cache_store(cache_path, risk_df)
+        if risk_df.empty:
+            return risk_df
+        risk_df = risk_df.astype({
+            'risk_category': pd.CategoricalDtype(['Low', 'Medium', 'High'], ordered=True),
+            'region': 'category'
+        })
+        for col in RISK_FLOAT_COLS:
+            if col in risk_df.columns:
+                risk_df[col] = pd.to_numeric(risk_df[col], downcast='float')
+        for col in RISK_INT_COLS:
+            if col in risk_df.columns:
+                risk_df[col] = pd.to_numeric(risk_df[col], downcast='integer')
+        return risk_df
     except Exception as e:
         st.error(f"Error loading risk data: {str(e)}")
         return pd.DataFrame()
 
 
+def frame_digest(df):
+    """Content hash of a DataFrame, cheaper to compute than to hash its values for st.cache_data."""
+    return int(pd.util.hash_pandas_object(df, index=False).sum())
+
+
+@st.cache_data(show_spinner=False, ttl=600)
+def make_risk_charts(risk_digest, _risk_df):
+    """Build the risk page's distribution, regional and correlation figures.
+
+    The figures only depend on the loaded risk frame, not on the table filters,
+    so they are rebuilt only when the frame's content changes.
+
+    Args:
+        risk_digest: Content hash of the risk frame, used as the cache key
+        _risk_df: Supplier risk frame (prefixed with _ to exclude from hash)
+    """
+    import plotly.graph_objects as go
+
+    # Risk score distribution, binned server-side
+    counts, edges = np.histogram(_risk_df['overall_risk_score'].dropna().to_numpy(), bins=20)
+    centers = 0.5 * (edges[:-1] + edges[1:])
+    fig_dist = go.Figure(go.Bar(x=centers, y=counts, width=np.diff(edges), marker_color='#ff6b6b'))
+    fig_dist.update_layout(
+        title="Risk Score Distribution",
+        xaxis_title='overall_risk_score',
+        yaxis_title='count',
+        bargap=0
+    )
+
+    # Risk by region
+    risk_by_region = _risk_df.groupby(['region', 'risk_category'], observed=True).size().reset_index(name='count')
+    fig_region = px.bar(
+        risk_by_region,
+        x='region',
+        y='count',
+        color='risk_category',
+        title="Risk Distribution by Region",
+        color_discrete_map=RISK_COLOR_MAP
+    )
+
+    # Correlation heatmap; upcast from the loader's float32 columns, and let pandas
+    # drop missing values pair by pair
+    correlation = _risk_df[list(RISK_CORR_COLS)].astype('float64').corr()
+    fig_corr = px.imshow(
+        correlation,
+        title="Risk Factors Correlation",
+        color_continuous_scale='RdBu_r',
+        zmin=-1, zmax=1
+    )
+
+    return fig_dist, fig_region, fig_corr
+
+
+def graph_fingerprint(graph):
+    """Cheap O(1) identity for a NetworkX graph snapshot."""
+    if graph is None:
+        return None
+    return (id(graph), graph.number_of_nodes(), graph.number_of_edges())
+
+
+def graph_content_digest(graph, include_data=False):
+    """Stable digest of a graph's node ids and edges, valid across process restarts.
+
+    With include_data, node and edge properties are part of the digest as well.
+    """
+    def describe(data):
+        return repr(sorted(data.items())) if include_data else ''
+
+    digest = hashlib.sha1()
+    for node in sorted(str(n) + describe(data) for n, data in graph.nodes(data=True)):
+        digest.update(node.encode('utf-8'))
+        digest.update(b'\0')
+    for edge in sorted(f"{u}->{v}{describe(data)}" for u, v, data in graph.edges(data=True)):
+        digest.update(edge.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+@st.cache_data(show_spinner=False, ttl=600)
+def get_cached_graph_statistics(_graph_builder, fingerprint):
+    """Compute graph statistics (including centrality) once per graph snapshot.
+
+    Results are also persisted under the configured cache dir, keyed by a content
+    digest of the graph, so a restarted process picks them up without recomputing.
+
+    Args:
+        _graph_builder: Graph builder (prefixed with _ to exclude from hash)
+        fingerprint: Graph identity from graph_fingerprint()
+    """
+    if _graph_builder.graph is None:
+        return _graph_builder.get_graph_statistics()
+
+    cache_path = disk_cache_path('graph_stats', '.pkl', key=graph_content_digest(_graph_builder.graph))
+    graph_stats = disk_cache_load(cache_path)
+    if graph_stats is None:
+        graph_stats = _graph_builder.get_graph_statistics()
+        disk_cache_store(cache_path, graph_stats)
+    return graph_stats
+
+
+@st.cache_data(show_spinner=False, ttl=3600)
+def get_cached_node_positions(_graph_builder, fingerprint, layout='hierarchical'):
+    """Compute node layout positions once per graph snapshot and layout.
+
+    Args:
+        _graph_builder: Graph builder (prefixed with _ to exclude from hash)
+        fingerprint: Graph identity from graph_fingerprint()
+        layout: Layout algorithm name
+    """
+    positions = _graph_builder.calculate_node_positions(layout)
+    return {node: (float(x), float(y)) for node, (x, y) in positions.items()}
+
+
+@st.cache_data(show_spinner=False, ttl=3600)
+def get_top_centrality_nodes(fingerprint, _centrality, top_n=5):
+    """Top-N (node, score) pairs per centrality measure, once per graph snapshot.
+
+    Args:
+        fingerprint: Graph identity from graph_fingerprint()
+        _centrality: Measure name -> {node: score} (prefixed with _ to exclude from hash)
+        top_n: Number of nodes to keep per measure
+    """
+    return {
+        measure_name: heapq.nlargest(top_n, measure_data.items(), key=lambda item: item[1])
+        for measure_name, measure_data in _centrality.items()
+    }
+
+
+def build_edge_segments(graph, positions):
+    """Gather edge endpoint coordinates with NumPy, split into normal and impacted segments.
+
+    Returns ((xs, ys), (xs, ys)) arrays laid out as x0, x1, NaN per edge so each
+    group can be drawn as a single line trace.
+    """
+    node_index = {node: i for i, node in enumerate(positions)}
+    xy = np.array(list(positions.values()), dtype=float).reshape(-1, 2)
+
+    edges = np.array([
+        (node_index[source], node_index[target], bool(data.get('impacted', False)))
+        for source, target, data in graph.edges(data=True)
+        if source in node_index and target in node_index
+    ], dtype=np.int64).reshape(-1, 3)
+    impacted = edges[:, 2].astype(bool)
+
+    def interleave(mask):
+        src, dst = edges[mask, 0], edges[mask, 1]
+        gaps = np.full(len(src), np.nan)
+        xs = np.column_stack([xy[src, 0], xy[dst, 0], gaps]).ravel()
+        ys = np.column_stack([xy[src, 1], xy[dst, 1], gaps]).ravel()
+        return xs, ys
+
+    return interleave(~impacted), interleave(impacted)
+
+
+def build_nodes_frame(graph, positions):
+    """Materialize positioned node attributes into a DataFrame indexed by node id."""
+    records = [
+        (node, data.get('node_type'), data.get('name', node), bool(data.get('impacted', False)),
+         data.get('impact_reason', 'Impact'), *positions[node])
+        for node, data in graph.nodes(data=True)
+        if node in positions
+    ]
+    nodes_df = pd.DataFrame.from_records(
+        records, columns=['node', 'node_type', 'name', 'impacted', 'impact_reason', 'x', 'y'], index='node'
+    )
+
+    # Hover labels: name, suffixed with the impact reason for impacted nodes
+    base = nodes_df['name'].fillna(nodes_df.index.to_series()).astype(str)
+    reason = nodes_df['impact_reason'].fillna('Impact').astype(str)
+    nodes_df['label'] = np.where(nodes_df['impacted'], base + ' ⚠️ (' + reason + ')', base)
+    return nodes_df
+
+
+def build_network_figure(graph, positions):
+    """Build the Plotly network figure: batched edge traces plus one marker trace per node type."""
+    import plotly.graph_objects as go
+
+    # Create network plot
+    fig_network = go.Figure()
+
+    # Add edges as two batched traces (normal / impacted), NaN-separated
+    (xs_normal, ys_normal), (xs_impacted, ys_impacted) = build_edge_segments(graph, positions)
+
+    for xs, ys, edge_width, edge_color in (
+        (xs_normal, ys_normal, 0.5, 'lightgray'),
+        (xs_impacted, ys_impacted, 2.5, IMPACTED_NODE_COLOR)
+    ):
+        if xs.size:
+            fig_network.add_trace(go.Scattergl(
+                x=xs,
+                y=ys,
+                mode='lines',
+                line=dict(width=edge_width, color=edge_color),
+                hoverinfo='none',
+                showlegend=False
+            ))
+
+    # Add nodes, one trace per node type
+    nodes_df = build_nodes_frame(graph, positions)
+    nodes_df['plot_type'] = nodes_df['node_type'].where(
+        nodes_df['node_type'].isin(NODE_TYPE_COLORS.keys()), 'other'
+    )
+    node_groups = dict(tuple(nodes_df.groupby('plot_type', sort=False)))
+
+    # Mapped node types first, then any remaining node types as 'Other'
+    for node_type, color in [*NODE_TYPE_COLORS.items(), ('other', OTHER_NODE_COLOR)]:
+        sub = node_groups.get(node_type)
+        if sub is None or sub.empty:
+            continue
+
+        impacted_flags = sub['impacted'].to_numpy()
+
+        fig_network.add_trace(go.Scattergl(
+            x=sub['x'],
+            y=sub['y'],
+            mode='markers',
+            marker=dict(size=np.where(impacted_flags, 12, 10),
+                        color=np.where(impacted_flags, IMPACTED_NODE_COLOR, color),
+                        line=dict(width=0)),
+            name=node_type.title(),
+            hovertext=sub['label'].tolist(),
+            hoverinfo='text'
+        ))
+
+    fig_network.update_layout(
+        title="Supply Chain Network Graph",
+        showlegend=True,
+        height=600,
+        xaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
+        yaxis=dict(showgrid=False, zeroline=False, showticklabels=False)
+    )
+
+    return fig_network
+
+
+def network_fingerprint(graph):
+    """Graph identity plus a hash of the impacted node and edge flags."""
+    impacted_nodes = frozenset(node for node, data in graph.nodes(data=True) if data.get('impacted'))
+    impacted_edges = frozenset((u, v) for u, v, data in graph.edges(data=True) if data.get('impacted'))
+    return graph_fingerprint(graph) + (hash(impacted_nodes), hash(impacted_edges))
+
+
+@st.cache_data(show_spinner=False, ttl=600, max_entries=10)
+def get_cached_network_figure_json(_graph, _positions, fingerprint):
+    """Serialize the network figure once per graph snapshot and impact state.
+
+    Args:
+        _graph: NetworkX graph to draw (prefixed with _ to exclude from hash)
+        _positions: Node positions (prefixed with _ to exclude from hash)
+        fingerprint: Identity from network_fingerprint()
+    """
+    return build_network_figure(_graph, _positions).to_json()
+
+
+@functools.cache
+def get_agraph():
+    """Import streamlit-agraph's (agraph, Node, Edge, Config) on first use; None if not installed."""
+    try:
+        from streamlit_agraph import agraph, Node, Edge, Config
+    except ImportError:
+        return None
+    return agraph, Node, Edge, Config
+
+
+@st.cache_resource(show_spinner=False, ttl=600, max_entries=10)
+def build_agraph_elements(_graph, _positions, fingerprint):
+    """Build the streamlit-agraph node and edge lists once per graph snapshot and impact state.
+
+    Cached as a resource, so reruns reuse the same (read-only) lists without a copy.
+
+    Args:
+        _graph: NetworkX graph to draw (prefixed with _ to exclude from hash)
+        _positions: Node positions (prefixed with _ to exclude from hash)
+        fingerprint: Identity from network_fingerprint()
+    """
+    _, Node, Edge, _ = get_agraph()
+    nodes_df = build_nodes_frame(_graph, _positions)
+    colors = np.where(
+        nodes_df['impacted'],
+        IMPACTED_NODE_COLOR,
+        nodes_df['node_type'].map(NODE_TYPE_COLORS).fillna(OTHER_NODE_COLOR)
+    )
+    labeled = set(heapq.nlargest(AGRAPH_LABELED_NODES, nodes_df.index, key=_graph.degree))
+    labeled.update(nodes_df.index[nodes_df['impacted']])
+
+    # Scale layout units to pixels; screen y grows downward
+    nodes = [
+        Node(id=str(node), label=label if node in labeled else '', title=label, color=color,
+             size=12 if impacted else 10, x=float(x) * 60, y=float(-y) * 120)
+        for node, label, color, impacted, x, y in zip(
+            nodes_df.index, nodes_df['label'], colors, nodes_df['impacted'], nodes_df['x'], nodes_df['y']
+        )
+    ]
+    edges = [
+        Edge(source=str(source), target=str(target),
+             color=IMPACTED_NODE_COLOR if data.get('impacted') else 'lightgray')
+        for source, target, data in _graph.edges(data=True)
+        if source in _positions and target in _positions
+    ]
+    return nodes, edges
+
+
+def render_network_agraph(graph, positions):
+    """Draw the network in the browser with streamlit-agraph using server-side positions."""
+    agraph, _, _, Config = get_agraph()
+    nodes, edges = build_agraph_elements(graph, positions, network_fingerprint(graph))
+    config = Config(width=1200, height=600, directed=True, physics=False, hierarchical=False)
+    return agraph(nodes=nodes, edges=edges, config=config)
+
+
+@st.cache_data
+def load_trend_data(start, end, freq):
+    """Generate the seeded mock performance trend series for the analytics page.
+
+    Args:
+        start: First date of the series
+        end: Last date of the series
+        freq: Pandas date frequency (e.g. 'W', 'D', 'h')
+    """
+    dates = pd.date_range(start=start, end=end, freq=freq)
+    rng = np.random.default_rng(42)
+
+    # One noise matrix: columns are reliability, lead time, risk score, capacity
+    noise = rng.standard_normal((len(dates), 4))
+
+    # Random walks (sigma * step scale) around each baseline, clipped to realistic bounds.
+    # cumsum is the only allocation; scale, shift and clip all run in place.
+    walks = noise[:, :3].cumsum(axis=0)
+    walks *= np.array([0.05 * 0.01, 1 * 0.1, 2 * 0.1])
+    walks += np.array([0.85, 10, 35])
+    np.clip(walks, [0.7, 6, 20], [1.0, 20, 60], out=walks)
+
+    capacity = noise[:, 3]
+    capacity *= 5
+    capacity += 60
+
+    return pd.DataFrame({
+        'Date': dates,
+        'Reliability': walks[:, 0],
+        'Lead_Time': walks[:, 1],
+        'Risk_Score': walks[:, 2],
+        'Capacity': capacity
+    })
+
+
+@functools.cache
+def get_figure_resampler():
+    """Import plotly-resampler's FigureResampler on first use; None if not installed."""
+    try:
+        from plotly_resampler import FigureResampler
+    except ImportError:
+        return None
+    return FigureResampler
+
+
+def add_trend_trace(fig, x, y, name, row, col):
+    """Add a WebGL line trace, handing the full series to the resampler when available."""
+    import plotly.graph_objects as go
+
+    FigureResampler = get_figure_resampler()
+    if FigureResampler is not None and isinstance(fig, FigureResampler):
+        fig.add_trace(go.Scattergl(name=name), hf_x=x, hf_y=y, row=row, col=col)
+    else:
+        fig.add_trace(go.Scattergl(x=x, y=y, name=name), row=row, col=col)
+
+
+@st.cache_resource
+def build_trend_figure(start, end, freq):
+    """Build the 2x2 performance trends figure from the mock trend series.
+
+    Cached as a resource: the figure is only read when rendered, so every rerun
+    can share the same (possibly resampler-wrapped) object.
+
+    Args:
+        start: First date of the series
+        end: Last date of the series
+        freq: Pandas date frequency (e.g. 'W', 'D', 'h')
+    """
+    from plotly.subplots import make_subplots
+
+    trend_data = load_trend_data(start, end, freq)
+
+    fig_trends = make_subplots(
+        rows=2, cols=2,
+        subplot_titles=('Supplier Reliability', 'Average Lead Time', 'Risk Score', 'Capacity Utilization'),
+        specs=[[{"secondary_y": False}, {"secondary_y": False}],
+               [{"secondary_y": False}, {"secondary_y": False}]]
+    )
+
+    # Downsample long series (LTTB) so rendering cost stays bounded
+    FigureResampler = get_figure_resampler()
+    if FigureResampler is not None:
+        fig_trends = FigureResampler(fig_trends, default_n_shown_samples=1000)
+
+    # Add traces; hand plain NumPy arrays to the resampler so it skips pandas conversions
+    trend_dates = trend_data['Date'].to_numpy()
+    add_trend_trace(fig_trends, trend_dates, trend_data['Reliability'].to_numpy(), 'Reliability', row=1, col=1)
+    add_trend_trace(fig_trends, trend_dates, trend_data['Lead_Time'].to_numpy(), 'Lead Time', row=1, col=2)
+    add_trend_trace(fig_trends, trend_dates, trend_data['Risk_Score'].to_numpy(), 'Risk Score', row=2, col=1)
+
+    # Mock capacity data
+    add_trend_trace(fig_trends, trend_dates, trend_data['Capacity'].to_numpy(), 'Capacity Utilization', row=2, col=2)
+
+    fig_trends.update_layout(height=600, showlegend=False)
+    return fig_trends
+
+
+@st.cache_data(ttl=300)
+def get_supplier_options(_simulator, simulator_id, suppliers_version):
+    """Build (display label, supplier id) pairs for the supplier selectbox.
+
+    Args:
+        _simulator: Simulation engine (prefixed with _ to exclude from hash)
+        simulator_id: Identity of the simulator instance, part of the cache key
+        suppliers_version: Graph builder's suppliers_version, part of the cache key
+    """
+    suppliers_df = _simulator.graph_builder.suppliers_df
+    if suppliers_df.empty:
+        return []
+
+    names = suppliers_df['name'].fillna(suppliers_df['id']).astype(str)
+    regions = suppliers_df['region'].fillna('Unknown').astype(str)
+    reliability = (suppliers_df['reliability'].fillna(0.5).astype(float) * 100).round(1).astype(str)
+    labels = names + ' (' + regions + ') – ' + reliability + '% reliability'
+    return list(zip(labels, suppliers_df['id']))
+
+
+@st.cache_data(ttl=300)
+def make_regional_pie(region_names, supplier_counts):
+    """Build the suppliers-by-region pie chart.
+
+    Args:
+        region_names: Sorted tuple of region names
+        supplier_counts: Tuple of supplier counts, parallel to region_names
+    """
+    fig = px.pie(
+        values=list(supplier_counts),
+        names=list(region_names),
+        title="Suppliers by Region"
+    )
+    fig.update_layout(height=400)
+    return fig
+
+
+@st.cache_data(ttl=300)
+def make_risk_bar(risk_counts):
+    """Build the suppliers-by-risk-category bar chart.
+
+    Args:
+        risk_counts: (low, medium, high) supplier counts
+    """
+    risk_categories = ['Low', 'Medium', 'High']
+    fig = px.bar(
+        x=risk_categories,
+        y=list(risk_counts),
+        title="Suppliers by Risk Category",
+        color=risk_categories,
+        color_discrete_map=RISK_COLOR_MAP
+    )
+    fig.update_layout(height=400, showlegend=False)
+    return fig
+
+
+@st.cache_data(ttl=300)
+def make_health_gauges(health_items):
+    """Build the four supply chain health scores as one row of gauge indicators.
+
+    Args:
+        health_items: Tuple of (label, score) pairs, scores on a 0-100 scale
+    """
+    import plotly.graph_objects as go
+
+    fig = go.Figure([
+        go.Indicator(
+            mode='gauge+number',
+            value=score,
+            number={'suffix': '%', 'valueformat': '.0f'},
+            title={'text': label},
+            gauge={'axis': {'range': [0, 100]}},
+            domain={'row': 0, 'column': i}
+        )
+        for i, (label, score) in enumerate(health_items)
+    ])
+    fig.update_layout(grid={'rows': 1, 'columns': len(health_items)}, height=250,
+                      margin=dict(l=30, r=30, t=60, b=20))
+    return fig
+
+
+@st.cache_data(ttl=300)
+def render_insight_cards(bundle_key, _insights):
+    """Pre-render the top predictive insights as a single markdown block.
+
+    Args:
+        bundle_key: Build timestamp of the overview bundle the insights came from
+        _insights: Insight dicts (prefixed with _ to exclude from hash)
+    """
+    return "\n\n---\n\n".join(
+        f"#### {insight['title']} ({insight['priority'].title()} Priority)\n\n"
+        f"{insight['description']}\n\n"
+        f"**Recommendation:** {insight['recommendation']}"
+        for insight in _insights[:3]  # Show top 3 insights
+    )
+
+
+@st.cache_data(ttl=600)
+def make_node_type_pie(type_items):
+    """Build the network explorer's entity distribution pie chart.
+
+    Args:
+        type_items: Tuple of (node_type, node_count) pairs
+    """
+    return px.pie(
+        values=[count for _, count in type_items],
+        names=[node_type for node_type, _ in type_items],
+        title="Supply Chain Entities Distribution"
+    )
+
+
+def scenario_cache_key(scenario):
+    """Cheap, hashable identity for a completed scenario."""
+    return (scenario.get('id'), scenario.get('name'), scenario.get('timestamp'))
+
+
+@st.cache_data(max_entries=20)
+def build_regional_display(scenario_key, _regional_impacts):
+    """Build the sorted regional impact frame and its display copy for a scenario.
+
+    Args:
+        scenario_key: Scenario identity from scenario_cache_key()
+        _regional_impacts: Regional impact records (prefixed with _ to exclude from hash)
+    """
+    regional_df = (
+        pd.DataFrame.from_records(_regional_impacts, columns=REGIONAL_COLS_SRC)
+        .astype(REGIONAL_DTYPES, copy=False)
+        .sort_values('delta_sla')
+    )
+    display_df = regional_df.convert_dtypes(dtype_backend='pyarrow')
+    display_df.columns = REGIONAL_COLS_OUT
+    return regional_df, display_df
+
+
+@st.cache_data(max_entries=20)
+def make_regional_delta_bar(scenario_key, _regional_df):
+    """Build the Δ SLA by region bar chart for a scenario.
+
+    Args:
+        scenario_key: Scenario identity from scenario_cache_key()
+        _regional_df: Sorted regional impact frame (prefixed with _ to exclude from hash)
+    """
+    fig = px.bar(
+        _regional_df,
+        x='region',
+        y='delta_sla',
+        title="Δ SLA vs Baseline by Region",
+        color='delta_sla',
+        color_continuous_scale=['red', 'orange', 'green']
+    )
+    fig.update_layout(yaxis_title='Δ SLA (pp)')
+    return fig
+
+
+@st.cache_data(max_entries=20)
+def build_impacted_display(scenario_key, _impacted_shipments):
+    """Build the impacted shipments display frame and its CSV export for a scenario.
+
+    Args:
+        scenario_key: Scenario identity from scenario_cache_key()
+        _impacted_shipments: Impacted shipment records (prefixed with _ to exclude from hash)
+    """
+    display_df = (
+        pd.DataFrame.from_records(_impacted_shipments, columns=IMPACTED_COLS_SRC)
+        .astype(IMPACTED_DTYPES, copy=False)
+        .convert_dtypes(dtype_backend='pyarrow')
+    )
+    display_df.columns = IMPACTED_COLS_OUT
+    return display_df, display_df.to_csv(index=False).encode('utf-8')
+
+
 def main():
     """Main application function."""
 
@@ -117,61 +911,65 @@ def main():
     # Sidebar navigation
     st.sidebar.header("🎛️ Control Panel")
 
-    page = st.sidebar.selectbox(
-        "Navigate to:",
-        ["🏠 Overview", "📊 Analytics", "🎯 Simulation", "📈 Risk Analysis", "🔍 Network Explorer"]
-    )
+    # Only the selected page's function runs, so heavy pages (the network
+    # explorer's statistics and layout) do no work while another page is shown
+    page = st.sidebar.selectbox("Navigate to:", list(PAGES))
+
+    # Metric pages share one bundle fetch, made only when one of them is shown
+    bundle = load_overview_bundle(analytics) if PAGES[page] in METRIC_PAGES else {}
 
     # Route to different pages
     if page == "🏠 Overview":
-        show_overview_page(analytics)
+        show_overview_page(bundle)
     elif page == "📊 Analytics":
-        show_analytics_page(analytics)
+        show_analytics_page(bundle)
     elif page == "🎯 Simulation":
         show_simulation_page(simulator)
     elif page == "📈 Risk Analysis":
         show_risk_analysis_page(analytics)
     elif page == "🔍 Network Explorer":
-        show_network_explorer_page(simulator, analytics)
-
-
-def show_overview_page(analytics):
-    """Show the main overview dashboard."""
-    st.header("📊 Supply Chain Overview")
-
-    # Load metrics
-    metrics = load_dashboard_metrics()
+        show_network_explorer_page(simulator, bundle)
+
+
+def flatten_overview_metrics(metrics):
+    """Flatten the nested overview metrics dict into attribute namespaces."""
+    return SimpleNamespace(
+        net=SimpleNamespace(**metrics['network']),
+        perf=SimpleNamespace(**metrics['supplier_performance']),
+        risk=SimpleNamespace(**metrics['risk']),
+        cap=SimpleNamespace(**metrics['capacity']),
+        health=SimpleNamespace(**metrics['health']),
+        regional_arrays=metrics['regional_arrays']
+    )
 
-    if not metrics:
-        st.warning("No data available. Please check your Neo4j connection and data loading.")
-        return
 
-    # Top-level KPIs
+def _overview_kpis(m):
+    """Render the two rows of top-level overview KPIs."""
     col1, col2, col3, col4 = st.columns(4)
 
     with col1:
         st.metric(
             "Suppliers",
-            metrics['network']['total_suppliers'],
+            m.net.total_suppliers,
             delta=None
         )
 
     with col2:
         st.metric(
             "Products",
-            metrics['network']['total_products'],
+            m.net.total_products,
             delta=None
         )
 
     with col3:
         st.metric(
             "Warehouses",
-            metrics['network']['total_warehouses'],
+            m.net.total_warehouses,
             delta=None
         )
 
     with col4:
-        avg_reliability = metrics['supplier_performance']['average_reliability']
+        avg_reliability = m.perf.average_reliability
         st.metric(
             "Avg Reliability",
             f"{avg_reliability:.1%}",
@@ -182,7 +980,7 @@ def show_overview_page(analytics):
     col5, col6, col7, col8 = st.columns(4)
 
     with col5:
-        avg_lead_time = metrics['supplier_performance']['average_lead_time']
+        avg_lead_time = m.perf.average_lead_time
         st.metric(
             "Avg Lead Time",
             f"{avg_lead_time:.1f} days",
@@ -191,7 +989,7 @@ def show_overview_page(analytics):
         )
 
     with col6:
-        high_risk = metrics['risk']['high_risk_suppliers']
+        high_risk = m.risk.high_risk_suppliers
         st.metric(
             "High Risk Suppliers",
             high_risk,
@@ -199,7 +997,7 @@ def show_overview_page(analytics):
         )
 
     with col7:
-        utilization = metrics['capacity']['utilization_rate']
+        utilization = m.cap.utilization_rate
         st.metric(
             "Capacity Utilization",
             f"{utilization:.1f}%",
@@ -207,13 +1005,42 @@ def show_overview_page(analytics):
         )
 
     with col8:
-        health_score = metrics['health']['overall_health_score']
+        health_score = m.health.overall_health_score
         st.metric(
             "Health Score",
             f"{health_score:.0f}/100",
             delta=f"{health_score - 75:.0f}" if health_score else None
         )
 
+
+def _overview_health(m):
+    """Render the supply chain health scores as a single gauge chart."""
+    # Supply Chain Health Dashboard
+    st.subheader("🏥 Supply Chain Health")
+
+    health_metrics = m.health
+    fig_health = make_health_gauges((
+        ("Reliability Health", float(health_metrics.reliability_health)),
+        ("Lead Time Health", float(health_metrics.lead_time_health)),
+        ("Connectivity Health", float(health_metrics.connectivity_health)),
+        ("Risk Health", float(health_metrics.risk_distribution_health))
+    ))
+    st.plotly_chart(fig_health, use_container_width=True)
+
+
+def show_overview_page(bundle):
+    """Show the main overview dashboard."""
+    st.header("📊 Supply Chain Overview")
+
+    metrics = bundle.get('metrics', {})
+
+    if not metrics:
+        st.warning("No data available. Please check your Neo4j connection and data loading.")
+        return
+
+    m = flatten_overview_metrics(metrics)
+    _overview_kpis(m)
+
     # Charts row
     col_left, col_right = st.columns(2)
 
@@ -221,86 +1048,32 @@ def show_overview_page(analytics):
         st.subheader("📍 Regional Distribution")
 
         # Regional suppliers chart
-        regional_data = metrics['regional']
-        if regional_data:
-            regions = list(regional_data.keys())
-            supplier_counts = [data['suppliers'] for data in regional_data.values()]
-
-            fig_regional = px.pie(
-                values=supplier_counts,
-                names=regions,
-                title="Suppliers by Region"
-            )
-            fig_regional.update_layout(height=400)
+        regional_arrays = m.regional_arrays
+        if regional_arrays['names']:
+            fig_regional = make_regional_pie(tuple(regional_arrays['names']), tuple(regional_arrays['suppliers']))
             st.plotly_chart(fig_regional, use_container_width=True)
 
     with col_right:
         st.subheader("⚠️ Risk Distribution")
 
         # Risk category distribution
-        risk_metrics = metrics['risk']
-        risk_categories = ['Low', 'Medium', 'High']
-        risk_counts = [
-            risk_metrics['low_risk_suppliers'],
-            risk_metrics['medium_risk_suppliers'],
-            risk_metrics['high_risk_suppliers']
-        ]
-
-        fig_risk = px.bar(
-            x=risk_categories,
-            y=risk_counts,
-            title="Suppliers by Risk Category",
-            color=risk_categories,
-            color_discrete_map={'Low': '#00c851', 'Medium': '#ffa500', 'High': '#ff4b4b'}
-        )
-        fig_risk.update_layout(height=400, showlegend=False)
+        fig_risk = make_risk_bar((
+            m.risk.low_risk_suppliers,
+            m.risk.medium_risk_suppliers,
+            m.risk.high_risk_suppliers
+        ))
         st.plotly_chart(fig_risk, use_container_width=True)
 
-    # Supply Chain Health Dashboard
-    st.subheader("🏥 Supply Chain Health")
-
-    health_metrics = metrics['health']
-    health_col1, health_col2, health_col3, health_col4 = st.columns(4)
-
-    with health_col1:
-        reliability_health = health_metrics['reliability_health']
-        st.metric("Reliability Health", f"{reliability_health:.0f}%")
-        st.progress(reliability_health / 100)
-
-    with health_col2:
-        lead_time_health = health_metrics['lead_time_health']
-        st.metric("Lead Time Health", f"{lead_time_health:.0f}%")
-        st.progress(lead_time_health / 100)
-
-    with health_col3:
-        connectivity_health = health_metrics['connectivity_health']
-        st.metric("Connectivity Health", f"{connectivity_health:.0f}%")
-        st.progress(connectivity_health / 100)
-
-    with health_col4:
-        risk_health = health_metrics['risk_distribution_health']
-        st.metric("Risk Health", f"{risk_health:.0f}%")
-        st.progress(risk_health / 100)
+    _overview_health(m)
 
     # Insights and Alerts
     st.subheader("💡 Predictive Insights")
 
     try:
-        insights = analytics.generate_predictive_insights()
+        insights = bundle.get('insights', [])
 
         if insights:
-            for insight in insights[:3]:  # Show top 3 insights
-                priority = insight['priority']
-                alert_class = f"alert-{priority}"
-
-                with st.container():
-                    st.markdown(f"""
-                    <div class="{alert_class}" style="padding: 1rem; border-radius: 0.5rem; margin: 0.5rem 0;">
-                        <h4>{insight['title']} ({priority.title()} Priority)</h4>
-                        <p>{insight['description']}</p>
-                        <p><strong>Recommendation:</strong> {insight['recommendation']}</p>
-                    </div>
-                    """, unsafe_allow_html=True)
+            st.markdown(render_insight_cards(bundle.get('generated_at'), insights))
         else:
             st.info("No critical insights at this time. Supply chain operating within normal parameters.")
 
@@ -308,12 +1081,11 @@ def show_overview_page(analytics):
         st.error(f"Error loading insights: {str(e)}")
 
 
-def show_analytics_page(analytics):
+def show_analytics_page(bundle):
     """Show detailed analytics page."""
     st.header("📊 Advanced Analytics")
 
-    # Load data
-    metrics = load_dashboard_metrics()
+    metrics = bundle.get('metrics', {})
 
     if not metrics:
         st.warning("No analytics data available.")
@@ -323,7 +1095,7 @@ def show_analytics_page(analytics):
     st.subheader("📏 Benchmark Analysis")
 
     try:
-        benchmark = analytics.benchmark_performance()
+        benchmark = bundle['benchmark']
 
         col1, col2 = st.columns(2)
 
@@ -358,102 +1130,43 @@ def show_analytics_page(analytics):
     # Performance Trends (mock data for demo)
     st.subheader("📈 Performance Trends")
 
-    # Create mock time series data
-    dates = pd.date_range(start='2024-01-01', end='2024-09-30', freq='W')
-    np.random.seed(42)
-
-    trend_data = pd.DataFrame({
-        'Date': dates,
-        'Reliability': 0.85 + np.random.normal(0, 0.05, len(dates)).cumsum() * 0.01,
-        'Lead_Time': 10 + np.random.normal(0, 1, len(dates)).cumsum() * 0.1,
-        'Risk_Score': 35 + np.random.normal(0, 2, len(dates)).cumsum() * 0.1
-    })
-
-    # Ensure realistic bounds
-    trend_data['Reliability'] = np.clip(trend_data['Reliability'], 0.7, 1.0)
-    trend_data['Lead_Time'] = np.clip(trend_data['Lead_Time'], 6, 20)
-    trend_data['Risk_Score'] = np.clip(trend_data['Risk_Score'], 20, 60)
-
-    fig_trends = make_subplots(
-        rows=2, cols=2,
-        subplot_titles=('Supplier Reliability', 'Average Lead Time', 'Risk Score', 'Capacity Utilization'),
-        specs=[[{"secondary_y": False}, {"secondary_y": False}],
-               [{"secondary_y": False}, {"secondary_y": False}]]
-    )
-
-    # Add traces
-    fig_trends.add_trace(
-        go.Scatter(x=trend_data['Date'], y=trend_data['Reliability'], name='Reliability'),
-        row=1, col=1
-    )
-    fig_trends.add_trace(
-        go.Scatter(x=trend_data['Date'], y=trend_data['Lead_Time'], name='Lead Time'),
-        row=1, col=2
-    )
-    fig_trends.add_trace(
-        go.Scatter(x=trend_data['Date'], y=trend_data['Risk_Score'], name='Risk Score'),
-        row=2, col=1
-    )
-
-    # Mock capacity data
-    fig_trends.add_trace(
-        go.Scatter(x=trend_data['Date'], y=60 + np.random.normal(0, 5, len(dates)), name='Capacity Utilization'),
-        row=2, col=2
-    )
-
-    fig_trends.update_layout(height=600, showlegend=False)
+    # Mock time series data, built into a figure once per date range
+    fig_trends = build_trend_figure('2024-01-01', '2024-09-30', 'W')
     st.plotly_chart(fig_trends, use_container_width=True)
 
 
-def show_simulation_page(simulator):
-    """Show the disruption simulation page with multiple scenario options."""
-    st.header("🎯 Disruption Simulation")
-    st.markdown("*Run disruption scenarios and visualize cascading impacts across the supply chain*")
-
-    status = simulator.get_simulation_status()
-    if not status['graph_loaded']:
-        st.error("Supply chain graph not loaded. Please check your data connection.")
-        return
-
+def _sidebar_controls(simulator):
+    """Render the scenario sidebar and return (scenario_type, scenario_args, run_clicked), or None."""
     st.sidebar.header("🎛️ Scenario Controls")
 
     # Add refresh button for data reload
     if st.sidebar.button("🔄 Refresh Data", help="Reload data from Neo4j"):
         st.cache_resource.clear()
+        st.cache_data.clear()
+        cache_config = get_config()['cache']
+        if cache_config['enabled']:
+            for pattern in ('overview_bundle_*.pkl', 'supplier_risk_*.parquet'):
+                for cache_path in Path(cache_config['dir']).glob(pattern):
+                    cache_path.unlink(missing_ok=True)
+        st.session_state.pop('graph_loaded', None)
         st.rerun()
 
-    scenario_options = {
-        "Supplier Delay": "supplier_delay",
-        "Supplier Outage": "supplier_outage",
-        "Regulatory Hold": "regulatory_hold",
-        "Cold Chain Hold": "cold_chain_hold",
-        "Lot Recall Trace": "lot_recall_trace"
-    }
-    scenario_choice = st.sidebar.selectbox("Scenario Type", list(scenario_options.keys()))
-    scenario_type = scenario_options[scenario_choice]
+    scenario_choice = st.sidebar.selectbox("Scenario Type", list(SCENARIO_OPTIONS))
+    scenario_type = SCENARIO_OPTIONS[scenario_choice]
 
     shipments_df = simulator.shipments_df
-    suppliers = [n for n, d in simulator.current_graph.nodes(data=True) if d.get('node_type') == 'supplier']
 
     scenario_args = {}
     scenario_name = None
 
     if scenario_type in {"supplier_delay", "supplier_outage"}:
-        if not suppliers:
+        supplier_options = get_supplier_options(simulator, id(simulator), simulator.graph_builder.suppliers_version)
+        if not supplier_options:
             st.error("No suppliers found in the supply chain graph.")
-            return
+            return None
 
-        supplier_options = {}
-        for supplier_id in suppliers:
-            supplier_data = simulator.current_graph.nodes[supplier_id]
-            name = supplier_data.get('name', supplier_id)
-            region = supplier_data.get('region', 'Unknown')
-            reliability = supplier_data.get('reliability', 0.5)
-            supplier_options[f"{name} ({region}) – {reliability:.1%} reliability"] = supplier_id
-
-        selected_supplier_display = st.sidebar.selectbox("Supplier", list(supplier_options.keys()))
-        selected_supplier = supplier_options[selected_supplier_display]
-        scenario_args['supplier_id'] = selected_supplier
+        selected_supplier = st.sidebar.selectbox("Supplier", supplier_options, format_func=lambda option: option[0])
+        scenario_args['supplier_id'] = selected_supplier[1]
 
     if scenario_type == "supplier_delay":
         delay_days = st.sidebar.slider("Delay Duration (days)", 1, simulator.config['simulation']['max_delay_days'], simulator.config['simulation']['default_delay_days'])
@@ -472,12 +1185,16 @@ def show_simulation_page(simulator):
     elif scenario_type == "regulatory_hold":
         if shipments_df.empty:
             st.error("Shipment data not available; cannot run regional scenarios.")
-            return
+            return None
 
-        regions = sorted(r for r in shipments_df['warehouse_region'].dropna().unique() if r)
+        region_col = shipments_df['warehouse_region']
+        if isinstance(region_col.dtype, pd.CategoricalDtype):
+            regions = [r for r in region_col.cat.categories if r]
+        else:
+            regions = sorted(r for r in region_col.dropna().unique() if r)
         if not regions:
             st.error("No warehouse regions found in shipment data.")
-            return
+            return None
 
         selected_region = st.sidebar.selectbox("Destination Region", regions)
         hold_days = st.sidebar.slider("Hold Duration (days)", 1, 21, 4)
@@ -489,7 +1206,7 @@ def show_simulation_page(simulator):
         if simulator.cold_chain_df.empty:
             st.error("Cold chain data not available.")
             st.info("💡 Tip: Click 'Refresh Data' button above to reload data from Neo4j")
-            return
+            return None
 
         # Show data status
         st.sidebar.info(f"✅ {len(simulator.cold_chain_df)} cold chain readings loaded")
@@ -504,12 +1221,11 @@ def show_simulation_page(simulator):
     elif scenario_type == "lot_recall_trace":
         if simulator.lots_df.empty:
             st.error("Lot data not available.")
-            return
+            return None
 
-        recall_candidates = simulator.lots_df.copy()
-        if 'recall_status' in recall_candidates.columns:
-            recall_candidates = recall_candidates[recall_candidates['recall_status'].astype(str).str.upper().str.contains('RECALL') |
-                                               recall_candidates['status'].astype(str).str.upper().str.contains('RECALL')]
+        recall_candidates = simulator.lots_df
+        if 'is_recall' in recall_candidates.columns:
+            recall_candidates = recall_candidates[recall_candidates['is_recall']]
         if recall_candidates.empty:
             recall_candidates = simulator.lots_df
 
@@ -519,289 +1235,266 @@ def show_simulation_page(simulator):
         scenario_args.update({'lot_id': selected_lot, 'scenario_name': scenario_name})
 
     run_label = "🔴 Run Scenario" if scenario_type != 'lot_recall_trace' else "🔍 Trace Lot"
+    run_clicked = st.sidebar.button(run_label, type="primary")
 
-    if st.sidebar.button(run_label, type="primary"):
-        with st.spinner("Running scenario..."):
-            try:
-                if scenario_type == 'supplier_delay':
-                    scenario = simulator.simulate_supplier_delay(
-                        supplier_id=scenario_args['supplier_id'],
-                        delay_days=scenario_args['delay_days'],
-                        scenario_name=scenario_args['scenario_name'],
-                        expedite=scenario_args['expedite']
-                    )
-                elif scenario_type == 'supplier_outage':
-                    scenario = simulator.simulate_supplier_outage(
-                        supplier_id=scenario_args['supplier_id'],
-                        outage_days=scenario_args['outage_days'],
-                        start_date=scenario_args['start_date'],
-                        scenario_name=scenario_args['scenario_name'],
-                        expedite=scenario_args['expedite']
-                    )
-                elif scenario_type == 'regulatory_hold':
-                    scenario = simulator.simulate_regional_hold(
-                        region=scenario_args['region'],
-                        hold_days=scenario_args['hold_days'],
-                        scenario_name=scenario_args['scenario_name'],
-                        expedite=scenario_args['expedite']
-                    )
-                elif scenario_type == 'cold_chain_hold':
-                    scenario = simulator.simulate_cold_chain_excursion(
-                        hold_extension_days=scenario_args['hold_extension_days'],
-                        focus_shipment=scenario_args['focus_shipment'],
-                        scenario_name=scenario_args['scenario_name']
-                    )
-                else:  # lot recall trace
-                    scenario = simulator.trace_lot_recall(
-                        lot_id=scenario_args['lot_id'],
-                        scenario_name=scenario_args['scenario_name']
-                    )
-
-                st.session_state['last_simulation'] = scenario
-                st.success("✅ Scenario completed successfully!")
-
-            except Exception as e:
-                st.error(f"Scenario failed: {str(e)}")
+    return scenario_type, scenario_args, run_clicked
 
-    if st.sidebar.button("🔄 Reset Simulation"):
-        simulator.reset_simulation()
-        st.session_state.pop('last_simulation', None)
-        st.success("Simulation state reset")
 
-    if 'last_simulation' in st.session_state:
-        scenario = st.session_state['last_simulation']
-        results = scenario.get('results', {})
-        scenario_type = results.get('scenario_type', scenario.get('type'))
-
-        st.subheader(f"📊 Results — {scenario.get('name', 'Scenario')}")
-
-        if scenario_type in {'supplier_delay', 'supplier_outage', 'regulatory_hold', 'cold_chain_hold'}:
-            kpis = results.get('kpis', {})
-            if kpis:
-                baseline_late = simulator.baseline_metrics.get('late_orders', 0)
-                expedite_enabled = kpis.get('expedite_cost_total', 0) > 0 if 'expedite_cost_total' in kpis else False
-
-                col1, col2, col3, col4 = st.columns(4)
-                with col1:
-                    st.metric("SLA (Post-Scenario)", f"{kpis.get('new_sla', 0):.1f}%", delta=f"{kpis.get('delta_sla', 0):.1f} pp")
-                with col2:
-                    st.metric("Baseline SLA", f"{kpis.get('baseline_sla', 0):.1f}%")
-                with col3:
-                    st.metric("Late Orders", int(kpis.get('late_orders_after_delay', 0)),
-                              delta=f"{int(kpis.get('late_orders_after_delay', 0)) - baseline_late:+d}")
-                with col4:
-                    if expedite_enabled:
-                        st.metric("Expedite Cost", f"${kpis.get('expedite_cost_total', 0):,.0f}")
-                    else:
-                        st.metric("Late (No Recovery)", int(kpis.get('late_orders_without_recovery', 0)),
-                                  delta=f"{int(kpis.get('late_orders_without_recovery', 0)) - baseline_late:+d}")
+def _run_scenario(simulator, scenario_type, scenario_args):
+    """Execute the selected scenario and store it as the last simulation."""
+    with st.spinner("Running scenario..."):
+        try:
+            if scenario_type == 'supplier_delay':
+                scenario = simulator.simulate_supplier_delay(
+                    supplier_id=scenario_args['supplier_id'],
+                    delay_days=scenario_args['delay_days'],
+                    scenario_name=scenario_args['scenario_name'],
+                    expedite=scenario_args['expedite']
+                )
+            elif scenario_type == 'supplier_outage':
+                scenario = simulator.simulate_supplier_outage(
+                    supplier_id=scenario_args['supplier_id'],
+                    outage_days=scenario_args['outage_days'],
+                    start_date=scenario_args['start_date'],
+                    scenario_name=scenario_args['scenario_name'],
+                    expedite=scenario_args['expedite']
+                )
+            elif scenario_type == 'regulatory_hold':
+                scenario = simulator.simulate_regional_hold(
+                    region=scenario_args['region'],
+                    hold_days=scenario_args['hold_days'],
+                    scenario_name=scenario_args['scenario_name'],
+                    expedite=scenario_args['expedite']
+                )
+            elif scenario_type == 'cold_chain_hold':
+                scenario = simulator.simulate_cold_chain_excursion(
+                    hold_extension_days=scenario_args['hold_extension_days'],
+                    focus_shipment=scenario_args['focus_shipment'],
+                    scenario_name=scenario_args['scenario_name']
+                )
+            else:  # lot recall trace
+                scenario = simulator.trace_lot_recall(
+                    lot_id=scenario_args['lot_id'],
+                    scenario_name=scenario_args['scenario_name']
+                )
 
+            st.session_state['last_simulation'] = scenario
+            st.success("✅ Scenario completed successfully!")
+
+        except Exception as e:
+            st.error(f"Scenario failed: {str(e)}")
+
+
+@st.fragment
+def _render_results(simulator, scenario):
+    """Render KPIs, tables and charts for a completed scenario."""
+    results = scenario.get('results', {})
+    result_type = results.get('scenario_type', scenario.get('type'))
+
+    st.subheader(f"📊 Results — {scenario.get('name', 'Scenario')}")
+
+    if result_type in {'supplier_delay', 'supplier_outage', 'regulatory_hold', 'cold_chain_hold'}:
+        kpis = results.get('kpis', {})
+        if kpis:
+            baseline_late = simulator.baseline_metrics.get('late_orders', 0)
+            expedite_enabled = kpis.get('expedite_cost_total', 0) > 0 if 'expedite_cost_total' in kpis else False
+
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                st.metric("SLA (Post-Scenario)", f"{kpis.get('new_sla', 0):.1f}%", delta=f"{kpis.get('delta_sla', 0):.1f} pp")
+            with col2:
+                st.metric("Baseline SLA", f"{kpis.get('baseline_sla', 0):.1f}%")
+            with col3:
+                st.metric("Late Orders", int(kpis.get('late_orders_after_delay', 0)),
+                          delta=f"{int(kpis.get('late_orders_after_delay', 0)) - baseline_late:+d}")
+            with col4:
                 if expedite_enabled:
-                    st.info("Expedite recovery applied: late shipments recovered at additional cost.")
-                elif kpis.get('late_orders_without_recovery', 0) > 0:
-                    st.warning("Late orders calculated without recovery. Enable expedite to estimate recovery costs.")
-
-            regional_impacts = results.get('regional_impacts', [])
-            st.subheader("🌍 Regional Impact Analysis")
-            if regional_impacts:
-                regional_df = pd.DataFrame(regional_impacts)
-                regional_df = regional_df.sort_values('delta_sla')
-                col_left, col_right = st.columns(2)
-                with col_left:
-                    fig_regional = px.bar(
-                        regional_df,
-                        x='region',
-                        y='delta_sla',
-                        title="Δ SLA vs Baseline by Region",
-                        color='delta_sla',
-                        color_continuous_scale=['red', 'orange', 'green']
-                    )
-                    fig_regional.update_layout(yaxis_title='Δ SLA (pp)')
-                    st.plotly_chart(fig_regional, use_container_width=True)
-                with col_right:
-                    display_df = regional_df.rename(columns={
-                        'region': 'Region',
-                        'baseline_sla': 'Baseline SLA (%)',
-                        'new_sla': 'New SLA (%)',
-                        'delta_sla': 'Δ SLA (pp)',
-                        'late_orders': 'Late Orders',
-                        'late_orders_without_recovery': 'Late (No Recovery)',
-                        'expedite_cost': 'Expedite Cost ($)',
-                        'shipments': '# Shipments'
-                    })
-                    st.dataframe(display_df.style.format({
-                        'Baseline SLA (%)': '{:.1f}',
-                        'New SLA (%)': '{:.1f}',
-                        'Δ SLA (pp)': '{:.1f}',
-                        'Expedite Cost ($)': '${:,.0f}'
-                    }), use_container_width=True)
-            else:
-                st.info("No regional impacts calculated for this scenario.")
-
-            impacted_shipments = results.get('impacted_shipments', [])
-            st.subheader("🛒 Impacted Shipments")
-            if impacted_shipments:
-                impacted_df = pd.DataFrame(impacted_shipments)
-                display_impacted = impacted_df.rename(columns={
-                    'shipment_id': 'Shipment',
-                    'supplier_id': 'Supplier',
-                    'product_id': 'Product',
-                    'product_name': 'Product Name',
-                    'warehouse_id': 'Warehouse',
-                    'warehouse_region': 'Region',
-                    'quantity': 'Quantity',
-                    'current_lead_time': 'Baseline Lead (days)',
-                    'delayed_lead_time': 'Delayed Lead (days)',
-                    'promised_days': 'Promised SLA (days)',
-                    'expedited': 'Expedited',
-                    'expedite_cost': 'Expedite Cost ($)'
-                })
-                st.dataframe(display_impacted.style.format({
-                    'Baseline Lead (days)': '{:.1f}',
-                    'Delayed Lead (days)': '{:.1f}',
-                    'Promised SLA (days)': '{:.0f}',
-                    'Expedite Cost ($)': '${:,.0f}'
-                }), use_container_width=True)
-                csv_name = scenario.get('name', 'scenario_results').replace(' ', '_') + '.csv'
-                st.download_button("⬇️ Download Impacted Shipments", display_impacted.to_csv(index=False).encode('utf-8'), csv_name, mime="text/csv")
-            else:
-                st.success("No shipments breach SLA under the current scenario.")
-
-            if scenario_type == 'supplier_outage' and 'resilience_metrics' in results:
-                resilience = results['resilience_metrics']
-                st.subheader("🛡️ Resilience Insights")
-                col_a, col_b = st.columns(2)
-                col_a.metric("Shipments Impacted", resilience.get('shipments_impacted', 0))
-                col_b.metric("Potential Backorders (units)", f"{resilience.get('potential_backorders_units', 0):,.0f}")
-                breaches = resilience.get('safety_stock_breaches', [])
-                if breaches:
-                    st.warning(f"Safety stock breached for {len(breaches)} product(s).")
-                    st.dataframe(pd.DataFrame(breaches).rename(columns={'product_id': 'Product', 'product_name': 'Product Name'}), use_container_width=True)
-
-            if scenario_type == 'regulatory_hold' and 'regional_hold' in results:
-                hold_info = results['regional_hold']
-                st.subheader("🚛 Lane Impact")
-                if hold_info['lanes']:
-                    lane_df = pd.DataFrame(hold_info['lanes']).rename(columns={
-                        'supplier_id': 'Supplier',
-                        'warehouse_id': 'Warehouse',
-                        'total_quantity': 'Quantity (units)',
-                        'late_orders_without_recovery': 'Late (No Recovery)',
-                        'late_orders_after_mitigation': 'Late (Post-Mitigation)'
-                    })
-                    st.dataframe(lane_df, use_container_width=True)
+                    st.metric("Expedite Cost", f"${kpis.get('expedite_cost_total', 0):,.0f}")
                 else:
-                    st.info("No lane-level impacts calculated.")
-
-            if scenario_type == 'cold_chain_hold' and 'cold_chain' in results:
-                st.subheader("❄️ Excursion Details")
-                cold_info = results['cold_chain']
-                st.write(f"Hold extension applied: **{cold_info.get('hold_extension_days', 0)} days**")
-                if cold_info['metrics']:
-                    st.dataframe(pd.DataFrame(cold_info['metrics']).rename(columns={
-                        'shipment_id': 'Shipment',
-                        'max_temp': 'Max Temp (°C)',
-                        'min_temp': 'Min Temp (°C)',
-                        'reading_count': '# Readings',
-                        'max_excursion_minutes': 'Max Excursion (min)'
-                    }), use_container_width=True)
-
-        elif scenario_type == 'lot_recall_trace':
-            results = scenario.get('results', {})
-            lot_info = results.get('lot', {})
-            st.subheader(f"🧪 Lot {lot_info.get('lot_id', 'N/A')} Recall Trace")
-            st.write(f"Status: **{lot_info.get('recall_status', lot_info.get('status', 'Unknown'))}**")
-            shipments = results.get('shipments_impacted', [])
-            warehouses = results.get('warehouses_impacted', [])
-            st.metric("Shipments Impacted", len(shipments))
-            st.metric("Warehouses Impacted", len(warehouses))
-            if shipments:
-                st.dataframe(pd.DataFrame(shipments), use_container_width=True)
-            st.markdown(results.get('summary', ''))
-
+                    st.metric("Late (No Recovery)", int(kpis.get('late_orders_without_recovery', 0)),
+                              delta=f"{int(kpis.get('late_orders_without_recovery', 0)) - baseline_late:+d}")
+
+            if expedite_enabled:
+                st.info("Expedite recovery applied: late shipments recovered at additional cost.")
+            elif kpis.get('late_orders_without_recovery', 0) > 0:
+                st.warning("Late orders calculated without recovery. Enable expedite to estimate recovery costs.")
+
+        regional_impacts = results.get('regional_impacts', [])
+        st.subheader("🌍 Regional Impact Analysis")
+        if regional_impacts:
+            regional_df, display_df = build_regional_display(scenario_cache_key(scenario), regional_impacts)
+            col_left, col_right = st.columns(2)
+            with col_left:
+                fig_regional = make_regional_delta_bar(scenario_cache_key(scenario), regional_df)
+                st.plotly_chart(fig_regional, use_container_width=True)
+            with col_right:
+                st.dataframe(display_df, column_config={
+                    'Baseline SLA (%)': st.column_config.NumberColumn(format='%.1f'),
+                    'New SLA (%)': st.column_config.NumberColumn(format='%.1f'),
+                    'Δ SLA (pp)': st.column_config.NumberColumn(format='%.1f'),
+                    'Expedite Cost ($)': st.column_config.NumberColumn(format='dollar')
+                }, use_container_width=True)
+        else:
+            st.info("No regional impacts calculated for this scenario.")
+
+        impacted_shipments = results.get('impacted_shipments', [])
+        st.subheader("🛒 Impacted Shipments")
+        if impacted_shipments:
+            display_impacted, impacted_csv = build_impacted_display(scenario_cache_key(scenario), impacted_shipments)
+            st.dataframe(display_impacted, column_config={
+                'Baseline Lead (days)': st.column_config.NumberColumn(format='%.1f'),
+                'Delayed Lead (days)': st.column_config.NumberColumn(format='%.1f'),
+                'Promised SLA (days)': st.column_config.NumberColumn(format='%.0f'),
+                'Expedite Cost ($)': st.column_config.NumberColumn(format='dollar')
+            }, use_container_width=True)
+            csv_name = scenario.get('name', 'scenario_results').replace(' ', '_') + '.csv'
+            st.download_button("⬇️ Download Impacted Shipments", impacted_csv, csv_name, mime="text/csv")
         else:
-            st.info("Scenario executed, but no structured results are available to display.")
+            st.success("No shipments breach SLA under the current scenario.")
+
+        if result_type == 'supplier_outage' and 'resilience_metrics' in results:
+            resilience = results['resilience_metrics']
+            st.subheader("🛡️ Resilience Insights")
+            col_a, col_b = st.columns(2)
+            col_a.metric("Shipments Impacted", resilience.get('shipments_impacted', 0))
+            col_b.metric("Potential Backorders (units)", f"{resilience.get('potential_backorders_units', 0):,.0f}")
+            breaches = resilience.get('safety_stock_breaches', [])
+            if breaches:
+                st.warning(f"Safety stock breached for {len(breaches)} product(s).")
+                breach_df = pd.DataFrame.from_records(breaches, columns=BREACH_COLS_SRC)
+                breach_df.columns = BREACH_COLS_OUT
+                st.dataframe(breach_df, column_config={
+                    'delayed_quantity': st.column_config.NumberColumn(format='%d'),
+                    'safety_stock': st.column_config.NumberColumn(format='%d'),
+                    'breach_units': st.column_config.NumberColumn(format='%d')
+                }, use_container_width=True)
+
+        if result_type == 'regulatory_hold' and 'regional_hold' in results:
+            hold_info = results['regional_hold']
+            st.subheader("🚛 Lane Impact")
+            if hold_info['lanes']:
+                lane_df = pd.DataFrame.from_records(hold_info['lanes'], columns=LANE_COLS_SRC)
+                lane_df.columns = LANE_COLS_OUT
+                st.dataframe(lane_df, column_config={
+                    'Quantity (units)': st.column_config.NumberColumn(format='%d')
+                }, use_container_width=True)
+            else:
+                st.info("No lane-level impacts calculated.")
+
+        if result_type == 'cold_chain_hold' and 'cold_chain' in results:
+            st.subheader("❄️ Excursion Details")
+            cold_info = results['cold_chain']
+            st.write(f"Hold extension applied: **{cold_info.get('hold_extension_days', 0)} days**")
+            if cold_info['metrics']:
+                cold_df = pd.DataFrame.from_records(cold_info['metrics'], columns=COLD_CHAIN_COLS_SRC)
+                cold_df.columns = COLD_CHAIN_COLS_OUT
+                st.dataframe(cold_df, column_config={
+                    'Max Temp (°C)': st.column_config.NumberColumn(format='%.1f'),
+                    'Min Temp (°C)': st.column_config.NumberColumn(format='%.1f'),
+                    'Max Excursion (min)': st.column_config.NumberColumn(format='%.0f')
+                }, use_container_width=True)
+
+    elif result_type == 'lot_recall_trace':
+        results = scenario.get('results', {})
+        lot_info = results.get('lot', {})
+        st.subheader(f"🧪 Lot {lot_info.get('lot_id', 'N/A')} Recall Trace")
+        st.write(f"Status: **{lot_info.get('recall_status', lot_info.get('status', 'Unknown'))}**")
+        shipments = results.get('shipments_impacted', [])
+        warehouses = results.get('warehouses_impacted', [])
+        st.metric("Shipments Impacted", len(shipments))
+        st.metric("Warehouses Impacted", len(warehouses))
+        if shipments:
+            st.dataframe(pd.DataFrame(shipments), use_container_width=True)
+        st.markdown(results.get('summary', ''))
+
+    else:
+        st.info("Scenario executed, but no structured results are available to display.")
+
+    st.subheader("📋 Executive Summary")
+    summary_text = results.get('summary', scenario.get('name', 'Scenario completed.'))
+    st.markdown(summary_text)
+
+
+def show_simulation_page(simulator):
+    """Show the disruption simulation page with multiple scenario options."""
+    st.header("🎯 Disruption Simulation")
+    st.markdown("*Run disruption scenarios and visualize cascading impacts across the supply chain*")
 
-        st.subheader("📋 Executive Summary")
-        summary_text = results.get('summary', scenario.get('name', 'Scenario completed.'))
-        st.markdown(summary_text)
+    if not st.session_state.get('graph_loaded'):
+        st.session_state['graph_loaded'] = simulator.get_simulation_status()['graph_loaded']
+    if not st.session_state['graph_loaded']:
+        st.error("Supply chain graph not loaded. Please check your data connection.")
+        return
+
+    controls = _sidebar_controls(simulator)
+    if controls is None:
+        return
+    scenario_type, scenario_args, run_clicked = controls
+
+    if run_clicked:
+        _run_scenario(simulator, scenario_type, scenario_args)
 
+    if st.sidebar.button("🔄 Reset Simulation"):
+        simulator.reset_simulation()
+        st.session_state.pop('last_simulation', None)
+        st.session_state.pop('graph_loaded', None)
+        st.success("Simulation state reset")
+
+    if 'last_simulation' in st.session_state:
+        _render_results(simulator, st.session_state['last_simulation'])
     else:
         st.info("👆 Configure a scenario in the sidebar and click **Run Scenario** to begin.")
 
 
-
 def show_risk_analysis_page(analytics):
     """Show detailed risk analysis page."""
     st.header("📈 Supplier Risk Analysis")
 
     # Load risk data
-    risk_df = load_supplier_risk_data()
+    risk_df = load_supplier_risk_data(analytics)
 
     if risk_df.empty:
         st.warning("No risk analysis data available.")
         return
 
-    # Risk overview metrics
+    # Risk overview metrics, aggregated in one pass per category
+    category_agg = risk_df.groupby('risk_category', observed=True).agg(
+        count=('supplier_name', 'size'),
+        value=('total_value', 'sum')
+    )
+    has_high = 'High' in category_agg.index
+    high_risk_count = int(category_agg.at['High', 'count']) if has_high else 0
+    total_value_at_risk = category_agg.at['High', 'value'] if has_high else 0.0
+    avg_risk = risk_df['overall_risk_score'].mean()
+    avg_reliability = risk_df['reliability_score'].mean()
+
     col1, col2, col3, col4 = st.columns(4)
 
     with col1:
-        high_risk_count = len(risk_df[risk_df['risk_category'] == 'High'])
         st.metric("High Risk Suppliers", high_risk_count)
 
     with col2:
-        avg_risk = risk_df['overall_risk_score'].mean()
         st.metric("Average Risk Score", f"{avg_risk:.1f}")
 
     with col3:
-        total_value_at_risk = risk_df[risk_df['risk_category'] == 'High']['total_value'].sum()
         st.metric("Value at Risk", f"${total_value_at_risk:,.0f}")
 
     with col4:
-        avg_reliability = risk_df['reliability_score'].mean()
         st.metric("Average Reliability", f"{avg_reliability:.1%}")
 
     # Risk distribution visualization
+    fig_dist, fig_region, fig_corr = make_risk_charts(frame_digest(risk_df), risk_df)
+
     col_left, col_right = st.columns(2)
 
     with col_left:
-        # Risk score distribution
-        fig_dist = px.histogram(
-            risk_df,
-            x='overall_risk_score',
-            nbins=20,
-            title="Risk Score Distribution",
-            color_discrete_sequence=['#ff6b6b']
-        )
         st.plotly_chart(fig_dist, use_container_width=True)
 
     with col_right:
-        # Risk by region
-        risk_by_region = risk_df.groupby(['region', 'risk_category']).size().reset_index(name='count')
-
-        fig_region = px.bar(
-            risk_by_region,
-            x='region',
-            y='count',
-            color='risk_category',
-            title="Risk Distribution by Region",
-            color_discrete_map={'Low': '#00c851', 'Medium': '#ffa500', 'High': '#ff4b4b'}
-        )
         st.plotly_chart(fig_region, use_container_width=True)
 
     # Risk factors analysis
     st.subheader("🔍 Risk Factors Analysis")
-
-    # Correlation heatmap
-    risk_factors = ['reliability_risk', 'lead_time_risk', 'volume_risk', 'dependency_risk']
-    correlation_data = risk_df[risk_factors + ['overall_risk_score']].corr()
-
-    fig_corr = px.imshow(
-        correlation_data,
-        title="Risk Factors Correlation",
-        color_continuous_scale='RdBu_r',
-        zmin=-1, zmax=1
-    )
     st.plotly_chart(fig_corr, use_container_width=True)
 
     # Detailed risk table
@@ -814,22 +1507,21 @@ def show_risk_analysis_page(analytics):
         risk_filter = st.selectbox("Filter by Risk Level:", ['All', 'High', 'Medium', 'Low'])
 
     with col2:
-        region_filter = st.selectbox("Filter by Region:", ['All'] + list(risk_df['region'].unique()))
+        region_filter = st.selectbox("Filter by Region:", ['All'] + risk_df['region'].cat.categories.tolist())
 
     with col3:
         sort_by = st.selectbox("Sort by:", ['overall_risk_score', 'reliability_score', 'total_value'])
 
-    # Apply filters
-    filtered_df = risk_df.copy()
+    # Apply filters as a single mask, then slice and sort once
+    mask = np.ones(len(risk_df), dtype=bool)
 
     if risk_filter != 'All':
-        filtered_df = filtered_df[filtered_df['risk_category'] == risk_filter]
+        mask &= (risk_df['risk_category'] == risk_filter).to_numpy()
 
     if region_filter != 'All':
-        filtered_df = filtered_df[filtered_df['region'] == region_filter]
+        mask &= (risk_df['region'] == region_filter).to_numpy()
 
-    # Sort data
-    filtered_df = filtered_df.sort_values(sort_by, ascending=False)
+    filtered_df = risk_df.loc[mask].sort_values(sort_by, ascending=False)
 
     # Display table with formatting
     display_columns = [
@@ -838,11 +1530,12 @@ def show_risk_analysis_page(analytics):
     ]
 
     st.dataframe(
-        filtered_df[display_columns].style.format({
-            'overall_risk_score': '{:.1f}',
-            'reliability_score': '{:.1%}',
-            'total_value': '${:,.0f}'
-        }),
+        filtered_df[display_columns],
+        column_config={
+            'overall_risk_score': st.column_config.NumberColumn(format='%.1f'),
+            'reliability_score': st.column_config.NumberColumn(format='percent'),
+            'total_value': st.column_config.NumberColumn(format='dollar')
+        },
         use_container_width=True
     )
 
@@ -866,13 +1559,15 @@ def show_risk_analysis_page(analytics):
         st.success("✅ No high-risk suppliers identified. Supply chain risk is well-managed.")
 
 
-def show_network_explorer_page(simulator, analytics):
+def show_network_explorer_page(simulator, bundle):
     """Show network exploration and graph analysis page."""
     st.header("🔍 Supply Chain Network Explorer")
 
     # Get graph statistics
     try:
-        graph_stats = simulator.graph_builder.get_graph_statistics()
+        graph_builder = simulator.graph_builder
+        fingerprint = graph_fingerprint(graph_builder.graph)
+        graph_stats = get_cached_graph_statistics(graph_builder, fingerprint)
 
         # Network overview
         st.subheader("🌐 Network Overview")
@@ -895,152 +1590,44 @@ def show_network_explorer_page(simulator, analytics):
         # Node type distribution
         st.subheader("📊 Node Distribution")
 
-        node_types = graph_stats['node_types']
-
-        fig_nodes = px.pie(
-            values=list(node_types.values()),
-            names=list(node_types.keys()),
-            title="Supply Chain Entities Distribution"
-        )
+        fig_nodes = make_node_type_pie(tuple(graph_stats['node_types'].items()))
         st.plotly_chart(fig_nodes, use_container_width=True)
 
         # Network visualization (simplified)
         st.subheader("🕸️ Network Visualization")
 
         # Calculate positions
-        positions = simulator.graph_builder.calculate_node_positions('hierarchical')
-
-        if positions:
-            # Create network plot
-            fig_network = go.Figure()
-
-            # Add edges
-            for edge in simulator.current_graph.edges():
-                if edge[0] not in positions or edge[1] not in positions:
-                    continue
-                x0, y0 = positions[edge[0]]
-                x1, y1 = positions[edge[1]]
-                edge_data = simulator.current_graph.get_edge_data(edge[0], edge[1]) or {}
-                edge_impacted = edge_data.get('impacted', False)
-                edge_color = '#DC143C' if edge_impacted else 'lightgray'
-                edge_width = 2.5 if edge_impacted else 0.5
-
-                fig_network.add_trace(go.Scatter(
-                    x=[x0, x1, None],
-                    y=[y0, y1, None],
-                    mode='lines',
-                    line=dict(width=edge_width, color=edge_color),
-                    hoverinfo='none',
-                    showlegend=False
-                ))
-
-            # Add nodes
-            node_types_colors = {
-                'supplier': '#87CEEB',
-                'sla_rule': '#FFD700',
-                'product': '#90EE90',
-                'lot': '#DA70D6',
-                'shipment': '#DDA0DD',
-                'cold_chain_reading': '#1E90FF',
-                'warehouse': '#FFA500',
-                'lane': '#20B2AA',
-                'customer': '#F08080',
-                'cost': '#FFC0CB',
-                'event': '#DC143C'
-            }
-
-            for node_type, color in node_types_colors.items():
-                nodes_of_type = [n for n, d in simulator.current_graph.nodes(data=True)
-                               if d.get('node_type') == node_type]
-
-                nodes_with_positions = [node for node in nodes_of_type if node in positions]
-
-                if nodes_with_positions:
-                    x_coords = [positions[node][0] for node in nodes_with_positions]
-                    y_coords = [positions[node][1] for node in nodes_with_positions]
-                    impacted_flags = [simulator.current_graph.nodes[node].get('impacted', False)
-                                      for node in nodes_with_positions]
-                    node_colors = ['#DC143C' if flag else color for flag in impacted_flags]
-                    node_sizes = [12 if flag else 10 for flag in impacted_flags]
-                    node_labels = []
-                    for node in nodes_with_positions:
-                        node_data = simulator.current_graph.nodes[node]
-                        label = node_data.get('name', node)
-                        if node_data.get('impacted'):
-                            reason = node_data.get('impact_reason', 'Impact')
-                            label = f"{label} ⚠️ ({reason})"
-                        node_labels.append(label)
-
-                    fig_network.add_trace(go.Scatter(
-                        x=x_coords,
-                        y=y_coords,
-                        mode='markers',
-                        marker=dict(size=node_sizes, color=node_colors, line=dict(color='black', width=1)),
-                        name=node_type.title(),
-                        text=node_labels,
-                        hovertemplate='%{text}<extra></extra>'
-                    ))
-
-            # Plot any remaining node types not explicitly mapped
-            other_nodes = [
-                n for n in simulator.current_graph.nodes()
-                if simulator.current_graph.nodes[n].get('node_type') not in node_types_colors
-            ]
-
-            other_nodes_with_positions = [node for node in other_nodes if node in positions]
-
-            if other_nodes_with_positions:
-                x_coords = [positions[node][0] for node in other_nodes_with_positions]
-                y_coords = [positions[node][1] for node in other_nodes_with_positions]
-                if x_coords:
-                    other_impacted = [simulator.current_graph.nodes[node].get('impacted', False)
-                                      for node in other_nodes_with_positions]
-                    other_colors = ['#DC143C' if flag else '#808080' for flag in other_impacted]
-                    other_sizes = [12 if flag else 10 for flag in other_impacted]
-                    other_labels = []
-                    for node in other_nodes_with_positions:
-                        node_data = simulator.current_graph.nodes[node]
-                        label = node_data.get('name', node)
-                        if node_data.get('impacted'):
-                            reason = node_data.get('impact_reason', 'Impact')
-                            label = f"{label} ⚠️ ({reason})"
-                        other_labels.append(label)
-                    fig_network.add_trace(go.Scatter(
-                        x=x_coords,
-                        y=y_coords,
-                        mode='markers',
-                        marker=dict(size=other_sizes, color=other_colors, line=dict(color='black', width=1)),
-                        name='Other',
-                        text=other_labels,
-                        hovertemplate='%{text}<extra></extra>'
-                    ))
-
-            fig_network.update_layout(
-                title="Supply Chain Network Graph",
-                showlegend=True,
-                height=600,
-                xaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
-                yaxis=dict(showgrid=False, zeroline=False, showticklabels=False)
+        # Session copy avoids st.cache_data's per-hit unpickle of the whole position dict
+        positions_key = ('hierarchical', fingerprint)
+        session_positions = st.session_state.get('node_positions')
+        if session_positions and session_positions[0] == positions_key:
+            positions = session_positions[1]
+        else:
+            positions = get_cached_node_positions(graph_builder, fingerprint, 'hierarchical')
+            st.session_state['node_positions'] = (positions_key, positions)
+
+        if positions and get_agraph() is not None and len(positions) <= AGRAPH_MAX_NODES:
+            render_network_agraph(simulator.current_graph, positions)
+        elif positions:
+            fig_json = get_cached_network_figure_json(
+                simulator.current_graph, positions, network_fingerprint(simulator.current_graph)
             )
-
-            st.plotly_chart(fig_network, use_container_width=True)
+            st.plotly_chart(pio.from_json(fig_json), use_container_width=True)
 
         # Critical path analysis
         st.subheader("🎯 Critical Path Analysis")
 
-        metrics = load_dashboard_metrics()
+        metrics = bundle.get('metrics', {})
         if metrics and 'critical_paths' in metrics:
             critical_paths = metrics['critical_paths']['critical_paths']
 
             if critical_paths:
-                critical_df = pd.DataFrame(critical_paths)
-
-                st.write(f"**Top {len(critical_df)} Critical Supply Paths:**")
-
-                display_df = critical_df[[
+                display_df = pd.DataFrame.from_records(critical_paths, columns=[
                     'supplier_name', 'product_name', 'volume',
                     'reliability', 'lead_time', 'criticality_score'
-                ]].copy()
+                ])
+
+                st.write(f"**Top {len(display_df)} Critical Supply Paths:**")
 
                 display_df.columns = [
                     'Supplier', 'Product', 'Volume', 'Reliability',
@@ -1048,10 +1635,13 @@ def show_network_explorer_page(simulator, analytics):
                 ]
 
                 st.dataframe(
-                    display_df.style.format({
-                        'Reliability': '{:.1%}',
-                        'Criticality Score': '{:.1f}'
-                    }),
+                    display_df,
+                    column_config={
+                        'Volume': st.column_config.NumberColumn(format='%d'),
+                        'Reliability': st.column_config.NumberColumn(format='percent'),
+                        'Lead Time (days)': st.column_config.NumberColumn(format='%.1f'),
+                        'Criticality Score': st.column_config.NumberColumn(format='%.1f')
+                    },
                     use_container_width=True
                 )
             else:
@@ -1061,17 +1651,16 @@ def show_network_explorer_page(simulator, analytics):
         if 'centrality' in graph_stats and graph_stats['centrality']:
             st.subheader("🎯 Network Centrality Analysis")
 
-            centrality_data = graph_stats['centrality']
+            top_centrality = get_top_centrality_nodes(fingerprint, graph_stats['centrality'])
+            nodes = simulator.current_graph.nodes
 
             # Show top nodes by different centrality measures
-            for measure_name, measure_data in centrality_data.items():
-                if measure_data:
+            for measure_name, sorted_nodes in top_centrality.items():
+                if sorted_nodes:
                     st.write(f"**Top 5 Nodes by {measure_name.title()} Centrality:**")
 
-                    sorted_nodes = sorted(measure_data.items(), key=lambda x: x[1], reverse=True)[:5]
-
                     for i, (node, score) in enumerate(sorted_nodes, 1):
-                        node_data = simulator.current_graph.nodes[node]
+                        node_data = nodes[node]
                         node_name = node_data.get('name', node)
                         node_type = node_data.get('node_type', 'unknown')
 
@@ -2,6 +2,7 @@
 """Debug cold chain data from Neo4j vs CSV."""
 
 import sys
+import numpy as np
 import pandas as pd
 sys.path.insert(0, 'src')
 
@@ -25,27 +26,28 @@ if not simulator.cold_chain_df.empty:
     print(simulator.cold_chain_df[['reading_id', 'shipment_id', 'temperature_c', 'excursion_flag', 'threshold_min_c', 'threshold_max_c']].head(15))
 
     print("\n=== Testing Excursion Detection ===")
-    def is_excursion(row):
-        flag = str(row.get('excursion_flag', '')).upper()
-        print(f"Row {row.get('reading_id')}: flag='{flag}' (type: {type(row.get('excursion_flag'))})")
-        if flag == 'YES':
-            return True
-        temp = row.get('temperature_c')
-        min_t = row.get('threshold_min_c')
-        max_t = row.get('threshold_max_c')
-        if pd.notna(temp) and (pd.notna(min_t) and temp < min_t or pd.notna(max_t) and temp > max_t):
-            return True
-        return False
-
-    # Test first 5 rows
-    print("\nTesting first 5 rows:")
-    for idx, row in simulator.cold_chain_df.head(5).iterrows():
-        result = is_excursion(row)
-        print(f"  -> Result: {result}")
+    df = simulator.cold_chain_df
+    flag_yes = df['excursion_flag'].astype(str).str.upper().eq('YES')
+    below_min = df['temperature_c'].lt(df['threshold_min_c'].fillna(-np.inf))
+    above_max = df['temperature_c'].gt(df['threshold_max_c'].fillna(np.inf))
+    df['is_excursion'] = flag_yes | below_min | above_max
 
-    # Apply to all
-    simulator.cold_chain_df['is_excursion'] = simulator.cold_chain_df.apply(is_excursion, axis=1)
-    excursions = simulator.cold_chain_df[simulator.cold_chain_df['is_excursion'] == True]
+    # Inspect the first 5 rows from the computed masks
+    print("\nTesting first 5 rows:")
+    print(pd.DataFrame({
+        'reading_id': df['reading_id'],
+        'flag_yes': flag_yes,
+        'below_min': below_min,
+        'above_max': above_max,
+        'is_excursion': df['is_excursion']
+    }).head(5))
+
+    # Aggregate view of what drove the flags, instead of per-row output
+    print(f"\nFlag dtype: {df['excursion_flag'].dtype}, "
+          f"unique flags: {df['excursion_flag'].astype(str).str.upper().unique().tolist()}")
+    print(f"Flagged YES: {int(flag_yes.sum())}, below min: {int(below_min.sum())}, above max: {int(above_max.sum())}")
+
+    excursions = df[df['is_excursion']]
     print(f"\n=== Total Excursions Detected: {len(excursions)} ===")
 
     if not excursions.empty:
@@ -9,6 +9,29 @@ import subprocess
 import sys
 import os
 
+SERVER_FLAGS = {
+    'server.port': 8501,
+    'server.address': 'localhost',
+}
+
+
+def run_in_process(dashboard_path):
+    """Serve the dashboard from this interpreter, skipping a second Python start-up."""
+    from streamlit.web import bootstrap
+
+    # Mirrors what `streamlit run` does before handing over to bootstrap.run
+    bootstrap.load_config_options(flag_options=SERVER_FLAGS)
+    bootstrap.run(dashboard_path, False, [], SERVER_FLAGS)
+
+
+def run_subprocess(dashboard_path):
+    """Serve the dashboard through the `streamlit run` CLI in a child process."""
+    subprocess.run([
+        sys.executable, '-m', 'streamlit', 'run', dashboard_path,
+        *(f'--{name}={value}' for name, value in SERVER_FLAGS.items())
+    ])
+
+
 def main():
     """Launch the Streamlit dashboard."""
     print("🚀 Launching Mini Foundry Supply Chain Control Tower...")
@@ -18,11 +41,10 @@ def main():
 
     # Launch Streamlit
     try:
-        subprocess.run([
-            sys.executable, '-m', 'streamlit', 'run', dashboard_path,
-            '--server.port=8501',
-            '--server.address=localhost'
-        ])
+        try:
+            run_in_process(dashboard_path)
+        except ImportError:
+            run_subprocess(dashboard_path)
     except KeyboardInterrupt:
         print("\n👋 Dashboard stopped by user")
     except Exception as e:
@@ -18,6 +18,25 @@ FOR (c:Customer) REQUIRE c.customer_id IS UNIQUE;
 CREATE CONSTRAINT shipment_id_unique IF NOT EXISTS
 FOR (sh:Shipment) REQUIRE sh.shipment_id IS UNIQUE;
 
+// Pilot supporting entities (scripts/load_pilot_data.py)
+CREATE CONSTRAINT lot_id_unique IF NOT EXISTS
+FOR (l:Lot) REQUIRE l.lot_id IS UNIQUE;
+
+CREATE CONSTRAINT rule_id_unique IF NOT EXISTS
+FOR (s:SLARule) REQUIRE s.rule_id IS UNIQUE;
+
+CREATE CONSTRAINT lane_id_unique IF NOT EXISTS
+FOR (l:Lane) REQUIRE l.lane_id IS UNIQUE;
+
+CREATE CONSTRAINT cost_id_unique IF NOT EXISTS
+FOR (c:Cost) REQUIRE c.cost_id IS UNIQUE;
+
+CREATE CONSTRAINT reading_id_unique IF NOT EXISTS
+FOR (r:ColdChainReading) REQUIRE r.reading_id IS UNIQUE;
+
+CREATE CONSTRAINT event_id_unique IF NOT EXISTS
+FOR (e:Event) REQUIRE e.event_id IS UNIQUE;
+
 // Create performance indexes for frequent queries
 CREATE INDEX supplier_region_idx IF NOT EXISTS
 FOR (s:Supplier) ON (s.region);
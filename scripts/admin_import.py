@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Offline Bulk Import for the Core Supply Chain Graph
+
+Converts the core CSVs into neo4j-admin import files and builds the
+`neo4j-admin database import full` command for a first-time load.
+
+The offline importer writes the store directly, bypassing transactions, and is
+far faster than Cypher MERGE/CREATE. It needs a stopped (or new) local
+database, so it is not available on Aura and cannot be used for incremental
+loads; the graph it produces matches neo4j/load_data.cypher.
+"""
+
+import logging
+import pandas as pd
+import numpy as np
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import List
+
+logger = logging.getLogger(__name__)
+
+# neo4j-admin header types for core node properties, matching the toFloat/toInteger
+# conversions in neo4j/load_data.cypher
+NODE_PROPERTY_TYPES = {
+    'reliability_score': 'reliability_score:float',
+    'avg_lead_time_days': 'avg_lead_time_days:int',
+    'safety_stock': 'safety_stock:int',
+    'demand_forecast': 'demand_forecast:int',
+    'capacity_units': 'capacity_units:int',
+    'avg_demand_units': 'avg_demand_units:int',
+    'created_at': 'created_at:datetime',
+    'updated_at': 'updated_at:datetime',
+}
+
+
+def _write(df: pd.DataFrame, path: Path, header: List[str]) -> Path:
+    """Write `df` as an import file whose header carries neo4j-admin types."""
+    df.to_csv(path, index=False, header=header)
+    return path
+
+
+def prepare_admin_import(data_path: Path, import_dir: Path, database: str = 'neo4j') -> List[str]:
+    """Write neo4j-admin node/relationship files and return the import command.
+
+    Args:
+        data_path: Directory holding the core CSVs (suppliers, products, ...)
+        import_dir: Directory to write the typed import files to
+        database: Target database name
+
+    Returns:
+        The `neo4j-admin database import full` command as an argument list
+    """
+    data_path, import_dir = Path(data_path), Path(import_dir)
+    import_dir.mkdir(parents=True, exist_ok=True)
+
+    suppliers = pd.read_csv(data_path / 'suppliers.csv')
+    products = pd.read_csv(data_path / 'products.csv')
+    warehouses = pd.read_csv(data_path / 'warehouses.csv')
+    customers = pd.read_csv(data_path / 'customers.csv')
+    shipments = pd.read_csv(data_path / 'shipments.csv')
+
+    now = datetime.now(timezone.utc).isoformat(timespec='seconds')
+    today = date.today()
+
+    files = {'nodes': [], 'relationships': []}
+    for label, df in (('Supplier', suppliers), ('Product', products),
+                      ('Warehouse', warehouses), ('Customer', customers)):
+        key = f"{label.lower()}_id"
+        df = df.assign(created_at=now, updated_at=now)
+        header = [f"{key}:ID({label})" if col == key else NODE_PROPERTY_TYPES.get(col, col) for col in df.columns]
+        files['nodes'].append((label, _write(df, import_dir / f"{label.lower()}s.csv", header)))
+
+    # Shipments only for rows whose supplier, product and warehouse exist
+    shipments = shipments[
+        shipments['supplier_id'].isin(suppliers['supplier_id'])
+        & shipments['product_id'].isin(products['product_id'])
+        & shipments['warehouse_id'].isin(warehouses['warehouse_id'])
+    ]
+    qty = shipments['qty_units'].astype(int)
+    lead = shipments['planned_lead_time_days'].astype(int)
+
+    shipment_nodes = pd.DataFrame({
+        'shipment_id': shipments['shipment_id'], 'qty_units': qty, 'planned_lead_time_days': lead,
+        'actual_lead_time_days': lead, 'status': shipments['status'],
+        'created_at': now, 'updated_at': now,
+    })
+    files['nodes'].append(('Shipment', _write(shipment_nodes, import_dir / 'shipments.csv', [
+        'shipment_id:ID(Shipment)', 'qty_units:int', 'planned_lead_time_days:int',
+        'actual_lead_time_days:int', 'status', 'created_at:datetime', 'updated_at:datetime'
+    ])))
+
+    # SUPPLIES / STOCKED_AT are MERGEd on all their properties, so identical rows
+    # collapse into one relationship
+    reliability = shipments['supplier_id'].map(suppliers.set_index('supplier_id')['reliability_score'])
+    supplies = pd.DataFrame({
+        'start': shipments['supplier_id'], 'end': shipments['product_id'], 'lead_time_days': lead,
+        'reliability': reliability, 'last_shipment_date': today.isoformat(), 'total_volume': qty,
+    }).drop_duplicates()
+    files['relationships'].append(('SUPPLIES', _write(supplies, import_dir / 'supplies.csv', [
+        ':START_ID(Supplier)', ':END_ID(Product)', 'lead_time_days:int', 'reliability:float',
+        'last_shipment_date:date', 'total_volume:int'
+    ])))
+
+    safety_stock = shipments['product_id'].map(products.set_index('product_id')['safety_stock'])
+    stocked = pd.DataFrame({
+        'start': shipments['product_id'], 'end': shipments['warehouse_id'], 'current_inventory': qty,
+        'last_updated': today.isoformat(), 'reorder_point': safety_stock, 'max_capacity': qty * 2,
+    }).drop_duplicates()
+    files['relationships'].append(('STOCKED_AT', _write(stocked, import_dir / 'stocked_at.csv', [
+        ':START_ID(Product)', ':END_ID(Warehouse)', 'current_inventory:int', 'last_updated:date',
+        'reorder_point:int', 'max_capacity:int'
+    ])))
+
+    creates = pd.DataFrame({
+        'start': shipments['supplier_id'], 'end': shipments['shipment_id'],
+        'shipment_date': today.isoformat(), 'volume': qty,
+    })
+    files['relationships'].append(('CREATES', _write(creates, import_dir / 'creates.csv', [
+        ':START_ID(Supplier)', ':END_ID(Shipment)', 'shipment_date:date', 'volume:int'
+    ])))
+
+    contains = pd.DataFrame({
+        'start': shipments['shipment_id'], 'end': shipments['product_id'],
+        'quantity': qty, 'unit_cost': 15.0 + qty * 0.01,
+    })
+    files['relationships'].append(('CONTAINS', _write(contains, import_dir / 'contains.csv', [
+        ':START_ID(Shipment)', ':END_ID(Product)', 'quantity:int', 'unit_cost:float'
+    ])))
+
+    delivered = pd.DataFrame({
+        'start': shipments['shipment_id'], 'end': shipments['warehouse_id'],
+        'delivery_date': [(today + timedelta(days=int(days))).isoformat() for days in lead],
+        'transport_mode': 'Ground', 'tracking_status': shipments['status'],
+    })
+    files['relationships'].append(('DELIVERED_TO', _write(delivered, import_dir / 'delivered_to.csv', [
+        ':START_ID(Shipment)', ':END_ID(Warehouse)', 'delivery_date:date', 'transport_mode', 'tracking_status'
+    ])))
+
+    # Warehouses deliver to every customer in their region
+    pairs = warehouses[['warehouse_id', 'region']].merge(customers[['customer_id', 'region']], on='region')
+    delivers = pd.DataFrame({
+        'start': pairs['warehouse_id'], 'end': pairs['customer_id'],
+        'avg_delivery_days': 2, 'shipping_cost': 25.0, 'service_level': 0.95,
+        'last_delivery': [
+            (today - timedelta(days=int(days))).isoformat()
+            for days in np.random.randint(1, 31, size=len(pairs))
+        ],
+    })
+    files['relationships'].append(('DELIVERS_TO', _write(delivers, import_dir / 'delivers_to.csv', [
+        ':START_ID(Warehouse)', ':END_ID(Customer)', 'avg_delivery_days:int', 'shipping_cost:float',
+        'service_level:float', 'last_delivery:date'
+    ])))
+
+    logger.info(f"Wrote {len(files['nodes'])} node and {len(files['relationships'])} "
+                f"relationship files to {import_dir}")
+
+    return [
+        'neo4j-admin', 'database', 'import', 'full', '--overwrite-destination',
+        *(f"--nodes={label}={path.resolve()}" for label, path in files['nodes']),
+        *(f"--relationships={rel_type}={path.resolve()}" for rel_type, path in files['relationships']),
+        database
+    ]
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    root = Path(__file__).parent.parent
+    command = prepare_admin_import(root / 'data', root / 'data' / 'admin_import')
+    print(' '.join(command))
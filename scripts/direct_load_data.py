@@ -7,195 +7,437 @@ Bypasses LOAD CSV by directly creating nodes and relationships via Python.
 import os
 import sys
 import logging
+import functools
 import pandas as pd
+import pyarrow as pa
+from pyarrow import csv as pa_csv
+from pyarrow import parquet as pq
 from pathlib import Path
 
 # Add src to path
 sys.path.append(str(Path(__file__).parent.parent / 'src'))
 
-from data_loader import Neo4jConnection
+from data_loader import Neo4jConnection, df_records
 from utils import setup_logging
 
 logger = setup_logging()
 
 
+# Rows sent per UNWIND write
+BATCH_SIZE = 2000
+
+# Upper bound on concurrent write transactions for disjoint-key batches
+MAX_CONCURRENT_BATCHES = 8
+
+# Bytes of CSV parsed per streamed chunk for the large loaders
+CSV_BLOCK_SIZE = 4 << 20
+
+# (label, key) pairs the loaders MERGE/MATCH on; each gets a uniqueness constraint
+NODE_KEYS = [
+    ('Supplier', 'supplier_id'),
+    ('Product', 'product_id'),
+    ('Warehouse', 'warehouse_id'),
+    ('Customer', 'customer_id'),
+    ('Shipment', 'shipment_id'),
+    ('Lot', 'lot_id'),
+    ('SLARule', 'rule_id'),
+    ('Event', 'event_id'),
+    ('Cost', 'cost_id'),
+    ('ColdChainReading', 'reading_id')
+]
+
+
+def ensure_schema(neo4j: Neo4jConnection):
+    """Create the key uniqueness constraints (and their backing indexes) before loading."""
+    logger.info("Ensuring key constraints...")
+    for label, key in NODE_KEYS:
+        neo4j.execute_cypher(
+            f"CREATE CONSTRAINT {key}_unique IF NOT EXISTS FOR (n:{label}) REQUIRE n.{key} IS UNIQUE"
+        )
+    logger.info(f"✅ {len(NODE_KEYS)} key constraints in place")
+
+
+def _parquet_cache(path: Path) -> Path:
+    """Parquet copy of a loader CSV, kept beside it."""
+    return path.with_suffix('.parquet')
+
+
+def _cache_is_fresh(path: Path) -> bool:
+    """Whether the Parquet copy of `path` exists and is at least as new as the CSV."""
+    cache = _parquet_cache(path)
+    return cache.exists() and cache.stat().st_mtime >= path.stat().st_mtime
+
+
+def _read_csv(path: Path, text_columns: tuple = ()) -> pd.DataFrame:
+    """Read a loader CSV, preferring its Parquet cache when that is up to date.
+
+    CSVs are parsed with pandas' multithreaded PyArrow parser and the result is
+    cached to Parquet, so repeated loads skip CSV parsing entirely. Columns in
+    `text_columns` are kept as strings rather than inferred as dates, so they are
+    written to Neo4j exactly as they appear in the file.
+    """
+    if _cache_is_fresh(path):
+        return pd.read_parquet(_parquet_cache(path))
+
+    df = pd.read_csv(path, engine='pyarrow', dtype={col: str for col in text_columns})
+    try:
+        df.to_parquet(_parquet_cache(path), compression='zstd', index=False)
+    except Exception as e:
+        logger.warning(f"Could not write Parquet cache for {path.name}: {str(e)}")
+    return df
+
+
+def _iter_csv_chunks(path: Path, text_columns: tuple = ()):
+    """Stream a CSV as DataFrame chunks of about CSV_BLOCK_SIZE bytes each.
+
+    Keeps peak memory at one chunk (plus its records) instead of the whole file.
+    Column types are inferred from the first block, so sparsely filled text columns
+    should be pinned through `text_columns`. Like _read_csv, chunks come from the
+    Parquet cache when it is up to date; otherwise the cache is written as the CSV
+    is streamed.
+    """
+    cache = _parquet_cache(path)
+    if _cache_is_fresh(path):
+        for batch in pq.ParquetFile(cache).iter_batches(batch_size=BATCH_SIZE * 10):
+            yield batch.to_pandas()
+        return
+
+    reader = pa_csv.open_csv(
+        path,
+        read_options=pa_csv.ReadOptions(block_size=CSV_BLOCK_SIZE),
+        convert_options=pa_csv.ConvertOptions(column_types={col: pa.string() for col in text_columns})
+    )
+    # Written to a temporary file and renamed once complete, so an interrupted
+    # load never leaves a truncated cache that looks fresh
+    partial = cache.with_suffix('.parquet.tmp')
+    try:
+        writer = pq.ParquetWriter(partial, reader.schema, compression='zstd')
+    except Exception as e:
+        logger.warning(f"Could not write Parquet cache for {path.name}: {str(e)}")
+        writer = None
+
+    try:
+        for batch in reader:
+            if writer is not None:
+                writer.write_batch(batch)
+            yield batch.to_pandas()
+    except BaseException:
+        if writer is not None:
+            writer.close()
+            partial.unlink(missing_ok=True)
+        raise
+
+    if writer is not None:
+        writer.close()
+        partial.replace(cache)
+
+
+def _write_rows(tx, query: str, rows: list):
+    tx.run(query, rows=rows).consume()
+
+
+def _run_batched(neo4j: Neo4jConnection, query: str, rows: list):
+    """Run an UNWIND $rows query over `rows`, one managed transaction per BATCH_SIZE chunk."""
+    with neo4j.session() as session:
+        for start in range(0, len(rows), BATCH_SIZE):
+            session.execute_write(_write_rows, query, rows[start:start + BATCH_SIZE])
+
+
+def _run_in_transactions(neo4j: Neo4jConnection, query: str, params_iter):
+    """Run a per-row query for each parameter dict, committing once per BATCH_SIZE rows."""
+    with neo4j.session() as session:
+        tx = session.begin_transaction()
+        try:
+            for count, params in enumerate(params_iter, start=1):
+                tx.run(query, params).consume()
+                if count % BATCH_SIZE == 0:
+                    tx.commit()
+                    tx = session.begin_transaction()
+            tx.commit()
+        finally:
+            tx.close()
+
+
+def _run_concurrent(neo4j: Neo4jConnection, query: str, rows: list):
+    """Run an UNWIND $rows query with up to MAX_CONCURRENT_BATCHES batches in flight.
+
+    Only for writes whose batches touch disjoint nodes (e.g. MERGE on a unique key).
+    """
+    neo4j.execute_batched(query, rows, batch_size=BATCH_SIZE, concurrency=MAX_CONCURRENT_BATCHES)
+
+
+@functools.cache
+def _has_periodic_iterate(neo4j: Neo4jConnection) -> bool:
+    """Whether the server exposes apoc.periodic.iterate."""
+    try:
+        result = neo4j.execute_cypher(
+            "SHOW PROCEDURES YIELD name WHERE name = 'apoc.periodic.iterate' RETURN count(*) AS n"
+        )
+        return bool(result and result[0]['n'])
+    except Exception:
+        return False
+
+
+def _run_iterate(neo4j: Neo4jConnection, action: str, rows: list, parallel: bool):
+    """Run a per-`row` write action over `rows` with server-side batching.
+
+    Uses apoc.periodic.iterate so Neo4j batches (and, with `parallel`, spreads
+    batches over its worker threads) in one call. Only set `parallel` when batches
+    touch disjoint nodes; otherwise they contend for the same locks. Falls back to
+    client-side UNWIND batches when APOC is not installed.
+    """
+    if not _has_periodic_iterate(neo4j):
+        run = _run_concurrent if parallel else _run_batched
+        run(neo4j, "UNWIND $rows AS row\n" + action, rows)
+        return
+
+    result = neo4j.execute_cypher(
+        """
+        CALL apoc.periodic.iterate(
+            'UNWIND $rows AS row RETURN row', $action,
+            {batchSize: $batch_size, parallel: $parallel, params: {rows: $rows}}
+        )
+        YIELD failedBatches, errorMessages
+        RETURN failedBatches, errorMessages
+        """,
+        {'action': action, 'rows': rows, 'batch_size': BATCH_SIZE, 'parallel': parallel}
+    )
+    if result and result[0]['failedBatches']:
+        raise RuntimeError(f"apoc.periodic.iterate failed: {result[0]['errorMessages']}")
+
+
+def _bulk_merge(neo4j: Neo4jConnection, label: str, key: str, df: pd.DataFrame, props: list,
+                server_side: bool = False):
+    """MERGE one node per DataFrame row on `key`, setting `props`, in UNWIND batches.
+
+    Keys are unique per row, so batches never share a node and are always written
+    concurrently. `server_side` selects where: apoc.periodic.iterate batches on the
+    server in one call; otherwise the client keeps up to MAX_CONCURRENT_BATCHES
+    batches in flight.
+
+    Existing nodes are only rewritten (and re-stamped with updated_at) when at least
+    one property differs, so re-loading unchanged data writes nothing.
+    """
+    assignments = ",\n            ".join(f"n.{prop} = row.{prop}" for prop in props)
+    # Null-safe inequality: equal if both values match or both are missing
+    changed = "\n           OR ".join(
+        f"NOT coalesce(n.{prop} = row.{prop}, n.{prop} IS NULL AND row.{prop} IS NULL)" for prop in props
+    )
+    action = f"""
+        MERGE (n:{label} {{{key}: row.{key}}})
+        ON CREATE SET n.updated_at = datetime()
+        WITH n, row
+        WHERE {changed}
+        SET {assignments},
+            n.updated_at = datetime()
+        """
+    # One row per key (the last, whose SET would win), in key order
+    df = df.drop_duplicates(subset=[key], keep='last').sort_values(key)
+    rows = df_records(df, [key] + props)
+    if server_side:
+        _run_iterate(neo4j, action, rows, parallel=True)
+    else:
+        _run_concurrent(neo4j, "UNWIND $rows AS row\n" + action, rows)
+
+
 def load_suppliers(neo4j: Neo4jConnection, data_path: Path):
     """Load suppliers from CSV."""
-    df = pd.read_csv(data_path / 'suppliers.csv')
+    df = _read_csv(data_path / 'suppliers.csv')
     logger.info(f"Loading {len(df)} suppliers...")
 
-    for _, row in df.iterrows():
-        query = """
-        MERGE (s:Supplier {supplier_id: $supplier_id})
-        SET s.name = $name,
-            s.region = $region,
-            s.reliability_score = $reliability_score,
-            s.avg_lead_time_days = $avg_lead_time_days,
-            s.updated_at = datetime()
-        """
-        params = {
-            'supplier_id': row['supplier_id'],
-            'name': row['name'],
-            'region': row['region'],
-            'reliability_score': float(row['reliability_score']),
-            'avg_lead_time_days': int(row['avg_lead_time_days'])
-        }
-        neo4j.execute_cypher(query, params)
+    df = df.astype({'reliability_score': float, 'avg_lead_time_days': int})
+    _bulk_merge(neo4j, 'Supplier', 'supplier_id', df,
+                ['name', 'region', 'reliability_score', 'avg_lead_time_days'])
     logger.info(f"✅ Loaded {len(df)} suppliers")
 
 
 def load_products(neo4j: Neo4jConnection, data_path: Path):
     """Load products from CSV."""
-    df = pd.read_csv(data_path / 'products.csv')
+    df = _read_csv(data_path / 'products.csv')
     logger.info(f"Loading {len(df)} products...")
 
-    for _, row in df.iterrows():
-        query = """
-        MERGE (p:Product {product_id: $product_id})
-        SET p.product_name = $product_name,
-            p.category = $category,
-            p.safety_stock = $safety_stock,
-            p.demand_forecast = $demand_forecast,
-            p.updated_at = datetime()
-        """
-        params = {
-            'product_id': row['product_id'],
-            'product_name': row['product_name'],
-            'category': row['category'],
-            'safety_stock': int(row['safety_stock']),
-            'demand_forecast': int(row['demand_forecast'])
-        }
-        neo4j.execute_cypher(query, params)
+    df = df.astype({'safety_stock': int, 'demand_forecast': int})
+    _bulk_merge(neo4j, 'Product', 'product_id', df,
+                ['product_name', 'category', 'safety_stock', 'demand_forecast'])
     logger.info(f"✅ Loaded {len(df)} products")
 
 
 def load_warehouses(neo4j: Neo4jConnection, data_path: Path):
     """Load warehouses from CSV."""
-    df = pd.read_csv(data_path / 'warehouses.csv')
+    df = _read_csv(data_path / 'warehouses.csv')
     logger.info(f"Loading {len(df)} warehouses...")
 
-    for _, row in df.iterrows():
-        query = """
-        MERGE (w:Warehouse {warehouse_id: $warehouse_id})
-        SET w.location = $location,
-            w.capacity_units = $capacity_units,
-            w.region = $region,
-            w.updated_at = datetime()
-        """
-        params = {
-            'warehouse_id': row['warehouse_id'],
-            'location': row['location'],
-            'capacity_units': int(row['capacity_units']),
-            'region': row['region']
-        }
-        neo4j.execute_cypher(query, params)
+    df = df.astype({'capacity_units': int})
+    _bulk_merge(neo4j, 'Warehouse', 'warehouse_id', df,
+                ['location', 'capacity_units', 'region'])
     logger.info(f"✅ Loaded {len(df)} warehouses")
 
 
 def load_customers(neo4j: Neo4jConnection, data_path: Path):
     """Load customers from CSV."""
-    df = pd.read_csv(data_path / 'customers.csv')
+    df = _read_csv(data_path / 'customers.csv')
     logger.info(f"Loading {len(df)} customers...")
 
-    for _, row in df.iterrows():
-        query = """
-        MERGE (c:Customer {customer_id: $customer_id})
-        SET c.name = $name,
-            c.region = $region,
-            c.avg_demand_units = $avg_demand_units,
-            c.updated_at = datetime()
-        """
-        params = {
-            'customer_id': row['customer_id'],
-            'name': row['name'],
-            'region': row['region'],
-            'avg_demand_units': int(row['avg_demand_units'])
-        }
-        neo4j.execute_cypher(query, params)
+    df = df.astype({'avg_demand_units': int})
+    _bulk_merge(neo4j, 'Customer', 'customer_id', df,
+                ['name', 'region', 'avg_demand_units'])
     logger.info(f"✅ Loaded {len(df)} customers")
 
 
+def _existing_ids(neo4j: Neo4jConnection, label: str, key: str) -> set:
+    """Ids of every `label` node in the database."""
+    return {record['id'] for record in neo4j.execute_cypher(f"MATCH (n:{label}) RETURN n.{key} AS id")}
+
+
 def load_shipments_and_relationships(neo4j: Neo4jConnection, data_path: Path):
     """Load shipments and create all relationships."""
-    df = pd.read_csv(data_path / 'shipments.csv')
-    logger.info(f"Loading {len(df)} shipments and relationships...")
-
-    for _, row in df.iterrows():
-        query = """
-        MATCH (s:Supplier {supplier_id: $supplier_id})
-        MATCH (p:Product {product_id: $product_id})
-        MATCH (w:Warehouse {warehouse_id: $warehouse_id})
-
-        // Create shipment
-        CREATE (sh:Shipment {
-            shipment_id: $shipment_id,
-            qty_units: $qty_units,
-            planned_lead_time_days: $planned_lead_time_days,
-            actual_lead_time_days: $actual_lead_time_days,
-            status: $status,
-            created_at: datetime()
-        })
+    logger.info("Loading shipments and relationships...")
+
+    loaded = skipped = 0
+    supplies_parts, stocked_parts = [], []
+
+    # A shipment (and every edge below) is only written when its supplier, product
+    # and warehouse all exist, as when each row MATCHed them before its CREATE
+    supplier_ids = _existing_ids(neo4j, 'Supplier', 'supplier_id')
+    product_ids = _existing_ids(neo4j, 'Product', 'product_id')
+    warehouse_ids = _existing_ids(neo4j, 'Warehouse', 'warehouse_id')
+
+    # Shipments and their per-shipment edges are written chunk by chunk
+    for df in _iter_csv_chunks(data_path / 'shipments.csv'):
+        known = (df['supplier_id'].isin(supplier_ids) & df['product_id'].isin(product_ids)
+                 & df['warehouse_id'].isin(warehouse_ids))
+        skipped += int((~known).sum())
+        df = df[known].astype({'qty_units': int, 'planned_lead_time_days': int})
+
+        # Phase 1: shipment nodes (disjoint keys, safe to write in parallel)
+        _run_iterate(neo4j, """
+            MERGE (sh:Shipment {shipment_id: row.shipment_id})
+            ON CREATE SET sh.created_at = datetime()
+            SET sh.qty_units = row.qty_units,
+                sh.planned_lead_time_days = row.planned_lead_time_days,
+                sh.actual_lead_time_days = row.planned_lead_time_days,
+                sh.status = row.status
+            """, df_records(df, ['shipment_id', 'qty_units', 'planned_lead_time_days', 'status']),
+            parallel=True)
+
+        # Phase 2: per-shipment CREATES / CONTAINS / DELIVERED_TO edges, MERGEd so a
+        # re-run or partial retry does not duplicate them; shipments share
+        # supplier/product/warehouse endpoints, so batches run sequentially
+        _run_iterate(neo4j, """
+            MATCH (sh:Shipment {shipment_id: row.shipment_id})
+            MATCH (s:Supplier {supplier_id: row.supplier_id})
+            MATCH (p:Product {product_id: row.product_id})
+            MATCH (w:Warehouse {warehouse_id: row.warehouse_id})
+            MERGE (s)-[cr:CREATES]->(sh)
+            ON CREATE SET cr.shipment_date = date()
+            SET cr.volume = row.qty_units
+            MERGE (sh)-[co:CONTAINS]->(p)
+            SET co.quantity = row.qty_units,
+                co.unit_cost = 15.0
+            MERGE (sh)-[d:DELIVERED_TO]->(w)
+            SET d.transport_mode = 'Ground',
+                d.tracking_status = row.status
+            """, df_records(df, ['shipment_id', 'supplier_id', 'product_id', 'warehouse_id', 'qty_units', 'status']),
+            parallel=False)
+
+        # Partial per-pair aggregates; combined across chunks for the pair phase
+        supplies_parts.append(df.groupby(['supplier_id', 'product_id'], as_index=False).agg(
+            total_volume=('qty_units', 'sum'),
+            lead_time_sum=('planned_lead_time_days', 'sum'),
+            shipments=('planned_lead_time_days', 'size')
+        ))
+        stocked_parts.append(df.groupby(['product_id', 'warehouse_id'], as_index=False).agg(
+            total_quantity=('qty_units', 'sum')
+        ))
+        loaded += len(df)
+        logger.info(f"  ... {loaded} shipments written")
+
+    if skipped:
+        logger.warning(f"Skipped {skipped} shipments with an unknown supplier, product or warehouse")
+
+    if not loaded:
+        logger.info("✅ Loaded 0 shipments and relationships")
+        return
 
-        // Create SUPPLIES relationship
-        MERGE (s)-[:SUPPLIES {
-            lead_time_days: $planned_lead_time_days,
-            reliability: s.reliability_score,
-            total_volume: $qty_units
-        }]->(p)
-
-        // Create STOCKED_AT relationship
-        MERGE (p)-[:STOCKED_AT {
-            current_inventory: $qty_units,
-            reorder_point: p.safety_stock,
-            max_capacity: $qty_units * 2
-        }]->(w)
-
-        // Create CREATES relationship
-        CREATE (s)-[:CREATES {
-            shipment_date: date(),
-            volume: $qty_units
-        }]->(sh)
-
-        // Create CONTAINS relationship
-        CREATE (sh)-[:CONTAINS {
-            quantity: $qty_units,
-            unit_cost: 15.0
-        }]->(p)
-
-        // Create DELIVERED_TO relationship
-        CREATE (sh)-[:DELIVERED_TO {
-            transport_mode: 'Ground',
-            tracking_status: $status
-        }]->(w)
-        """
-        params = {
-            'shipment_id': row['shipment_id'],
-            'supplier_id': row['supplier_id'],
-            'product_id': row['product_id'],
-            'warehouse_id': row['warehouse_id'],
-            'qty_units': int(row['qty_units']),
-            'planned_lead_time_days': int(row['planned_lead_time_days']),
-            'actual_lead_time_days': int(row['planned_lead_time_days']),
-            'status': row['status']
-        }
-        neo4j.execute_cypher(query, params)
-    logger.info(f"✅ Loaded {len(df)} shipments and relationships")
+    # Phase 3: one SUPPLIES / STOCKED_AT edge per distinct pair, written with the
+    # pair's totals (volume summed, lead time averaged over its shipments and
+    # rounded to whole days, keeping lead_time_days an integer as in setup_aura.py)
+    supplies = pd.concat(supplies_parts, ignore_index=True).groupby(
+        ['supplier_id', 'product_id'], as_index=False
+    ).sum()
+    supplies['lead_time_days'] = (supplies['lead_time_sum'] / supplies['shipments']).round().astype(int)
+    _run_batched(neo4j, """
+        UNWIND $rows AS row
+        MATCH (s:Supplier {supplier_id: row.supplier_id})
+        MATCH (p:Product {product_id: row.product_id})
+        MERGE (s)-[r:SUPPLIES]->(p)
+        SET r.lead_time_days = row.lead_time_days,
+            r.reliability = s.reliability_score,
+            r.total_volume = row.total_volume
+        """, df_records(supplies, ['supplier_id', 'product_id', 'lead_time_days', 'total_volume']))
+
+    stocked = pd.concat(stocked_parts, ignore_index=True).groupby(
+        ['product_id', 'warehouse_id'], as_index=False
+    ).sum()
+    _run_batched(neo4j, """
+        UNWIND $rows AS row
+        MATCH (p:Product {product_id: row.product_id})
+        MATCH (w:Warehouse {warehouse_id: row.warehouse_id})
+        MERGE (p)-[r:STOCKED_AT]->(w)
+        SET r.current_inventory = row.total_quantity,
+            r.reorder_point = p.safety_stock,
+            r.max_capacity = row.total_quantity * 2
+        """, df_records(stocked, ['product_id', 'warehouse_id', 'total_quantity']))
+
+    logger.info(f"✅ Loaded {loaded} shipments and relationships")
 
 
 def create_warehouse_customer_relationships(neo4j: Neo4jConnection):
     """Create relationships between warehouses and customers in the same region."""
     logger.info("Creating warehouse-customer relationships...")
+
+    # Region indexes turn the per-region lookups below into index seeks
+    neo4j.execute_cypher("CREATE INDEX warehouse_region_idx IF NOT EXISTS FOR (w:Warehouse) ON (w.region)")
+    neo4j.execute_cypher("CREATE INDEX customer_region_idx IF NOT EXISTS FOR (c:Customer) ON (c.region)")
+
+    regions = [
+        record['region'] for record in
+        neo4j.execute_cypher("MATCH (w:Warehouse) WHERE w.region IS NOT NULL RETURN DISTINCT w.region AS region")
+    ]
+
+    # Join warehouses and customers within each region rather than across all pairs
     query = """
-    MATCH (w:Warehouse), (c:Customer)
-    WHERE w.region = c.region
-    MERGE (w)-[:DELIVERS_TO {
-        avg_delivery_days: 2,
-        shipping_cost: 25.0,
-        service_level: 0.95
-    }]->(c)
+    UNWIND $regions AS region
+    MATCH (w:Warehouse {region: region})
+    MATCH (c:Customer {region: region})
+    MERGE (w)-[r:DELIVERS_TO]->(c)
+    ON CREATE SET r.avg_delivery_days = 2,
+                  r.shipping_cost = 25.0,
+                  r.service_level = 0.95
     """
-    neo4j.execute_cypher(query)
-    logger.info("✅ Created warehouse-customer relationships")
+    neo4j.execute_cypher(query, {'regions': regions})
+    logger.info(f"✅ Created warehouse-customer relationships across {len(regions)} regions")
+
+
+def _fill_defaults(df: pd.DataFrame, defaults: dict) -> pd.DataFrame:
+    """Add missing optional columns and fill their gaps with per-column defaults."""
+    for col, default in defaults.items():
+        df[col] = df[col].fillna(default) if col in df.columns else default
+    return df
+
+
+def _prepare_cold_chain_readings(df: pd.DataFrame) -> pd.DataFrame:
+    """Fill defaults and normalize cold chain reading columns, once per column."""
+    df = _fill_defaults(df, {
+        'shipment_id': '', 'lot_id': '', 'excursion_flag': 'NO', 'notes': '',
+        'threshold_min_c': 2.0, 'threshold_max_c': 8.0, 'excursion_duration_minutes': 0
+    })
+
+    # ISO timestamps ('T' separator) and typed numerics
+    df['timestamp'] = df['timestamp'].fillna('').astype(str).str.strip().str.replace(' ', 'T', regex=False)
+    df = df.astype({'temperature_c': float, 'threshold_min_c': float, 'threshold_max_c': float,
+                    'excursion_duration_minutes': int})
+    return df
 
 
 def load_pilot_supporting_data(neo4j: Neo4jConnection, data_path: Path):
@@ -209,208 +451,171 @@ def load_pilot_supporting_data(neo4j: Neo4jConnection, data_path: Path):
     # Load SLA Rules
     sla_file = pilot_path / 'sla_rules.csv'
     if sla_file.exists():
-        df = pd.read_csv(sla_file)
+        df = _read_csv(sla_file)
         logger.info(f"Loading {len(df)} SLA rules...")
-        for _, row in df.iterrows():
-            query = """
-            MERGE (s:SLARule {rule_id: $rule_id})
-            SET s.region = $region,
-                s.product_id = $product_id,
-                s.promised_days = $promised_days,
-                s.priority = $priority,
-                s.updated_at = datetime()
-            """
-            params = {
-                'rule_id': f"{row['region']}_{row['product_id']}",
-                'region': row['region'],
-                'product_id': row['product_id'],
-                'promised_days': int(row['promised_days']),
-                'priority': row.get('priority', 'MEDIUM')
-            }
-            neo4j.execute_cypher(query, params)
+
+        df = _fill_defaults(df, {'priority': 'MEDIUM'}).astype({'promised_days': int})
+        df['rule_id'] = df['region'].astype(str) + '_' + df['product_id'].astype(str)
+        query = """
+        MERGE (s:SLARule {rule_id: $rule_id})
+        SET s.region = $region,
+            s.product_id = $product_id,
+            s.promised_days = $promised_days,
+            s.priority = $priority,
+            s.updated_at = datetime()
+        """
+        _run_in_transactions(neo4j, query, df_records(df, [
+            'rule_id', 'region', 'product_id', 'promised_days', 'priority'
+        ]))
         logger.info(f"✅ Loaded {len(df)} SLA rules")
 
     # Load Lots
     lots_file = pilot_path / 'lots.csv'
     if lots_file.exists():
-        df = pd.read_csv(lots_file)
+        df = _read_csv(lots_file)
         logger.info(f"Loading {len(df)} lots...")
-        for _, row in df.iterrows():
-            query = """
-            MERGE (l:Lot {lot_id: $lot_id})
-            SET l.product_id = $product_id,
-                l.status = $status,
-                l.quality_status = $quality_status,
-                l.hold_reason = $hold_reason,
-                l.recall_status = $recall_status,
-                l.updated_at = datetime()
-            """
-            params = {
-                'lot_id': row['lot_id'],
-                'product_id': row['product_id'],
-                'status': row.get('status', 'ACTIVE'),
-                'quality_status': row.get('quality_status', 'OK'),
-                'hold_reason': row.get('hold_reason', ''),
-                'recall_status': row.get('recall_status', '')
-            }
-            neo4j.execute_cypher(query, params)
+
+        df = _fill_defaults(df, {'status': 'ACTIVE', 'quality_status': 'OK', 'hold_reason': '', 'recall_status': ''})
+        query = """
+        MERGE (l:Lot {lot_id: $lot_id})
+        SET l.product_id = $product_id,
+            l.status = $status,
+            l.quality_status = $quality_status,
+            l.hold_reason = $hold_reason,
+            l.recall_status = $recall_status,
+            l.updated_at = datetime()
+        """
+        _run_in_transactions(neo4j, query, df_records(df, [
+            'lot_id', 'product_id', 'status', 'quality_status', 'hold_reason', 'recall_status'
+        ]))
         logger.info(f"✅ Loaded {len(df)} lots")
 
     # Load Events
     events_file = pilot_path / 'events.csv'
     if events_file.exists():
-        df = pd.read_csv(events_file)
+        df = _read_csv(events_file, text_columns=('start_date', 'end_date'))
         logger.info(f"Loading {len(df)} events...")
-        for _, row in df.iterrows():
-            query = """
-            MERGE (e:Event {event_id: $event_id})
-            SET e.event_type = $event_type,
-                e.scope_type = $scope_type,
-                e.scope_id = $scope_id,
-                e.start_date = $start_date,
-                e.end_date = $end_date,
-                e.severity = $severity,
-                e.status = $status,
-                e.description = $description,
-                e.impact_value = $impact_value,
-                e.updated_at = datetime()
-            """
-            params = {
-                'event_id': row['event_id'],
-                'event_type': row['event_type'],
-                'scope_type': row.get('scope_type', ''),
-                'scope_id': row.get('scope_id', ''),
-                'start_date': str(row.get('start_date', '')),
-                'end_date': str(row.get('end_date', '')),
-                'severity': row.get('severity', 'MEDIUM'),
-                'status': row.get('status', 'ACTIVE'),
-                'description': row.get('description', ''),
-                'impact_value': int(row.get('impact_value', 0)) if pd.notna(row.get('impact_value')) else 0
-            }
-            neo4j.execute_cypher(query, params)
+
+        df = _fill_defaults(df, {
+            'scope_type': '', 'scope_id': '', 'start_date': '', 'end_date': '',
+            'severity': 'MEDIUM', 'status': 'ACTIVE', 'description': '', 'impact_value': 0
+        })
+        df['impact_value'] = pd.to_numeric(df['impact_value'], errors='coerce').fillna(0).astype('int64')
+        query = """
+        MERGE (e:Event {event_id: $event_id})
+        SET e.event_type = $event_type,
+            e.scope_type = $scope_type,
+            e.scope_id = $scope_id,
+            e.start_date = $start_date,
+            e.end_date = $end_date,
+            e.severity = $severity,
+            e.status = $status,
+            e.description = $description,
+            e.impact_value = $impact_value,
+            e.updated_at = datetime()
+        """
+        _run_in_transactions(neo4j, query, df_records(df, [
+            'event_id', 'event_type', 'scope_type', 'scope_id', 'start_date', 'end_date',
+            'severity', 'status', 'description', 'impact_value'
+        ]))
         logger.info(f"✅ Loaded {len(df)} events")
 
     # Load Costs
     costs_file = pilot_path / 'costs.csv'
     if costs_file.exists():
-        df = pd.read_csv(costs_file)
+        df = _read_csv(costs_file)
         logger.info(f"Loading {len(df)} cost records...")
-        for _, row in df.iterrows():
-            query = """
-            MERGE (c:Cost {cost_id: $cost_id})
-            SET c.cost_type = $cost_type,
-                c.region = $region,
-                c.value = $value,
-                c.currency = $currency,
-                c.updated_at = datetime()
-            """
-            params = {
-                'cost_id': f"{row['cost_type']}_{row['region']}",
-                'cost_type': row['cost_type'],
-                'region': row['region'],
-                'value': float(row['value']),
-                'currency': row.get('currency', 'USD')
-            }
-            neo4j.execute_cypher(query, params)
+
+        df = _fill_defaults(df, {'currency': 'USD'}).astype({'value': float})
+        df['cost_id'] = df['cost_type'].astype(str) + '_' + df['region'].astype(str)
+        query = """
+        MERGE (c:Cost {cost_id: $cost_id})
+        SET c.cost_type = $cost_type,
+            c.region = $region,
+            c.value = $value,
+            c.currency = $currency,
+            c.updated_at = datetime()
+        """
+        _run_in_transactions(neo4j, query, df_records(df, [
+            'cost_id', 'cost_type', 'region', 'value', 'currency'
+        ]))
         logger.info(f"✅ Loaded {len(df)} cost records")
 
     # Load Cold Chain Readings
     cold_chain_file = pilot_path / 'cold_chain_readings.csv'
     if cold_chain_file.exists():
-        df = pd.read_csv(cold_chain_file)
-        logger.info(f"Loading {len(df)} cold chain readings...")
-        for _, row in df.iterrows():
-            # Convert timestamp to ISO format (replace space with 'T')
-            timestamp_str = str(row.get('timestamp', '')).strip()
-            if timestamp_str and ' ' in timestamp_str:
-                timestamp_str = timestamp_str.replace(' ', 'T')
-
-            query = """
-            MERGE (r:ColdChainReading {reading_id: $reading_id})
-            SET r.shipment_id = $shipment_id,
-                r.lot_id = $lot_id,
-                r.timestamp = $timestamp,
-                r.temperature_c = $temperature_c,
-                r.threshold_min_c = $threshold_min_c,
-                r.threshold_max_c = $threshold_max_c,
-                r.excursion_flag = $excursion_flag,
-                r.excursion_duration_minutes = $excursion_duration_minutes,
-                r.notes = $notes,
-                r.updated_at = datetime()
-            """
-            params = {
-                'reading_id': row['reading_id'],
-                'shipment_id': row.get('shipment_id', ''),
-                'lot_id': row.get('lot_id', ''),
-                'timestamp': timestamp_str,
-                'temperature_c': float(row['temperature_c']),
-                'threshold_min_c': float(row.get('threshold_min_c', 2.0)),
-                'threshold_max_c': float(row.get('threshold_max_c', 8.0)),
-                'excursion_flag': row.get('excursion_flag', 'NO'),
-                'excursion_duration_minutes': int(row.get('excursion_duration_minutes', 0)) if pd.notna(row.get('excursion_duration_minutes')) else 0,
-                'notes': row.get('notes', '')
-            }
-            neo4j.execute_cypher(query, params)
-        logger.info(f"✅ Loaded {len(df)} cold chain readings")
+        logger.info("Loading cold chain readings...")
+        loaded = 0
+        for df in _iter_csv_chunks(cold_chain_file, text_columns=('timestamp', 'notes')):
+            _bulk_merge(neo4j, 'ColdChainReading', 'reading_id', _prepare_cold_chain_readings(df), [
+                'shipment_id', 'lot_id', 'timestamp', 'temperature_c', 'threshold_min_c',
+                'threshold_max_c', 'excursion_flag', 'excursion_duration_minutes', 'notes'
+            ], server_side=True)
+            loaded += len(df)
+            logger.info(f"  ... {loaded} readings written")
+        logger.info(f"✅ Loaded {loaded} cold chain readings")
 
     # Load Shipment-Lot mappings
     shipment_lots_file = pilot_path / 'shipments_lots.csv'
     if shipment_lots_file.exists():
-        df = pd.read_csv(shipment_lots_file)
+        df = _read_csv(shipment_lots_file, text_columns=('packing_date', 'shipping_date'))
         logger.info(f"Loading {len(df)} shipment-lot relationships...")
-        for _, row in df.iterrows():
-            query = """
-            MATCH (sh:Shipment {shipment_id: $shipment_id})
-            MATCH (l:Lot {lot_id: $lot_id})
-            MERGE (sh)-[r:CONTAINS_LOT]->(l)
-            SET r.quantity_units = $quantity_units,
-                r.packing_date = $packing_date,
-                r.shipping_date = $shipping_date,
-                r.temperature_monitored = $temperature_monitored,
-                r.notes = $notes
-            """
-            params = {
-                'shipment_id': row['shipment_id'],
-                'lot_id': row['lot_id'],
-                'quantity_units': int(row.get('quantity_units', 0)) if pd.notna(row.get('quantity_units')) else 0,
-                'packing_date': str(row.get('packing_date', '')),
-                'shipping_date': str(row.get('shipping_date', '')),
-                'temperature_monitored': row.get('temperature_monitored', 'NO'),
-                'notes': row.get('notes', '')
-            }
-            neo4j.execute_cypher(query, params)
+
+        df = _fill_defaults(df, {
+            'packing_date': '', 'shipping_date': '', 'temperature_monitored': 'NO', 'notes': '', 'quantity_units': 0
+        })
+        df['quantity_units'] = pd.to_numeric(df['quantity_units'], errors='coerce').fillna(0).astype('int64')
+        query = """
+        MATCH (sh:Shipment {shipment_id: $shipment_id})
+        MATCH (l:Lot {lot_id: $lot_id})
+        MERGE (sh)-[r:CONTAINS_LOT]->(l)
+        SET r.quantity_units = $quantity_units,
+            r.packing_date = $packing_date,
+            r.shipping_date = $shipping_date,
+            r.temperature_monitored = $temperature_monitored,
+            r.notes = $notes
+        """
+        _run_in_transactions(neo4j, query, df_records(df, [
+            'shipment_id', 'lot_id', 'quantity_units', 'packing_date', 'shipping_date',
+            'temperature_monitored', 'notes'
+        ]))
         logger.info(f"✅ Loaded {len(df)} shipment-lot relationships")
 
 
 def get_stats(neo4j: Neo4jConnection):
     """Get and display database statistics."""
-    stats_queries = {
-        'Suppliers': 'MATCH (s:Supplier) RETURN count(s) as count',
-        'Products': 'MATCH (p:Product) RETURN count(p) as count',
-        'Warehouses': 'MATCH (w:Warehouse) RETURN count(w) as count',
-        'Customers': 'MATCH (c:Customer) RETURN count(c) as count',
-        'Shipments': 'MATCH (sh:Shipment) RETURN count(sh) as count',
-        'SLA Rules': 'MATCH (s:SLARule) RETURN count(s) as count',
-        'Lots': 'MATCH (l:Lot) RETURN count(l) as count',
-        'Events': 'MATCH (e:Event) RETURN count(e) as count',
-        'Costs': 'MATCH (c:Cost) RETURN count(c) as count',
-        'Cold Chain Readings': 'MATCH (r:ColdChainReading) RETURN count(r) as count',
-        'SUPPLIES': 'MATCH ()-[r:SUPPLIES]-() RETURN count(r) as count',
-        'STOCKED_AT': 'MATCH ()-[r:STOCKED_AT]-() RETURN count(r) as count',
-        'CREATES': 'MATCH ()-[r:CREATES]-() RETURN count(r) as count',
-        'CONTAINS': 'MATCH ()-[r:CONTAINS]-() RETURN count(r) as count',
-        'DELIVERED_TO': 'MATCH ()-[r:DELIVERED_TO]-() RETURN count(r) as count',
-        'DELIVERS_TO': 'MATCH ()-[r:DELIVERS_TO]-() RETURN count(r) as count',
+    stats_patterns = {
+        'Suppliers': '(:Supplier)',
+        'Products': '(:Product)',
+        'Warehouses': '(:Warehouse)',
+        'Customers': '(:Customer)',
+        'Shipments': '(:Shipment)',
+        'SLA Rules': '(:SLARule)',
+        'Lots': '(:Lot)',
+        'Events': '(:Event)',
+        'Costs': '(:Cost)',
+        'Cold Chain Readings': '(:ColdChainReading)',
+        'SUPPLIES': '()-[:SUPPLIES]->()',
+        'STOCKED_AT': '()-[:STOCKED_AT]->()',
+        'CREATES': '()-[:CREATES]->()',
+        'CONTAINS': '()-[:CONTAINS]->()',
+        'DELIVERED_TO': '()-[:DELIVERED_TO]->()',
+        'DELIVERS_TO': '()-[:DELIVERS_TO]->()',
     }
 
+    # One round-trip: every count is a COUNT {} subquery in a single RETURN
+    query = "RETURN " + ",\n       ".join(
+        f"COUNT {{ {pattern} }} AS `{name}`" for name, pattern in stats_patterns.items()
+    )
+
     logger.info("\n📊 Database Statistics:")
-    for name, query in stats_queries.items():
-        try:
-            result = neo4j.execute_cypher(query)
-            count = result[0]['count'] if result else 0
-            logger.info(f"  {name}: {count}")
-        except Exception as e:
-            logger.error(f"  {name}: Error - {str(e)}")
+    try:
+        result = neo4j.execute_cypher(query)
+        counts = result[0] if result else {}
+        for name in stats_patterns:
+            logger.info(f"  {name}: {counts.get(name, 0)}")
+    except Exception as e:
+        logger.error(f"  Error - {str(e)}")
 
 
 def main():
@@ -437,6 +642,8 @@ def main():
             neo4j.execute_cypher("MATCH (n) DETACH DELETE n")
             logger.info("✅ Database cleared")
 
+        ensure_schema(neo4j)
+
         # Load core data
         load_suppliers(neo4j, data_path)
         load_products(neo4j, data_path)
@@ -11,9 +11,11 @@ This script loads the additional data files needed for the 5 pharmaceutical scen
 
 import os
 import sys
-import pandas as pd
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+import pyarrow as pa
+from pyarrow import csv as pa_csv
 
 # Add src to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
@@ -23,6 +25,24 @@ from utils import setup_logging, get_config
 
 logger = setup_logging()
 
+# Key constraints and indexes for core and pilot labels
+CONSTRAINTS_FILE = Path(__file__).parent.parent / 'neo4j' / 'constraints.cypher'
+
+# Pilot loaders and the loaders they must wait for, listed in a valid order.
+# Creating a relationship locks both of its end nodes, so loaders that MERGE
+# relationships onto the same Product, Shipment or Lot nodes form one chain
+# (which also orders lots before everything linking to them). Lanes only MERGE
+# their own nodes and run alongside the chain.
+LOAD_DEPENDENCIES = {
+    'sla_rules': (),
+    'lanes': (),
+    'costs': ('sla_rules',),
+    'lots': ('costs',),
+    'shipments_lots': ('lots',),
+    'cold_chain_readings': ('shipments_lots',),
+    'events': ('cold_chain_readings',),
+}
+
 
 class PilotDataLoader:
     """Load pilot supporting data files into Neo4j."""
@@ -32,19 +52,91 @@ class PilotDataLoader:
         self.config = get_config()
         self.data_dir = Path(__file__).parent.parent / 'data' / 'pilot_missing_supporting_files'
 
+        # Resolved once for the loader's lifetime
+        self.csv_paths = {name: self.data_dir / f'{name}.csv' for name in LOAD_DEPENDENCIES}
+        self.batch_size = self.config['neo4j']['batch_size']
+        self.write_concurrency = self.config['neo4j']['write_concurrency']
+
+    @staticmethod
+    def _load_after(loader, dependencies):
+        """Run `loader` once every dependency future has completed successfully."""
+        for dependency in dependencies:
+            dependency.result()
+        loader()
+
+    def _read_table(self, name, key, text_columns=()):
+        """Read a pilot CSV into an Arrow table with PyArrow's CSV reader.
+
+        No DataFrame is built. Columns in `text_columns` (dates and timestamps) are
+        kept as strings rather than inferred as temporal types, so they are written
+        to Neo4j exactly as they appear in the file.
+
+        Rows are de-duplicated on the MERGE `key`, keeping the last occurrence (the
+        one whose SET would win), and sorted by it, so Neo4j resolves each key once
+        and concurrent batches take their locks in a consistent order.
+        """
+        convert_options = pa_csv.ConvertOptions(column_types={col: pa.string() for col in text_columns})
+        table = pa_csv.read_csv(self.csv_paths[name], convert_options=convert_options)
+
+        last_row = {value: i for i, value in enumerate(table.column(key).to_pylist())}
+        if len(last_row) < table.num_rows:
+            logger.info(f"  Dropping {table.num_rows - len(last_row)} duplicate {key} rows")
+            table = table.take(sorted(last_row.values()))
+        return table.sort_by(key)
+
+    def _read_rows(self, name, key, text_columns=()):
+        """Read a pilot CSV straight into row dicts, unique and sorted on `key`."""
+        return self._read_table(name, key, text_columns).to_pylist()
+
+    def _write_columnar(self, query, table, param, concurrent=False):
+        """Write an Arrow table as column-oriented batches, one transaction each.
+
+        Each batch is sent as a single map of column name -> list of values, so Bolt
+        packs every key once per batch rather than once per row. The query unpacks
+        it with `UNWIND $param AS columns UNWIND range(0, size(columns.<key>) - 1) AS i`.
+        """
+        batches = [
+            {name: column.to_pylist() for name, column in zip(batch.schema.names, batch.columns)}
+            for batch in table.to_batches(max_chunksize=self.batch_size)
+        ]
+        self.neo4j.execute_batched(
+            query, batches, param=param, batch_size=1,
+            concurrency=self.write_concurrency if concurrent else 1
+        )
+
+    def _write_batched(self, query, rows, param, concurrent=False):
+        """Write `rows` through an UNWIND query reading them from `$param`, in batches.
+
+        `concurrent` sends several batches at once. Only for queries that MERGE nodes
+        on a unique key and nothing else: a query that also MERGEs relationships
+        locks the shared node at the other end (Product, Shipment, Lot) from every
+        batch, so those stay sequential.
+        """
+        self.neo4j.execute_batched(
+            query, rows, param=param, batch_size=self.batch_size,
+            concurrency=self.write_concurrency if concurrent else 1
+        )
+
     def load_all(self):
         """Load all pilot data files."""
         logger.info("Starting pilot data load...")
 
         try:
-            # Load in dependency order
-            self.load_sla_rules()
-            self.load_lanes()
-            self.load_costs()
-            self.load_lots()
-            self.load_shipments_lots()
-            self.load_cold_chain_readings()
-            self.load_events()
+            # Key constraints first, so every MERGE/MATCH on an id is an index seek
+            if not self.neo4j.execute_cypher_file(str(CONSTRAINTS_FILE)):
+                logger.warning("Could not apply schema constraints; loading without them")
+
+            # Each loader starts once the loaders it depends on have finished, so
+            # only loaders that take no shared node locks overlap
+            futures = {}
+            with ThreadPoolExecutor(max_workers=len(LOAD_DEPENDENCIES)) as pool:
+                for name, dependencies in LOAD_DEPENDENCIES.items():
+                    futures[name] = pool.submit(
+                        self._load_after, getattr(self, f'load_{name}'),
+                        [futures[dep] for dep in dependencies]
+                    )
+            for future in futures.values():
+                future.result()
 
             logger.info("✓ All pilot data loaded successfully")
 
@@ -56,7 +148,7 @@ class PilotDataLoader:
         """Load SLA rules."""
         logger.info("Loading SLA rules...")
 
-        df = pd.read_csv(self.data_dir / 'sla_rules.csv')
+        rules = self._read_rows('sla_rules', 'rule_id')
 
         # Create SLA rule nodes
         query = """
@@ -75,15 +167,14 @@ class PilotDataLoader:
         MERGE (s)-[:APPLIES_TO]->(p)
         """
 
-        rules = df.to_dict('records')
-        self.neo4j.execute_cypher(query, {'rules': rules})
+        self._write_batched(query, rules, 'rules')
         logger.info(f"✓ Loaded {len(rules)} SLA rules")
 
     def load_lanes(self):
         """Load logistics lanes."""
         logger.info("Loading lanes...")
 
-        df = pd.read_csv(self.data_dir / 'lanes.csv')
+        lanes = self._read_rows('lanes', 'lane_id')
 
         query = """
         UNWIND $lanes AS lane
@@ -97,15 +188,14 @@ class PilotDataLoader:
             l.capacity_units_per_week = toInteger(lane.capacity_units_per_week)
         """
 
-        lanes = df.to_dict('records')
-        self.neo4j.execute_cypher(query, {'lanes': lanes})
+        self._write_batched(query, lanes, 'lanes', concurrent=True)
         logger.info(f"✓ Loaded {len(lanes)} lanes")
 
     def load_costs(self):
         """Load cost information."""
         logger.info("Loading costs...")
 
-        df = pd.read_csv(self.data_dir / 'costs.csv')
+        costs = self._read_rows('costs', 'cost_id')
 
         query = """
         UNWIND $costs AS cost
@@ -127,15 +217,14 @@ class PilotDataLoader:
         MERGE (c)-[:APPLIES_TO]->(p)
         """
 
-        costs = df.to_dict('records')
-        self.neo4j.execute_cypher(query, {'costs': costs})
+        self._write_batched(query, costs, 'costs')
         logger.info(f"✓ Loaded {len(costs)} cost records")
 
     def load_lots(self):
         """Load lot/batch information."""
         logger.info("Loading lots...")
 
-        df = pd.read_csv(self.data_dir / 'lots.csv')
+        lots = self._read_rows('lots', 'lot_id', ('manufacturing_date', 'expiry_date'))
 
         query = """
         UNWIND $lots AS lot
@@ -158,15 +247,14 @@ class PilotDataLoader:
         MERGE (l)-[:BELONGS_TO]->(p)
         """
 
-        lots = df.to_dict('records')
-        self.neo4j.execute_cypher(query, {'lots': lots})
+        self._write_batched(query, lots, 'lots')
         logger.info(f"✓ Loaded {len(lots)} lots")
 
     def load_shipments_lots(self):
         """Load shipment-lot mapping."""
         logger.info("Loading shipment-lot mappings...")
 
-        df = pd.read_csv(self.data_dir / 'shipments_lots.csv')
+        mappings = self._read_rows('shipments_lots', 'shipment_lot_id', ('packing_date', 'shipping_date'))
 
         query = """
         UNWIND $mappings AS mapping
@@ -180,18 +268,33 @@ class PilotDataLoader:
             c.notes = mapping.notes
         """
 
-        mappings = df.to_dict('records')
-        self.neo4j.execute_cypher(query, {'mappings': mappings})
+        self._write_batched(query, mappings, 'mappings')
         logger.info(f"✓ Loaded {len(mappings)} shipment-lot mappings")
 
     def load_cold_chain_readings(self):
         """Load cold chain temperature readings."""
         logger.info("Loading cold chain readings...")
 
-        df = pd.read_csv(self.data_dir / 'cold_chain_readings.csv')
+        readings = self._read_table('cold_chain_readings', 'reading_id', ('timestamp',))
 
         query = """
-        UNWIND $readings AS reading
+        UNWIND $readings AS columns
+        UNWIND range(0, size(columns.reading_id) - 1) AS i
+        WITH {
+            reading_id: columns.reading_id[i],
+            shipment_id: columns.shipment_id[i],
+            lot_id: columns.lot_id[i],
+            timestamp: columns.timestamp[i],
+            temperature_c: columns.temperature_c[i],
+            humidity_percent: columns.humidity_percent[i],
+            location: columns.location[i],
+            device_id: columns.device_id[i],
+            threshold_min_c: columns.threshold_min_c[i],
+            threshold_max_c: columns.threshold_max_c[i],
+            excursion_flag: columns.excursion_flag[i],
+            excursion_duration_minutes: columns.excursion_duration_minutes[i],
+            notes: columns.notes[i]
+        } AS reading
         MERGE (r:ColdChainReading {reading_id: reading.reading_id})
         SET r.shipment_id = reading.shipment_id,
             r.lot_id = reading.lot_id,
@@ -217,15 +320,14 @@ class PilotDataLoader:
         MERGE (r)-[:TRACKS]->(l)
         """
 
-        readings = df.to_dict('records')
-        self.neo4j.execute_cypher(query, {'readings': readings})
-        logger.info(f"✓ Loaded {len(readings)} cold chain readings")
+        self._write_columnar(query, readings, 'readings')
+        logger.info(f"✓ Loaded {readings.num_rows} cold chain readings")
 
     def load_events(self):
         """Load scenario events."""
         logger.info("Loading events...")
 
-        df = pd.read_csv(self.data_dir / 'events.csv')
+        events = self._read_rows('events', 'event_id', ('start_date', 'end_date'))
 
         query = """
         UNWIND $events AS event
@@ -242,60 +344,60 @@ class PilotDataLoader:
             e.description = event.description
         """
 
-        events = df.to_dict('records')
-        self.neo4j.execute_cypher(query, {'events': events})
+        self._write_batched(query, events, 'events', concurrent=True)
 
         # Create relationships based on scope_type
-        self._link_events_to_entities(df)
+        self._link_events_to_entities(events)
 
         logger.info(f"✓ Loaded {len(events)} events")
 
-    def _link_events_to_entities(self, events_df):
-        """Link events to their target entities."""
+    def _link_events_to_entities(self, events):
+        """Link events to their target entities.
+
+        One UNWIND pass over all events; each CALL subquery handles one scope_type
+        and leaves the other rows untouched, so every row is routed to its MATCH.
+        """
+        query = """
+        UNWIND $events AS event
+        MATCH (e:Event {event_id: event.event_id})
 
-        # Link to suppliers
-        supplier_events = events_df[events_df['scope_type'] == 'SUPPLIER']
-        if not supplier_events.empty:
-            query = """
-            UNWIND $events AS event
-            MATCH (e:Event {event_id: event.event_id})
+        // Link to suppliers
+        CALL {
+            WITH e, event
+            WITH e, event WHERE event.scope_type = 'SUPPLIER'
             MATCH (s:Supplier {supplier_id: event.scope_id})
             MERGE (e)-[:IMPACTS]->(s)
-            """
-            self.neo4j.execute_cypher(query, {'events': supplier_events.to_dict('records')})
-
-        # Link to regions (warehouses in region)
-        region_events = events_df[events_df['scope_type'] == 'REGION']
-        if not region_events.empty:
-            query = """
-            UNWIND $events AS event
-            MATCH (e:Event {event_id: event.event_id})
+        }
+
+        // Link to regions (warehouses in region)
+        CALL {
+            WITH e, event
+            WITH e, event WHERE event.scope_type = 'REGION'
             MATCH (w:Warehouse {region: event.scope_id})
             MERGE (e)-[:IMPACTS]->(w)
-            """
-            self.neo4j.execute_cypher(query, {'events': region_events.to_dict('records')})
-
-        # Link to shipments
-        shipment_events = events_df[events_df['scope_type'] == 'SHIPMENT']
-        if not shipment_events.empty:
-            query = """
-            UNWIND $events AS event
-            MATCH (e:Event {event_id: event.event_id})
+        }
+
+        // Link to shipments
+        CALL {
+            WITH e, event
+            WITH e, event WHERE event.scope_type = 'SHIPMENT'
             MATCH (s:Shipment {shipment_id: event.scope_id})
             MERGE (e)-[:IMPACTS]->(s)
-            """
-            self.neo4j.execute_cypher(query, {'events': shipment_events.to_dict('records')})
-
-        # Link to lots
-        lot_events = events_df[events_df['scope_type'] == 'LOT']
-        if not lot_events.empty:
-            query = """
-            UNWIND $events AS event
-            MATCH (e:Event {event_id: event.event_id})
+        }
+
+        // Link to lots
+        CALL {
+            WITH e, event
+            WITH e, event WHERE event.scope_type = 'LOT'
             MATCH (l:Lot {lot_id: event.scope_id})
             MERGE (e)-[:IMPACTS]->(l)
-            """
-            self.neo4j.execute_cypher(query, {'events': lot_events.to_dict('records')})
+        }
+        """
+        linked = [
+            {'event_id': event['event_id'], 'scope_type': event['scope_type'], 'scope_id': event['scope_id']}
+            for event in events if event['scope_type'] in ('SUPPLIER', 'REGION', 'SHIPMENT', 'LOT')
+        ]
+        self._write_batched(query, linked, 'events')
 
     def verify_load(self):
         """Verify all data was loaded correctly."""
@@ -7,22 +7,65 @@ Automates the setup of Neo4j database with constraints, indexes, and data loadin
 
 import os
 import sys
+import shutil
 import logging
+import argparse
+import subprocess
 from pathlib import Path
 
 # Add src to path
 sys.path.append(str(Path(__file__).parent.parent / 'src'))
 
-from data_loader import DataLoader, Neo4jConnection
+from data_loader import DataLoader, Neo4jConnection, get_env_or_secret
 from utils import setup_logging, Timer
+from admin_import import prepare_admin_import
 
 logger = setup_logging()
 
 
-def main():
+def bulk_import(database: str):
+    """First-time load with the offline neo4j-admin importer.
+
+    Returns True/False for the import outcome, or None when the offline importer
+    is unavailable (Aura, or no neo4j-admin on PATH) and the Cypher load should
+    be used instead.
+    """
+    uri = get_env_or_secret('NEO4J_URI', 'bolt://localhost:7687')
+    if uri.startswith('neo4j+s://'):
+        logger.info("neo4j-admin import is not available on Aura; using the Cypher load")
+        return None
+    if shutil.which('neo4j-admin') is None:
+        logger.info("neo4j-admin not found on PATH; using the Cypher load")
+        return None
+
+    data_path = Path(get_env_or_secret('DATA_PATH', './data'))
+    with Timer("Preparing admin import files"):
+        command = prepare_admin_import(data_path, data_path / 'admin_import', database)
+
+    logger.info(f"Running offline import into '{database}' (the database must be stopped)...")
+    with Timer("neo4j-admin import"):
+        result = subprocess.run(command)
+
+    if result.returncode != 0:
+        logger.error("❌ neo4j-admin import failed")
+        return False
+
+    logger.info("✅ Offline import completed")
+    logger.info("\nNext steps:")
+    logger.info("1. Start the Neo4j database")
+    logger.info("2. Apply the schema: neo4j/constraints.cypher")
+    return True
+
+
+def main(bulk: bool = False, database: str = 'neo4j'):
     """Main setup function."""
     logger.info("🚀 Starting Neo4j Setup and Data Loading")
 
+    if bulk:
+        imported = bulk_import(database)
+        if imported is not None:
+            return imported
+
     try:
         # Initialize data loader
         logger.info("Initializing data loader...")
@@ -112,5 +155,12 @@ def main():
 
 
 if __name__ == "__main__":
-    success = main()
+    parser = argparse.ArgumentParser(description="Set up Neo4j and load the supply chain data")
+    parser.add_argument('--bulk', action='store_true',
+                        help="First-time load with offline neo4j-admin import (replaces the database; "
+                             "falls back to the Cypher load on Aura or without neo4j-admin)")
+    parser.add_argument('--database', default='neo4j', help="Target database for --bulk")
+    args = parser.parse_args()
+
+    success = main(bulk=args.bulk, database=args.database)
     sys.exit(0 if success else 1)
\ No newline at end of file
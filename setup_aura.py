@@ -9,7 +9,21 @@ from pathlib import Path
 
 sys.path.append('src')
 
-from data_loader import Neo4jConnection
+from data_loader import Neo4jConnection, df_records
+
+# Rows sent per UNWIND round-trip
+BATCH_SIZE = 10000
+
+
+# Batches in flight at once for node loads keyed on a unique id
+WRITE_CONCURRENCY = 4
+
+
+def _bulk_write(neo4j, query_tail, df, batch_size=BATCH_SIZE, concurrency=1):
+    """Run `UNWIND $rows AS row` + query_tail once per batch of DataFrame rows."""
+    neo4j.execute_batched("UNWIND $rows AS row\n" + query_tail, df_records(df),
+                          batch_size=batch_size, concurrency=concurrency)
+
 
 def load_data_to_aura():
     """Load CSV data to Neo4j Aura instance."""
@@ -42,106 +56,134 @@ def load_data_to_aura():
         
         # Load suppliers
         suppliers_df = pd.read_csv('data/suppliers.csv')
-        for _, row in suppliers_df.iterrows():
-            neo4j.execute_cypher("""
-                MERGE (s:Supplier {supplier_id: $supplier_id})
-                SET s.name = $name,
-                    s.region = $region,
-                    s.reliability_score = toFloat($reliability_score),
-                    s.avg_lead_time_days = toInteger($avg_lead_time_days),
-                    s.created_at = datetime(),
-                    s.updated_at = datetime()
-            """, row.to_dict())
+        _bulk_write(neo4j, """
+            MERGE (s:Supplier {supplier_id: row.supplier_id})
+            SET s.name = row.name,
+                s.region = row.region,
+                s.reliability_score = toFloat(row.reliability_score),
+                s.avg_lead_time_days = toInteger(row.avg_lead_time_days),
+                s.created_at = datetime(),
+                s.updated_at = datetime()
+        """, suppliers_df, concurrency=WRITE_CONCURRENCY)
         print(f"  ✅ Loaded {len(suppliers_df)} suppliers")
         
         # Load products
         products_df = pd.read_csv('data/products.csv')
-        for _, row in products_df.iterrows():
-            neo4j.execute_cypher("""
-                MERGE (p:Product {product_id: $product_id})
-                SET p.product_name = $product_name,
-                    p.category = $category,
-                    p.safety_stock = toInteger($safety_stock),
-                    p.demand_forecast = toInteger($demand_forecast),
-                    p.created_at = datetime(),
-                    p.updated_at = datetime()
-            """, row.to_dict())
+        _bulk_write(neo4j, """
+            MERGE (p:Product {product_id: row.product_id})
+            SET p.product_name = row.product_name,
+                p.category = row.category,
+                p.safety_stock = toInteger(row.safety_stock),
+                p.demand_forecast = toInteger(row.demand_forecast),
+                p.created_at = datetime(),
+                p.updated_at = datetime()
+        """, products_df, concurrency=WRITE_CONCURRENCY)
         print(f"  ✅ Loaded {len(products_df)} products")
         
         # Load warehouses
         warehouses_df = pd.read_csv('data/warehouses.csv')
-        for _, row in warehouses_df.iterrows():
-            neo4j.execute_cypher("""
-                MERGE (w:Warehouse {warehouse_id: $warehouse_id})
-                SET w.location = $location,
-                    w.capacity_units = toInteger($capacity_units),
-                    w.region = $region,
-                    w.created_at = datetime(),
-                    w.updated_at = datetime()
-            """, row.to_dict())
+        _bulk_write(neo4j, """
+            MERGE (w:Warehouse {warehouse_id: row.warehouse_id})
+            SET w.location = row.location,
+                w.capacity_units = toInteger(row.capacity_units),
+                w.region = row.region,
+                w.created_at = datetime(),
+                w.updated_at = datetime()
+        """, warehouses_df, concurrency=WRITE_CONCURRENCY)
         print(f"  ✅ Loaded {len(warehouses_df)} warehouses")
         
         # Load customers
         customers_df = pd.read_csv('data/customers.csv')
-        for _, row in customers_df.iterrows():
-            neo4j.execute_cypher("""
-                MERGE (c:Customer {customer_id: $customer_id})
-                SET c.name = $name,
-                    c.region = $region,
-                    c.avg_demand_units = toInteger($avg_demand_units),
-                    c.created_at = datetime(),
-                    c.updated_at = datetime()
-            """, row.to_dict())
+        _bulk_write(neo4j, """
+            MERGE (c:Customer {customer_id: row.customer_id})
+            SET c.name = row.name,
+                c.region = row.region,
+                c.avg_demand_units = toInteger(row.avg_demand_units),
+                c.created_at = datetime(),
+                c.updated_at = datetime()
+        """, customers_df, concurrency=WRITE_CONCURRENCY)
         print(f"  ✅ Loaded {len(customers_df)} customers")
         
         # Load shipments and relationships
         shipments_df = pd.read_csv('data/shipments.csv')
-        for _, row in shipments_df.iterrows():
-            neo4j.execute_cypher("""
-                MATCH (s:Supplier {supplier_id: $supplier_id})
-                MATCH (p:Product {product_id: $product_id})
-                MATCH (w:Warehouse {warehouse_id: $warehouse_id})
-                
-                CREATE (sh:Shipment {
-                    shipment_id: $shipment_id,
-                    qty_units: toInteger($qty_units),
-                    planned_lead_time_days: toInteger($planned_lead_time_days),
-                    actual_lead_time_days: toInteger($planned_lead_time_days),
-                    status: $status,
-                    created_at: datetime(),
-                    updated_at: datetime()
-                })
-                
-                MERGE (s)-[:SUPPLIES {
-                    lead_time_days: toInteger($planned_lead_time_days),
-                    reliability: s.reliability_score,
-                    last_shipment_date: date(),
-                    total_volume: toInteger($qty_units)
-                }]->(p)
-                
-                MERGE (p)-[:STOCKED_AT {
-                    current_inventory: toInteger($qty_units),
-                    last_updated: date(),
-                    reorder_point: p.safety_stock,
-                    max_capacity: toInteger($qty_units) * 2
-                }]->(w)
-                
-                CREATE (s)-[:CREATES {
-                    shipment_date: date(),
-                    volume: toInteger($qty_units)
-                }]->(sh)
-                
-                CREATE (sh)-[:CONTAINS {
-                    quantity: toInteger($qty_units),
-                    unit_cost: 15.0 + (toInteger($qty_units) * 0.01)
-                }]->(p)
-                
-                CREATE (sh)-[:DELIVERED_TO {
-                    delivery_date: date() + duration({days: toInteger($planned_lead_time_days)}),
-                    transport_mode: 'Ground',
-                    tracking_status: $status
-                }]->(w)
-            """, row.to_dict())
+
+        # Only rows whose supplier, product and warehouse exist produce a shipment;
+        # filtering up front keeps every pass below (including SUPPLIES and
+        # STOCKED_AT, which match just two of the three) to those same rows
+        shipments_df = shipments_df[
+            shipments_df['supplier_id'].isin(suppliers_df['supplier_id'])
+            & shipments_df['product_id'].isin(products_df['product_id'])
+            & shipments_df['warehouse_id'].isin(warehouses_df['warehouse_id'])
+        ]
+
+        # Shipment nodes
+        _bulk_write(neo4j, """
+            MATCH (s:Supplier {supplier_id: row.supplier_id})
+            MATCH (p:Product {product_id: row.product_id})
+            MATCH (w:Warehouse {warehouse_id: row.warehouse_id})
+            
+            CREATE (sh:Shipment {
+                shipment_id: row.shipment_id,
+                qty_units: toInteger(row.qty_units),
+                planned_lead_time_days: toInteger(row.planned_lead_time_days),
+                actual_lead_time_days: toInteger(row.planned_lead_time_days),
+                status: row.status,
+                created_at: datetime(),
+                updated_at: datetime()
+            })
+        """, shipments_df)
+
+        # Shipment relationships, one pass per type; each pass sends only the
+        # columns its query reads and matches only the endpoints it links
+        _bulk_write(neo4j, """
+            MATCH (s:Supplier {supplier_id: row.supplier_id})
+            MATCH (p:Product {product_id: row.product_id})
+            MERGE (s)-[:SUPPLIES {
+                lead_time_days: toInteger(row.planned_lead_time_days),
+                reliability: s.reliability_score,
+                last_shipment_date: date(),
+                total_volume: toInteger(row.qty_units)
+            }]->(p)
+        """, shipments_df[['supplier_id', 'product_id', 'planned_lead_time_days', 'qty_units']])
+
+        _bulk_write(neo4j, """
+            MATCH (p:Product {product_id: row.product_id})
+            MATCH (w:Warehouse {warehouse_id: row.warehouse_id})
+            MERGE (p)-[:STOCKED_AT {
+                current_inventory: toInteger(row.qty_units),
+                last_updated: date(),
+                reorder_point: p.safety_stock,
+                max_capacity: toInteger(row.qty_units) * 2
+            }]->(w)
+        """, shipments_df[['product_id', 'warehouse_id', 'qty_units']])
+
+        _bulk_write(neo4j, """
+            MATCH (sh:Shipment {shipment_id: row.shipment_id})
+            MATCH (s:Supplier {supplier_id: row.supplier_id})
+            CREATE (s)-[:CREATES {
+                shipment_date: date(),
+                volume: toInteger(row.qty_units)
+            }]->(sh)
+        """, shipments_df[['shipment_id', 'supplier_id', 'qty_units']])
+
+        _bulk_write(neo4j, """
+            MATCH (sh:Shipment {shipment_id: row.shipment_id})
+            MATCH (p:Product {product_id: row.product_id})
+            CREATE (sh)-[:CONTAINS {
+                quantity: toInteger(row.qty_units),
+                unit_cost: 15.0 + (toInteger(row.qty_units) * 0.01)
+            }]->(p)
+        """, shipments_df[['shipment_id', 'product_id', 'qty_units']])
+
+        _bulk_write(neo4j, """
+            MATCH (sh:Shipment {shipment_id: row.shipment_id})
+            MATCH (w:Warehouse {warehouse_id: row.warehouse_id})
+            CREATE (sh)-[:DELIVERED_TO {
+                delivery_date: date() + duration({days: toInteger(row.planned_lead_time_days)}),
+                transport_mode: 'Ground',
+                tracking_status: row.status
+            }]->(w)
+        """, shipments_df[['shipment_id', 'warehouse_id', 'planned_lead_time_days', 'status']])
         print(f"  ✅ Loaded {len(shipments_df)} shipments and relationships")
         
         # Create warehouse-customer relationships
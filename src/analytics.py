@@ -5,6 +5,7 @@ Advanced analytics, risk scoring, and KPI calculations for the supply chain cont
 """
 
 import logging
+import threading
 import pandas as pd
 import numpy as np
 import networkx as nx
@@ -21,6 +22,8 @@ from utils import get_config, Timer, generate_risk_score, SupplyChainMetrics
 warnings.filterwarnings('ignore')
 logger = logging.getLogger(__name__)
 
+RISK_CATEGORY_DTYPE = pd.CategoricalDtype(['Low', 'Medium', 'High'], ordered=True)
+
 
 class SupplyChainAnalytics:
     """
@@ -38,8 +41,10 @@ class SupplyChainAnalytics:
         self.graph_builder = SupplyChainGraphBuilder(self.neo4j)
         self.config = get_config()
 
-        # Analytics cache
+        # Analytics cache; the dashboard also fills it from a warm-up thread, so
+        # writes (and the overview bundle build) are serialized
         self._cache = {}
+        self._cache_lock = threading.RLock()
         self._last_refresh = None
 
         # Initialize data
@@ -54,8 +59,18 @@ class SupplyChainAnalytics:
 
     def _refresh_cache(self):
         """Refresh analytics cache."""
-        self._cache = {}
-        self._last_refresh = datetime.now()
+        with self._cache_lock:
+            self._cache = {}
+            self._last_refresh = datetime.now()
+
+    def _cache_put(self, key: str, value: Any):
+        """Store an analytics result under the cache lock."""
+        with self._cache_lock:
+            self._cache[key] = value
+
+    def _nodes_of_type(self, node_type: str) -> List[Tuple[str, Dict[str, Any]]]:
+        """Get (node, attributes) pairs for one node type from the builder's type index."""
+        return [(node, self.graph.nodes[node]) for node in self.graph_builder.get_nodes_by_type(node_type)]
 
     def get_supplier_risk_analysis(self, include_clustering: bool = True) -> pd.DataFrame:
         """
@@ -71,10 +86,7 @@ class SupplyChainAnalytics:
             # Get supplier data from graph
             suppliers_data = []
 
-            for node, data in self.graph.nodes(data=True):
-                if data.get('node_type') != 'supplier':
-                    continue
-
+            for node, data in self._nodes_of_type('supplier'):
                 supplier_id = node
                 supplier_data = data
 
@@ -146,6 +158,8 @@ class SupplyChainAnalytics:
                 })
 
             df = pd.DataFrame(suppliers_data)
+            if not df.empty:
+                df = df.astype({'risk_category': RISK_CATEGORY_DTYPE, 'region': 'category'})
 
             # Add clustering analysis
             if include_clustering and len(df) > 3:
@@ -154,7 +168,7 @@ class SupplyChainAnalytics:
             # Sort by risk score
             df = df.sort_values('overall_risk_score', ascending=False)
 
-            self._cache[cache_key] = df
+            self._cache_put(cache_key, df)
             return df
 
     def _add_supplier_clustering(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -207,10 +221,10 @@ class SupplyChainAnalytics:
 
             # Basic network statistics
             metrics['network'] = {
-                'total_suppliers': len([n for n, d in self.graph.nodes(data=True) if d.get('node_type') == 'supplier']),
-                'total_products': len([n for n, d in self.graph.nodes(data=True) if d.get('node_type') == 'product']),
-                'total_warehouses': len([n for n, d in self.graph.nodes(data=True) if d.get('node_type') == 'warehouse']),
-                'total_customers': len([n for n, d in self.graph.nodes(data=True) if d.get('node_type') == 'customer']),
+                'total_suppliers': len(self.graph_builder.get_nodes_by_type('supplier')),
+                'total_products': len(self.graph_builder.get_nodes_by_type('product')),
+                'total_warehouses': len(self.graph_builder.get_nodes_by_type('warehouse')),
+                'total_customers': len(self.graph_builder.get_nodes_by_type('customer')),
                 'total_relationships': self.graph.number_of_edges(),
                 'network_density': nx.density(self.graph)
             }
@@ -218,10 +232,9 @@ class SupplyChainAnalytics:
             # Supplier performance
             supplier_reliabilities = []
             supplier_lead_times = []
-            for node, data in self.graph.nodes(data=True):
-                if data.get('node_type') == 'supplier':
-                    supplier_reliabilities.append(data.get('reliability', 0.5))
-                    supplier_lead_times.append(data.get('lead_time', 10))
+            for node, data in self._nodes_of_type('supplier'):
+                supplier_reliabilities.append(data.get('reliability', 0.5))
+                supplier_lead_times.append(data.get('lead_time', 10))
 
             metrics['supplier_performance'] = {
                 'average_reliability': np.mean(supplier_reliabilities) if supplier_reliabilities else 0,
@@ -234,13 +247,21 @@ class SupplyChainAnalytics:
             # Regional distribution
             regional_stats = self._calculate_regional_statistics()
             metrics['regional'] = regional_stats
+            region_names = sorted(regional_stats)
+            metrics['regional_arrays'] = {
+                'names': region_names,
+                'suppliers': [regional_stats[region]['suppliers'] for region in region_names]
+            }
 
             # Risk assessment
             risk_analysis = self.get_supplier_risk_analysis(include_clustering=False)
+            category_counts = (
+                risk_analysis['risk_category'].value_counts() if len(risk_analysis) > 0 else pd.Series(dtype=int)
+            )
             metrics['risk'] = {
-                'high_risk_suppliers': len(risk_analysis[risk_analysis['risk_category'] == 'High']),
-                'medium_risk_suppliers': len(risk_analysis[risk_analysis['risk_category'] == 'Medium']),
-                'low_risk_suppliers': len(risk_analysis[risk_analysis['risk_category'] == 'Low']),
+                'high_risk_suppliers': int(category_counts.get('High', 0)),
+                'medium_risk_suppliers': int(category_counts.get('Medium', 0)),
+                'low_risk_suppliers': int(category_counts.get('Low', 0)),
                 'average_risk_score': risk_analysis['overall_risk_score'].mean() if len(risk_analysis) > 0 else 0,
                 'top_risk_supplier': risk_analysis.iloc[0]['supplier_name'] if len(risk_analysis) > 0 else 'None'
             }
@@ -254,9 +275,34 @@ class SupplyChainAnalytics:
             # Critical path analysis
             metrics['critical_paths'] = self._identify_critical_supply_paths()
 
-            self._cache[cache_key] = metrics
+            self._cache_put(cache_key, metrics)
             return metrics
 
+    def get_overview_bundle(self) -> Dict[str, Any]:
+        """
+        Get dashboard metrics, predictive insights, and benchmark results in one call.
+
+        Lets the dashboard render the overview and analytics pages from a single fetch.
+        """
+        cache_key = "overview_bundle"
+        # Held for the whole build, so a concurrent caller waits for the bundle
+        # instead of computing it a second time
+        with self._cache_lock:
+            if cache_key in self._cache:
+                return self._cache[cache_key]
+
+            with Timer("Building overview bundle"):
+                bundle = {
+                    'metrics': self.get_performance_dashboard_metrics(),
+                    'insights': self.generate_predictive_insights(),
+                    'benchmark': self.benchmark_performance(),
+                    # Cheap identity for caching views derived from this bundle
+                    'generated_at': datetime.now().isoformat()
+                }
+
+                self._cache_put(cache_key, bundle)
+                return bundle
+
     def _calculate_regional_statistics(self) -> Dict[str, Any]:
         """Calculate regional distribution statistics."""
         regional_data = {}
@@ -294,13 +340,12 @@ class SupplyChainAnalytics:
     def _calculate_supply_chain_health(self) -> Dict[str, float]:
         """Calculate overall supply chain health metrics."""
         # Reliability health
-        reliabilities = [d.get('reliability', 0.5) for n, d in self.graph.nodes(data=True)
-                        if d.get('node_type') == 'supplier']
+        suppliers = self._nodes_of_type('supplier')
+        reliabilities = [d.get('reliability', 0.5) for n, d in suppliers]
         reliability_health = np.mean(reliabilities) * 100 if reliabilities else 50
 
         # Lead time health (inverse - shorter is better)
-        lead_times = [d.get('lead_time', 10) for n, d in self.graph.nodes(data=True)
-                     if d.get('node_type') == 'supplier']
+        lead_times = [d.get('lead_time', 10) for n, d in suppliers]
         avg_lead_time = np.mean(lead_times) if lead_times else 10
         lead_time_health = max(0, 100 - (avg_lead_time / 30 * 100))
 
@@ -310,7 +355,7 @@ class SupplyChainAnalytics:
         # Risk distribution health
         risk_df = self.get_supplier_risk_analysis(include_clustering=False)
         if len(risk_df) > 0:
-            low_risk_pct = len(risk_df[risk_df['risk_category'] == 'Low']) / len(risk_df) * 100
+            low_risk_pct = (risk_df['risk_category'] == 'Low').mean() * 100
         else:
             low_risk_pct = 50
 
@@ -328,14 +373,12 @@ class SupplyChainAnalytics:
 
     def _calculate_capacity_metrics(self) -> Dict[str, Any]:
         """Calculate capacity and utilization metrics."""
-        warehouses = [(n, d) for n, d in self.graph.nodes(data=True)
-                     if d.get('node_type') == 'warehouse']
+        warehouses = self._nodes_of_type('warehouse')
 
         total_capacity = sum(d.get('capacity', 0) for _, d in warehouses)
 
         # Calculate current utilization (mock calculation based on demand)
-        products = [(n, d) for n, d in self.graph.nodes(data=True)
-                   if d.get('node_type') == 'product']
+        products = self._nodes_of_type('product')
         total_demand = sum(d.get('demand', 0) for _, d in products)
 
         utilization_rate = (total_demand / total_capacity * 100) if total_capacity > 0 else 0
@@ -407,6 +450,10 @@ class SupplyChainAnalytics:
 
     def generate_predictive_insights(self) -> List[Dict[str, Any]]:
         """Generate predictive insights and recommendations."""
+        cache_key = "predictive_insights"
+        if cache_key in self._cache:
+            return self._cache[cache_key]
+
         insights = []
 
         # Supplier reliability insights
@@ -477,10 +524,15 @@ class SupplyChainAnalytics:
                 'metric_value': metrics['network']['network_density']
             })
 
+        self._cache_put(cache_key, insights)
         return insights
 
     def benchmark_performance(self, timeframe: str = 'current') -> Dict[str, Any]:
         """Benchmark supply chain performance against industry standards."""
+        cache_key = f"benchmark_{timeframe}"
+        if cache_key in self._cache:
+            return self._cache[cache_key]
+
         metrics = self.get_performance_dashboard_metrics()
 
         # Industry benchmarks (mock data - in real implementation, these would come from external sources)
@@ -517,7 +569,7 @@ class SupplyChainAnalytics:
                 'performance_level': 'Poor' if gap > 20 else 'Fair' if gap > 0 else 'Good' if gap > -10 else 'Excellent'
             }
 
-        return {
+        benchmark = {
             'timeframe': timeframe,
             'benchmark_date': datetime.now().isoformat(),
             'performance_gaps': performance_gaps,
@@ -525,6 +577,9 @@ class SupplyChainAnalytics:
             'recommendations': self._generate_benchmark_recommendations(performance_gaps)
         }
 
+        self._cache_put(cache_key, benchmark)
+        return benchmark
+
     def _calculate_overall_benchmark_score(self, gaps: Dict[str, Dict[str, Any]]) -> float:
         """Calculate overall benchmark performance score."""
         scores = []
@@ -5,11 +5,14 @@ Handles CSV data loading, Neo4j connectivity, and data validation.
 """
 
 import os
+import asyncio
+import threading
 import pandas as pd
 import logging
 from typing import Dict, List, Optional, Any
+from contextlib import contextmanager
 from py2neo import Graph, Node, Relationship
-from neo4j import GraphDatabase
+from neo4j import GraphDatabase, AsyncGraphDatabase
 from dotenv import load_dotenv
 from datetime import datetime
 import traceback
@@ -31,6 +34,18 @@ def get_env_or_secret(key: str, default: str = None) -> str:
     return os.getenv(key, default)
 
 
+def df_records(df: pd.DataFrame, columns: List[str] = None) -> List[Dict]:
+    """Row dicts for `columns` (default: all), built from one .tolist() per column.
+
+    .tolist() converts each column to native Python ints/floats/strs in a single pass,
+    which is much cheaper than to_dict('records') boxing every cell individually, and
+    yields values the Neo4j driver can send as parameters.
+    """
+    columns = list(df.columns) if columns is None else list(columns)
+    values = [df[col].tolist() for col in columns]
+    return [dict(zip(columns, row)) for row in zip(*values)]
+
+
 class Neo4jConnection:
     """Manages Neo4j database connections and operations."""
 
@@ -44,6 +59,12 @@ class Neo4jConnection:
 
         self.driver = None
         self.graph = None
+        # Async driver for concurrent batched writes, created on first use. An async
+        # driver is bound to the event loop it runs on, so the connection keeps one
+        # loop for it; the lock stops two threads running that loop at once.
+        self._async_driver = None
+        self._async_loop = None
+        self._async_lock = threading.Lock()
         self._connect()
 
     def _connect(self):
@@ -76,10 +97,22 @@ class Neo4jConnection:
 
     def close(self):
         """Close database connections."""
+        if self._async_loop:
+            with self._async_lock:
+                if self._async_driver:
+                    self._async_loop.run_until_complete(self._async_driver.close())
+                self._async_loop.close()
+                self._async_driver = self._async_loop = None
         if self.driver:
             self.driver.close()
             logger.info("Neo4j connection closed")
 
+    @contextmanager
+    def session(self):
+        """Yield a driver session for callers that manage their own transactions."""
+        with self.driver.session() as session:
+            yield session
+
     def execute_cypher(self, query: str, parameters: Dict = None) -> List[Dict]:
         """Execute a Cypher query and return results."""
         try:
@@ -91,18 +124,71 @@ class Neo4jConnection:
             logger.error(f"Query: {query}")
             raise
 
+    def execute_batched(self, query: str, rows: List[Dict], param: str = 'rows',
+                        batch_size: int = 10000, concurrency: int = 1):
+        """Run an UNWIND query over `rows` in slices, one managed write transaction each.
+
+        The query reads its slice from the `param` parameter. With `concurrency` > 1, up
+        to that many slices are in flight at once over the async driver; meant for writes
+        whose slices touch disjoint nodes (e.g. MERGE on a unique key). Lock conflicts
+        that do occur are retried by the managed transactions.
+        """
+        try:
+            if concurrency > 1 and len(rows) > batch_size:
+                with self._async_lock:
+                    if self._async_loop is None:
+                        self._async_loop = asyncio.new_event_loop()
+                    self._async_loop.run_until_complete(
+                        self._execute_batched_async(query, rows, param, batch_size, concurrency)
+                    )
+                return
+
+            def write(tx, batch):
+                tx.run(query, {param: batch}).consume()
+
+            with self.driver.session() as session:
+                for start in range(0, len(rows), batch_size):
+                    session.execute_write(write, rows[start:start + batch_size])
+        except Exception as e:
+            logger.error(f"Error executing batched Cypher query: {str(e)}")
+            logger.error(f"Query: {query}")
+            raise
+
+    async def _execute_batched_async(self, query: str, rows: List[Dict], param: str,
+                                     batch_size: int, concurrency: int):
+        """Write the slices of `rows` concurrently, at most `concurrency` at a time."""
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def work(tx, batch):
+            result = await tx.run(query, {param: batch})
+            await result.consume()
+
+        if self._async_driver is None:
+            self._async_driver = AsyncGraphDatabase.driver(self.uri, auth=(self.user, self.password))
+
+        async def write(batch):
+            async with semaphore:
+                async with self._async_driver.session() as session:
+                    await session.execute_write(work, batch)
+
+        await asyncio.gather(*(
+            write(rows[start:start + batch_size]) for start in range(0, len(rows), batch_size)
+        ))
+
     def execute_cypher_file(self, file_path: str) -> bool:
         """Execute Cypher queries from a file."""
         try:
             with open(file_path, 'r') as file:
                 content = file.read()
 
-            # Split by semicolon and execute each query
+            # Drop comment lines, then split by semicolon and execute each query
+            content = '\n'.join(
+                line for line in content.splitlines() if not line.strip().startswith('//')
+            )
             queries = [q.strip() for q in content.split(';') if q.strip()]
 
             for query in queries:
-                if query and not query.startswith('//'):  # Skip comments
-                    self.execute_cypher(query)
+                self.execute_cypher(query)
 
             logger.info(f"Successfully executed queries from {file_path}")
             return True
@@ -5,6 +5,7 @@ Builds NetworkX graphs from Neo4j data and provides graph analysis capabilities.
 """
 
 import logging
+from collections import defaultdict
 import networkx as nx
 import pandas as pd
 from typing import Dict, List, Tuple, Any, Optional
@@ -12,6 +13,12 @@ from data_loader import Neo4jConnection
 from utils import get_config, Timer
 import numpy as np
 
+try:
+    import nx_cugraph  # noqa: F401  # registers the GPU dispatch backend
+    CENTRALITY_BACKEND = 'cugraph'
+except ImportError:
+    CENTRALITY_BACKEND = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -23,6 +30,11 @@ class SupplyChainGraphBuilder:
         self.config = get_config()
         self.graph = None
         self.node_positions = None
+        self.nodes_by_type: Dict[str, List[str]] = defaultdict(list)
+        self._nodes_by_type_stamp = None
+        self.suppliers_df = pd.DataFrame(columns=['id', 'name', 'region', 'reliability', 'lead_time'])
+        # Bumped whenever suppliers_df is rebuilt so callers can key caches on it
+        self.suppliers_version = 0
 
     def _extract_properties(self, entity: Any) -> Dict[str, Any]:
         """Safely extract property dictionaries from Neo4j entities."""
@@ -86,10 +98,45 @@ class SupplyChainGraphBuilder:
             self._add_event_relationships(graph)
 
             self.graph = graph
+            self._index_nodes_by_type(graph)
             logger.info(f"Graph built: {graph.number_of_nodes()} nodes, {graph.number_of_edges()} edges")
 
             return graph
 
+    @staticmethod
+    def _graph_stamp(graph: nx.DiGraph) -> Tuple[int, int]:
+        """Cheap identity of a graph's node set: the graph object and its node count.
+
+        Does not notice a node whose node_type changes in place, or an addition
+        paired with a removal; code that does either must call
+        _index_nodes_by_type itself.
+        """
+        return id(graph), graph.number_of_nodes()
+
+    def _index_nodes_by_type(self, graph: nx.DiGraph):
+        """Index node ids by node_type in a single pass over the graph."""
+        nodes_by_type = defaultdict(list)
+        for node, data in graph.nodes(data=True):
+            nodes_by_type[data.get('node_type', 'unknown')].append(node)
+        self.nodes_by_type = nodes_by_type
+        self._nodes_by_type_stamp = self._graph_stamp(graph)
+
+    def _current_nodes_by_type(self) -> Dict[str, List[str]]:
+        """Node type index for the current graph, rebuilt if its stamp is stale.
+
+        Catches the graph being replaced or gaining or losing nodes since the index
+        was built; see _graph_stamp for what it does not catch.
+        """
+        if self.graph is None:
+            return {}
+        if self._nodes_by_type_stamp != self._graph_stamp(self.graph):
+            self._index_nodes_by_type(self.graph)
+        return self.nodes_by_type
+
+    def get_nodes_by_type(self, node_type: str) -> List[str]:
+        """Get the ids of all nodes of the given type."""
+        return self._current_nodes_by_type().get(node_type, [])
+
     def _add_supplier_nodes(self, graph: nx.DiGraph):
         """Add supplier nodes to the graph."""
         query = """
@@ -99,17 +146,28 @@ class SupplyChainGraphBuilder:
         """
 
         result = self.neo4j.execute_cypher(query)
-        for record in result:
-            graph.add_node(
-                record['id'],
-                node_type='supplier',
-                name=record['name'],
-                region=record['region'],
-                reliability=record['reliability'],
-                lead_time=record['lead_time'],
-                size=800,  # For visualization
-                color='lightblue'
+
+        # Columnar copy of supplier attributes for vectorized lookups
+        self.suppliers_df = pd.DataFrame.from_records(
+            result, columns=['id', 'name', 'region', 'reliability', 'lead_time']
+        )
+        self.suppliers_version += 1
+
+        graph.add_nodes_from(
+            (supplier_id, {
+                'node_type': 'supplier',
+                'name': name,
+                'region': region,
+                'reliability': reliability,
+                'lead_time': lead_time,
+                'size': 800,  # For visualization
+                'color': 'lightblue'
+            })
+            for supplier_id, name, region, reliability, lead_time in zip(
+                self.suppliers_df['id'], self.suppliers_df['name'], self.suppliers_df['region'],
+                self.suppliers_df['reliability'], self.suppliers_df['lead_time']
             )
+        )
 
         logger.info(f"Added {len(result)} supplier nodes")
 
@@ -823,6 +881,15 @@ class SupplyChainGraphBuilder:
 
         return pos
 
+    def _run_centrality(self, algorithm, **kwargs) -> Dict[str, float]:
+        """Run a centrality algorithm on the GPU backend when available, else on CPU."""
+        if CENTRALITY_BACKEND:
+            try:
+                return dict(algorithm(self.graph, backend=CENTRALITY_BACKEND, **kwargs))
+            except Exception as e:
+                logger.warning(f"{CENTRALITY_BACKEND} backend failed for {algorithm.__name__}, using CPU: {str(e)}")
+        return algorithm(self.graph, **kwargs)
+
     def get_graph_statistics(self) -> Dict[str, Any]:
         """Get comprehensive graph statistics."""
         if self.graph is None:
@@ -841,18 +908,16 @@ class SupplyChainGraphBuilder:
         }
 
         # Count nodes by type
-        for node, data in self.graph.nodes(data=True):
-            node_type = data.get('node_type', 'unknown')
-            stats['node_types'][node_type] = stats['node_types'].get(node_type, 0) + 1
+        stats['node_types'] = {node_type: len(nodes) for node_type, nodes in self._current_nodes_by_type().items()}
 
         # Calculate centrality measures
         try:
-            stats['centrality']['degree'] = nx.degree_centrality(self.graph)
-            stats['centrality']['betweenness'] = nx.betweenness_centrality(self.graph)
+            stats['centrality']['degree'] = self._run_centrality(nx.degree_centrality)
+            stats['centrality']['betweenness'] = self._run_centrality(nx.betweenness_centrality)
             stats['centrality']['closeness'] = nx.closeness_centrality(self.graph)
 
             # Page rank for directed graphs
-            stats['centrality']['pagerank'] = nx.pagerank(self.graph)
+            stats['centrality']['pagerank'] = self._run_centrality(nx.pagerank)
         except Exception as e:
             logger.warning(f"Error calculating centrality: {str(e)}")
 
@@ -876,10 +941,8 @@ class SupplyChainGraphBuilder:
         if self.graph is None:
             return []
 
-        source_nodes = [n for n, d in self.graph.nodes(data=True)
-                       if d.get('node_type') == source_type]
-        target_nodes = [n for n, d in self.graph.nodes(data=True)
-                       if d.get('node_type') == target_type]
+        source_nodes = self.get_nodes_by_type(source_type)
+        target_nodes = self.get_nodes_by_type(target_type)
 
         paths = []
         for source in source_nodes:
@@ -900,8 +963,7 @@ class SupplyChainGraphBuilder:
         if self.graph is None:
             return pd.DataFrame()
 
-        suppliers = [n for n, d in self.graph.nodes(data=True)
-                    if d.get('node_type') == 'supplier']
+        suppliers = self.get_nodes_by_type('supplier')
 
         criticality_data = []
         for supplier in suppliers:
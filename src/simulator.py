@@ -113,6 +113,11 @@ class SupplyChainSimulator:
                     how='left'
                 )
 
+            # Low-cardinality keys as categoricals: O(1) unique lookups and faster groupby
+            for col in ['warehouse_region', 'supplier_id']:
+                if col in self.shipments_df.columns:
+                    self.shipments_df[col] = self.shipments_df[col].astype('category')
+
             self.baseline_metrics = self._calculate_baseline_metrics()
             logger.info("Baseline data loaded for simulation analytics")
         except Exception as e:
@@ -265,6 +270,8 @@ class SupplyChainSimulator:
             logger.warning("No SLA rules found; using default threshold")
             return {}
 
+        # Unparseable promised_days become nulls and are dropped with the others
+        sla_df['promised_days'] = pd.to_numeric(sla_df['promised_days'], errors='coerce')
         sla_df = sla_df.dropna(subset=['region', 'product_id', 'promised_days'])
         sla_df['promised_days'] = sla_df['promised_days'].astype(int)
 
@@ -274,13 +281,11 @@ class SupplyChainSimulator:
 
         # Select the most stringent SLA (lowest promised days, highest priority)
         sla_df = sla_df.sort_values(['region', 'product_id', 'promised_days', 'priority_rank'])
-        sla_lookup = {}
-        for _, row in sla_df.iterrows():
-            key = (row['region'], row['product_id'])
-            if key not in sla_lookup:
-                sla_lookup[key] = int(row['promised_days'])
-
-        return sla_lookup
+        best = sla_df.drop_duplicates(['region', 'product_id'])
+        return dict(zip(
+            zip(best['region'], best['product_id']),
+            best['promised_days'].astype(int).tolist()
+        ))
 
     def _load_sla_rules_from_csv(self) -> pd.DataFrame:
         """Fallback: load SLA rules from local CSV."""
@@ -406,6 +411,13 @@ class SupplyChainSimulator:
             else:
                 logger.warning(f"Lots CSV not found at {lots_file}")
 
+        if not lots_df.empty:
+            # Flag recalled lots once so callers can filter without per-request string ops
+            recall_cols = [col for col in ['recall_status', 'status'] if col in lots_df.columns]
+            lots_df['is_recall'] = lots_df[recall_cols].apply(
+                lambda col: col.astype('string').str.upper().str.contains('RECALL', na=False)
+            ).any(axis=1)
+
         return lots_df
 
     def _load_shipment_schedule(self) -> pd.DataFrame:
@@ -582,7 +594,7 @@ class SupplyChainSimulator:
         baseline_sla = df['meets_sla'].mean() * 100 if total_shipments else 0.0
 
         regional_stats = {}
-        for region, group in df.groupby('warehouse_region'):
+        for region, group in df.groupby('warehouse_region', observed=True):
             regional_stats[region] = {
                 'baseline_sla': group['meets_sla'].mean() * 100 if len(group) else 0.0,
                 'shipments': len(group)
@@ -795,7 +807,8 @@ class SupplyChainSimulator:
                 if self.shipments_df.empty:
                     raise ValueError("Shipment data is not available. Load data before running simulations.")
 
-                if supplier_id not in self.shipments_df['supplier_id'].unique():
+                supplier_shipments = self.shipments_df[self.shipments_df['supplier_id'].to_numpy() == supplier_id]
+                if supplier_shipments.empty:
                     raise ValueError(f"Supplier {supplier_id} not found in shipment data")
 
                 # Determine outage window
@@ -809,7 +822,6 @@ class SupplyChainSimulator:
                         outage_start = event_match.iloc[0]['start_date']
 
                 if outage_start is None:
-                    supplier_shipments = self.shipments_df[self.shipments_df['supplier_id'] == supplier_id]
                     outage_start = supplier_shipments.get('first_shipping_date').min()
                     if pd.isna(outage_start):
                         outage_start = datetime.now()
@@ -817,7 +829,6 @@ class SupplyChainSimulator:
                 outage_end = outage_start + timedelta(days=outage_days)
 
                 # Shipments impacted within outage window
-                supplier_shipments = self.shipments_df[self.shipments_df['supplier_id'] == supplier_id].copy()
                 shipment_dates = supplier_shipments.get('first_shipping_date')
                 if shipment_dates is not None:
                     impacted_mask = shipment_dates.isna() | (
@@ -965,7 +976,7 @@ class SupplyChainSimulator:
             lane_metrics = []
             if not impacted_df.empty:
                 lane_metrics = (
-                    impacted_df.groupby(['supplier_id', 'warehouse_id'])
+                    impacted_df.groupby(['supplier_id', 'warehouse_id'], observed=True)
                     .agg({
                         'quantity': 'sum',
                         'late_after_delay': 'sum',
@@ -1030,19 +1041,14 @@ class SupplyChainSimulator:
             if readings_df.empty:
                 raise ValueError("No cold chain readings match the provided criteria.")
 
-            def is_excursion(row):
-                flag = str(row.get('excursion_flag', '')).upper()
-                if flag == 'YES':
-                    return True
-                temp = row.get('temperature_c')
-                min_t = row.get('threshold_min_c')
-                max_t = row.get('threshold_max_c')
-                if pd.notna(temp) and (pd.notna(min_t) and temp < min_t or pd.notna(max_t) and temp > max_t):
-                    return True
-                return False
-
-            readings_df['is_excursion'] = readings_df.apply(is_excursion, axis=1)
-            excursion_df = readings_df[readings_df['is_excursion'] == True]
+            # Flagged readings, or readings outside their (known) thresholds
+            temps = readings_df['temperature_c']
+            readings_df['is_excursion'] = (
+                readings_df['excursion_flag'].astype(str).str.upper().eq('YES')
+                | temps.lt(readings_df['threshold_min_c'].fillna(-np.inf))
+                | temps.gt(readings_df['threshold_max_c'].fillna(np.inf))
+            )
+            excursion_df = readings_df[readings_df['is_excursion']]
 
             if excursion_df.empty:
                 raise ValueError("No excursions detected for the selected shipment(s).")
@@ -1125,7 +1131,7 @@ class SupplyChainSimulator:
 
         self._apply_lot_recall_impacts(lot_id, impacted_shipments)
 
-        shipments_info = self.shipments_df[self.shipments_df['shipment_id'].isin(impacted_shipments)].copy()
+        shipments_info = self.shipments_df[self.shipments_df['shipment_id'].isin(impacted_shipments)]
         warehouses_impacted = shipments_info['warehouse_id'].dropna().unique().tolist() if not shipments_info.empty else []
         customers_impacted = []
 
@@ -1205,25 +1211,34 @@ class SupplyChainSimulator:
         late_orders_without_recovery = int(scenario_df['late_after_delay'].sum())
         expedite_cost_total = float(scenario_df['expedite_cost_applied'].sum())
 
-        # Regional breakdown
+        # Regional breakdown (single vectorized aggregation pass)
+        regional_stats = (
+            scenario_df.assign(late_after_mitigation=~scenario_df['meets_sla_after_delay'])
+            .groupby('warehouse_region', observed=True)
+            .agg(
+                new_sla=('meets_sla_after_delay', 'mean'),
+                late_orders=('late_after_mitigation', 'sum'),
+                late_orders_without_recovery=('late_after_delay', 'sum'),
+                expedite_cost=('expedite_cost_applied', 'sum'),
+                shipments=('meets_sla_after_delay', 'size')
+            )
+        )
+
+        baseline_regional = self.baseline_metrics.get('regional', {})
         regional_impacts = []
-        for region, group in scenario_df.groupby('warehouse_region'):
-            baseline_region = self.baseline_metrics.get('regional', {}).get(region, {}).get('baseline_sla', baseline_sla)
-            new_region_sla = group['meets_sla_after_delay'].mean() * 100 if len(group) else 0.0
-            delta_region = new_region_sla - baseline_region
-            late_region = int((~group['meets_sla_after_delay']).sum())
-            late_region_without_recovery = int(group['late_after_delay'].sum())
-            expedite_region_cost = float(group['expedite_cost_applied'].sum())
+        for region, region_sla, late_region, late_region_without_recovery, expedite_region_cost, shipments in regional_stats.itertuples(name=None):
+            baseline_region = baseline_regional.get(region, {}).get('baseline_sla', baseline_sla)
+            new_region_sla = region_sla * 100
 
             regional_impacts.append({
                 'region': region,
                 'baseline_sla': baseline_region,
                 'new_sla': new_region_sla,
-                'delta_sla': delta_region,
-                'late_orders': late_region,
-                'late_orders_without_recovery': late_region_without_recovery,
-                'expedite_cost': expedite_region_cost,
-                'shipments': len(group)
+                'delta_sla': new_region_sla - baseline_region,
+                'late_orders': int(late_region),
+                'late_orders_without_recovery': int(late_region_without_recovery),
+                'expedite_cost': float(expedite_region_cost),
+                'shipments': int(shipments)
             })
 
         # Impacted shipments details (before expedite recovery)
@@ -1418,8 +1433,7 @@ def main():
             logger.info("Running test simulation...")
 
             # Get first supplier from graph
-            suppliers = [n for n, d in simulator.current_graph.nodes(data=True)
-                        if d.get('node_type') == 'supplier']
+            suppliers = simulator.graph_builder.get_nodes_by_type('supplier')
 
             if suppliers:
                 test_supplier = suppliers[0]
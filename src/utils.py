@@ -34,7 +34,11 @@ def load_config() -> Dict[str, Any]:
         'neo4j': {
             'uri': get_env_or_secret('NEO4J_URI', 'bolt://localhost:7687'),
             'user': get_env_or_secret('NEO4J_USER', 'neo4j'),
-            'password': get_env_or_secret('NEO4J_PASSWORD', 'password')
+            'password': get_env_or_secret('NEO4J_PASSWORD', 'password'),
+            # Rows per UNWIND write transaction for bulk loads
+            'batch_size': int(os.getenv('NEO4J_BATCH_SIZE', 10000)),
+            # Batches in flight at once for writes that can run concurrently
+            'write_concurrency': int(os.getenv('NEO4J_WRITE_CONCURRENCY', 4))
         },
 
         # Application Configuration
@@ -66,7 +70,9 @@ def load_config() -> Dict[str, Any]:
         # Cache Configuration
         'cache': {
             'enabled': os.getenv('ENABLE_CACHING', 'True').lower() == 'true',
-            'ttl_seconds': int(os.getenv('CACHE_TTL_SECONDS', 300))
+            'ttl_seconds': int(os.getenv('CACHE_TTL_SECONDS', 300)),
+            'dir': os.getenv('CACHE_DIR', '.cache'),
+            'disk_ttl_seconds': int(os.getenv('CACHE_DISK_TTL_SECONDS', 3600))
         },
 
         # Logging Configuration
@@ -2,6 +2,7 @@
 """Debug cold chain excursion detection."""
 
 import sys
+import numpy as np
 import pandas as pd
 from pathlib import Path
 
@@ -25,20 +26,12 @@ if csv_path.exists():
     print(df['excursion_flag'].value_counts())
     print()
 
-    # Test the is_excursion logic
-    def is_excursion(row):
-        flag = str(row.get('excursion_flag', '')).upper()
-        if flag == 'YES':
-            return True
-        temp = row.get('temperature_c')
-        min_t = row.get('threshold_min_c')
-        max_t = row.get('threshold_max_c')
-        if pd.notna(temp) and (pd.notna(min_t) and temp < min_t or pd.notna(max_t) and temp > max_t):
-            return True
-        return False
-
-    df['is_excursion'] = df.apply(is_excursion, axis=1)
-    excursion_df = df[df['is_excursion'] == True]
+    # Test the is_excursion logic, one column mask per condition
+    flag_yes = df['excursion_flag'].astype(str).str.upper().eq('YES')
+    below_min = df['temperature_c'].lt(df['threshold_min_c'].fillna(-np.inf))
+    above_max = df['temperature_c'].gt(df['threshold_max_c'].fillna(np.inf))
+    df['is_excursion'] = flag_yes | below_min | above_max
+    excursion_df = df[df['is_excursion']]
 
     print(f"=== Excursion Detection Results ===")
     print(f"Excursions detected: {len(excursion_df)}")